@@ -2,8 +2,10 @@
 # File ini mengatur partikel abu yang beterbangan untuk atmosfer suram
 
 import pygame
-import random
 import math
+from game_random import random_streams
+
+ash_random = random_streams.get('ash')  # Angka acak khusus abu
 
 class AshParticle:
     """Kelas untuk partikel abu individual"""
@@ -14,21 +16,21 @@ class AshParticle:
         self.screen_height = screen_height
         
         # Properti partikel abu
-        self.size = random.uniform(1, 4)  # Ukuran abu kecil
-        self.speed_x = random.uniform(-0.5, 0.5)  # Gerakan horizontal lambat
-        self.speed_y = random.uniform(0.2, 1.0)  # Jatuh ke bawah
-        self.alpha = random.randint(30, 120)  # Transparansi
-        self.life = random.uniform(3.0, 8.0)  # Durasi hidup dalam detik
+        self.size = ash_random.uniform(1, 4)  # Ukuran abu kecil
+        self.speed_x = ash_random.uniform(-0.5, 0.5)  # Gerakan horizontal lambat
+        self.speed_y = ash_random.uniform(0.2, 1.0)  # Jatuh ke bawah
+        self.alpha = ash_random.randint(30, 120)  # Transparansi
+        self.life = ash_random.uniform(3.0, 8.0)  # Durasi hidup dalam detik
         self.max_life = self.life
         
         # Warna abu gelap dengan variasi
-        gray_value = random.randint(40, 80)
+        gray_value = ash_random.randint(40, 80)
         self.color = (gray_value, gray_value, gray_value)
         
         # Efek bergoyang
-        self.sway_offset = random.uniform(0, math.pi * 2)
-        self.sway_amplitude = random.uniform(0.3, 0.8)
-        self.sway_frequency = random.uniform(0.02, 0.05)
+        self.sway_offset = ash_random.uniform(0, math.pi * 2)
+        self.sway_amplitude = ash_random.uniform(0.3, 0.8)
+        self.sway_frequency = ash_random.uniform(0.02, 0.05)
         
     def update(self, dt):
         """Update posisi dan status partikel abu"""
@@ -49,8 +51,8 @@ class AshParticle:
         # Reset posisi jika keluar layar
         if self.y > self.screen_height + 10:
             self.y = -10
-            self.x = random.uniform(0, self.screen_width)
-            self.life = random.uniform(3.0, 8.0)
+            self.x = ash_random.uniform(0, self.screen_width)
+            self.life = ash_random.uniform(3.0, 8.0)
             self.max_life = self.life
             
         if self.x < -10:
@@ -84,8 +86,8 @@ class AshEffect:
         
         # Inisialisasi partikel awal
         for _ in range(self.max_particles // 2):
-            x = random.uniform(0, screen_width)
-            y = random.uniform(0, screen_height)
+            x = ash_random.uniform(0, screen_width)
+            y = ash_random.uniform(0, screen_height)
             self.particles.append(AshParticle(x, y, screen_width, screen_height))
             
     def update(self, dt):
@@ -100,8 +102,8 @@ class AshEffect:
         self.spawn_timer += dt
         if self.spawn_timer >= self.spawn_interval and len(self.particles) < self.max_particles:
             # Spawn dari atas layar
-            x = random.uniform(0, self.screen_width)
-            y = random.uniform(-50, -10)
+            x = ash_random.uniform(0, self.screen_width)
+            y = ash_random.uniform(-50, -10)
             self.particles.append(AshParticle(x, y, self.screen_width, self.screen_height))
             self.spawn_timer = 0
             
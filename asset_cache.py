@@ -0,0 +1,106 @@
+# File untuk lemari gambar yang sudah "dipanggang" (baked asset cache)
+# File ini mencatat gambar yang sudah diperkecil sebelumnya oleh bake_assets.py,
+# sehingga game tidak perlu membuka gambar besar lalu langsung mengecilkannya
+
+import os, json, hashlib  # Library untuk file, catatan JSON, dan sidik jari file
+from constants import BAKE_FOLDER  # Folder tempat gambar yang sudah dipanggang
+
+MANIFEST_VERSION = 1  # Naikkan angka ini jika cara memanggang gambar berubah
+
+def file_sha1(path):
+    """Menghitung sidik jari (hash SHA-1) isi sebuah file
+
+    Jika isi file berubah sedikit saja, sidik jarinya juga berubah.
+    """
+    digest = hashlib.sha1()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(65536), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+class BakedAssetCache:
+    """Kelas BakedAssetCache - Buku catatan gambar yang sudah dipanggang
+
+    Seperti kue yang sudah dipanggang kemarin: kalau resepnya (file asli)
+    tidak berubah, kita tinggal ambil kuenya tanpa memanggang ulang!
+    Setiap catatan berisi sidik jari file asli, ukurannya, dan waktu diubah.
+    """
+    def __init__(self, cache_folder=BAKE_FOLDER):
+        """Membuat buku catatan untuk folder cache tertentu"""
+        self.cache_folder = cache_folder  # Folder tempat gambar yang sudah dipanggang
+        self.manifest_path = os.path.join(cache_folder, 'manifest.json')  # File catatan
+        self.entries = None  # Catatan gambar (dibaca saat pertama kali dibutuhkan)
+
+    def load_manifest(self):
+        """Membaca file catatan dari disk (jika ada dan versinya cocok)"""
+        self.entries = {}
+        try:
+            with open(self.manifest_path) as file:
+                manifest = json.load(file)
+            if manifest.get('version') == MANIFEST_VERSION:
+                self.entries = manifest.get('entries', {})
+        except (OSError, ValueError):
+            pass  # Belum pernah dipanggang atau catatan rusak, pakai gambar asli saja
+        return self.entries
+
+    def save_manifest(self):
+        """Menyimpan file catatan ke disk"""
+        os.makedirs(self.cache_folder, exist_ok=True)
+        with open(self.manifest_path, 'w') as file:
+            json.dump({'version': MANIFEST_VERSION, 'entries': self.entries}, file, indent=1, sort_keys=True)
+
+    def entry_key(self, source_path, mode, size, alpha):
+        """Membuat nama catatan, contoh: 'assets/boss/Idle/a.png|fit|150x150'
+
+        mode 'fit' = diperkecil tanpa gepeng, mode 'scale' = direntangkan ke ukuran tepat.
+        """
+        target = f"{mode}|{size[0]:g}x{size[1]:g}"
+        if not alpha:
+            target += '|opaque'  # Gambar tanpa transparansi
+        return os.path.normpath(source_path) + '|' + target
+
+    def baked_path(self, source_path, mode, size, alpha):
+        """Alamat file gambar hasil panggangan di dalam folder cache"""
+        name, _ = os.path.splitext(os.path.normpath(source_path).lstrip(os.sep))
+        suffix = f"{mode}-{size[0]:g}x{size[1]:g}" + ('' if alpha else '-opaque')
+        return os.path.join(self.cache_folder, 'baked', f"{name}@{suffix}.png")
+
+    def resolve(self, source_path, mode, size, alpha=True):
+        """Mencari gambar hasil panggangan yang masih segar
+
+        Segar artinya file asli belum berubah sejak dipanggang:
+        ukuran dan waktu ubah sama, atau sidik jarinya masih sama.
+        Return alamat gambar panggangan, atau None jika harus memakai file asli.
+        """
+        if self.entries is None:
+            self.load_manifest()
+        entry = self.entries.get(self.entry_key(source_path, mode, size, alpha))
+        if entry is None or not os.path.exists(entry['output']):
+            return None
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return None
+        # Cek cepat: ukuran dan waktu ubah file asli masih sama
+        if stat.st_size == entry['bytes'] and stat.st_mtime_ns == entry['mtime_ns']:
+            return entry['output']
+        # Waktu ubah berbeda (misalnya setelah git checkout), cek isi filenya
+        if stat.st_size == entry['bytes'] and file_sha1(source_path) == entry['sha1']:
+            return entry['output']
+        return None
+
+    def record(self, source_path, mode, size, alpha, output_path):
+        """Mencatat gambar yang baru saja dipanggang"""
+        if self.entries is None:
+            self.load_manifest()
+        stat = os.stat(source_path)
+        self.entries[self.entry_key(source_path, mode, size, alpha)] = {
+            'source': os.path.normpath(source_path),  # File gambar asli
+            'output': output_path,                    # File hasil panggangan
+            'sha1': file_sha1(source_path),           # Sidik jari isi file asli
+            'bytes': stat.st_size,                    # Ukuran file asli (byte)
+            'mtime_ns': stat.st_mtime_ns,             # Waktu terakhir file asli diubah
+        }
+
+# Satu buku catatan bersama untuk seluruh game
+baked_assets = BakedAssetCache()
@@ -0,0 +1,73 @@
+# File untuk pemuat gambar paralel (parallel asset loader)
+# File ini membuka dan mengecilkan banyak gambar PNG sekaligus memakai beberapa
+# pekerja (thread), supaya layar loading selesai lebih cepat di komputer ber-inti banyak
+
+import os, pygame  # Library untuk membuat game
+from concurrent.futures import ThreadPoolExecutor, as_completed  # Kumpulan pekerja paralel
+from helper import resize_with_aspect_ratio  # Fungsi untuk mengubah ukuran gambar
+
+def default_worker_count():
+    """Jumlah pekerja = jumlah inti (core) prosesor komputer"""
+    return os.cpu_count() or 1
+
+def decode_image(path, max_size):
+    """Dikerjakan oleh pekerja: membuka file PNG lalu mengecilkannya
+
+    pygame melepas kunci Python (GIL) saat membuka PNG dan saat smoothscale,
+    jadi beberapa pekerja benar-benar bisa bekerja bersamaan.
+    Return gambar (belum di-convert), atau None jika file rusak.
+    """
+    try:
+        image = pygame.image.load(path)
+    except pygame.error as e:
+        print(f"Error loading sprite {path}: {e}")
+        return None
+    try:
+        return resize_with_aspect_ratio(image, max_size[0], max_size[1])
+    except ValueError:
+        return image  # Format gambar tidak bisa di-smoothscale, diperkecil nanti setelah convert
+
+def finish_image(image, max_size):
+    """Dikerjakan di thread utama: mengubah gambar ke format layar
+
+    convert_alpha() butuh layar game, jadi tidak boleh dikerjakan pekerja.
+    Gambar sudah kecil, jadi langkah ini cepat.
+    """
+    return resize_with_aspect_ratio(image.convert_alpha(), max_size[0], max_size[1])
+
+def load_images_parallel(jobs, on_progress=None, workers=None):
+    """Membuka banyak gambar sekaligus dengan beberapa pekerja
+
+    Parameter:
+    - jobs: Daftar (alamat file, ukuran maksimal)
+    - on_progress: Fungsi on_progress(selesai, total) yang dipanggil di thread utama
+    - workers: Jumlah pekerja (default: jumlah inti prosesor)
+
+    Membuka dan mengecilkan gambar dikerjakan pekerja, tetapi convert_alpha()
+    selalu di thread utama karena butuh format layar.
+    Return daftar gambar dengan urutan sama seperti jobs (None jika gagal).
+    """
+    workers = workers or default_worker_count()
+    images = [None] * len(jobs)
+    done = 0  # Jumlah gambar yang sudah selesai
+
+    def finish(index, image):
+        nonlocal done
+        done += 1
+        if image is not None:
+            images[index] = finish_image(image, jobs[index][1])
+        if on_progress:
+            on_progress(done, len(jobs))
+
+    if workers <= 1:
+        # Hanya satu inti: kerjakan satu per satu tanpa repot membuat pekerja
+        for index, (path, max_size) in enumerate(jobs):
+            finish(index, decode_image(path, max_size))
+        return images
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(decode_image, path, max_size): index
+                   for index, (path, max_size) in enumerate(jobs)}
+        for future in as_completed(futures):
+            finish(futures[future], future.result())
+    return images
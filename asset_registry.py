@@ -0,0 +1,292 @@
+# File untuk gudang gambar bersama (asset registry)
+# File ini menyimpan gambar karakter dan latar belakang satu kali saja,
+# lalu dipakai bersama oleh semua zombie, ninja, boss, dan objek
+
+import os, pygame  # Library untuk membuat game
+from helper import resize_with_aspect_ratio  # Fungsi untuk mengubah ukuran gambar
+from asset_cache import baked_assets  # Catatan gambar yang sudah dipanggang oleh bake_assets.py
+from asset_loader import load_images_parallel  # Pemuat gambar paralel
+from atlas import TextureAtlas  # Lembar gambar gabungan
+
+class AssetRegistry:
+    """Kelas AssetRegistry - Gudang gambar bersama untuk seluruh game
+
+    Bayangkan perpustakaan: 140 zombie tidak perlu membeli buku yang sama
+    140 kali, cukup meminjam satu buku dari perpustakaan!
+    Setiap gambar disimpan dengan kunci (folder, gerakan, ukuran) dan
+    dihitung berapa banyak yang sedang meminjamnya (reference counting).
+    """
+    def __init__(self):
+        """Membuat gudang gambar kosong"""
+        self.entries = {}          # Kunci -> gambar (daftar frame atau satu gambar)
+        self.ref_counts = {}       # Kunci -> jumlah pemakai yang sedang meminjam
+        self.folder_listings = {}  # Folder -> daftar nama file (agar os.listdir sekali saja)
+        self.packed_keys = set()   # Kunci frame yang sudah ditempel ke atlas
+
+    def list_folder(self, folder):
+        """Mengambil daftar file dalam folder (disimpan agar tidak dibaca ulang)"""
+        if folder not in self.folder_listings:
+            self.folder_listings[folder] = sorted(os.listdir(folder))
+        return self.folder_listings[folder]
+
+    def acquire(self, key, loader):
+        """Meminjam gambar dengan kunci tertentu
+
+        Jika gambar belum ada di gudang, loader() dipanggil untuk memuatnya.
+        Setiap peminjaman menambah hitungan pemakai.
+        """
+        if key not in self.entries:
+            self.entries[key] = loader()
+            self.ref_counts[key] = 0
+        self.ref_counts[key] += 1
+        return self.entries[key]
+
+    def release(self, key):
+        """Mengembalikan pinjaman gambar (gambar tetap disimpan sampai di-evict)"""
+        if self.ref_counts.get(key, 0) > 0:
+            self.ref_counts[key] -= 1
+
+    def release_all(self, keys):
+        """Mengembalikan banyak pinjaman sekaligus"""
+        for key in keys:
+            self.release(key)
+
+    def get_ref_count(self, key):
+        """Mengambil jumlah pemakai sebuah gambar"""
+        return self.ref_counts.get(key, 0)
+
+    def evict(self, key):
+        """Membuang gambar dari gudang jika sudah tidak ada yang memakai
+
+        Return True jika gambar benar-benar dibuang.
+        """
+        if key in self.entries and self.ref_counts.get(key, 0) == 0:
+            del self.entries[key]
+            del self.ref_counts[key]
+            self.packed_keys.discard(key)
+            return True
+        return False
+
+    def evict_all(self, keys):
+        """Membuang beberapa gambar sekaligus (yang masih dipakai tetap disimpan)
+
+        Return jumlah gambar yang dibuang.
+        """
+        return sum(1 for key in set(keys) if self.evict(key))
+
+    def evict_unused(self):
+        """Membuang semua gambar yang tidak dipakai lagi
+
+        Return jumlah gambar yang dibuang.
+        """
+        unused_keys = [key for key, count in self.ref_counts.items() if count == 0]
+        for key in unused_keys:
+            self.evict(key)
+        return len(unused_keys)
+
+    def clear(self):
+        """Mengosongkan seluruh gudang (misalnya saat game ditutup)"""
+        self.entries = {}
+        self.ref_counts = {}
+        self.folder_listings = {}
+        self.packed_keys = set()
+
+    def acquire_frames(self, folder, action, max_size, list_files):
+        """Meminjam daftar frame animasi untuk satu gerakan
+
+        Setiap frame disimpan sebagai pasangan (menghadap kanan, menghadap kiri)
+        yang dibalik sekali saja saat dimuat. Jadi frame[facing_left] langsung
+        memberi gambar yang benar tanpa membalik gambar setiap frame.
+
+        Parameter:
+        - folder: Folder tempat gambar
+        - action: Nama gerakan (misalnya 'Walk')
+        - max_size: Ukuran maksimal (lebar, tinggi) setelah diperkecil
+        - list_files: Fungsi yang mengembalikan daftar nama file frame (sudah urut).
+          Hanya dipanggil jika frame belum ada di gudang.
+
+        Return (kunci, daftar frame). Kunci dipakai untuk release() nanti.
+        """
+        key = frame_key(folder, action, max_size)
+        frames = self.acquire(key, lambda: self._load_frames(folder, list_files(), max_size))
+        return key, frames
+
+    def acquire_scaled_frames(self, folder, action, max_size, scale, list_files):
+        """Meminjam versi frame yang diperbesar/diperkecil dengan skala tertentu
+
+        Dipakai misalnya untuk gerakan serangan ninja yang digambar 1.2x lebih besar.
+        Hasil skala dihitung sekali saja, bukan setiap frame.
+
+        Return (kunci, daftar pasangan frame (kanan, kiri)).
+        """
+        key = ('scaled_frames', folder, action, max_size, scale)
+        base_key = frame_key(folder, action, max_size)
+
+        def load_scaled_frames():
+            # Pakai frame dasar dari gudang jika sudah ada, kalau belum muat dari file
+            base_frames = self.entries.get(base_key)
+            if base_frames is None:
+                base_frames = self._load_frames(folder, list_files(), max_size)
+            scaled_frames = []
+            for sprite, _ in base_frames:
+                new_size = (sprite.get_width() * scale, sprite.get_height() * scale)
+                scaled_frames.append(make_flipped_pair(pygame.transform.smoothscale(sprite, new_size)))
+            return scaled_frames
+
+        frames = self.acquire(key, load_scaled_frames)
+        return key, frames
+
+    def acquire_image(self, path, max_size=None, alpha=True):
+        """Meminjam satu gambar, bisa sekalian diperkecil
+
+        Return (kunci, gambar). Kunci dipakai untuk release() nanti.
+        """
+        key = ('image', path, max_size, alpha)
+        image = self.acquire(key, lambda: self._load_image(path, max_size, alpha))
+        return key, image
+
+    def acquire_image_pair(self, path, max_size=None):
+        """Meminjam satu gambar beserta versi terbaliknya (kanan, kiri)
+
+        Return (kunci, (gambar_kanan, gambar_kiri)).
+        """
+        key = ('image_pair', path, max_size)
+        pair = self.acquire(key, lambda: make_flipped_pair(self._load_image(path, max_size, True)))
+        return key, pair
+
+    def acquire_scaled(self, path, size, alpha=True):
+        """Meminjam satu gambar yang direntangkan ke ukuran tepat (misalnya latar layar penuh)"""
+        key = ('scaled', path, size, alpha)
+        image = self.acquire(key, lambda: self._load_scaled(path, size, alpha))
+        return key, image
+
+    def _load_image(self, path, max_size, alpha):
+        """Memuat satu gambar dari file
+
+        Jika ada versi yang sudah dipanggang dan masih segar, versi kecil itu
+        yang dibuka (mengubah ukurannya lagi tidak berpengaruh karena sudah pas).
+        """
+        baked_path = baked_assets.resolve(path, 'fit', max_size, alpha) if max_size is not None else None
+        image = pygame.image.load(baked_path or path)
+        image = image.convert_alpha() if alpha else image.convert()
+        if max_size is not None:
+            image = resize_with_aspect_ratio(image, max_size[0], max_size[1])
+        return image
+
+    def _load_scaled(self, path, size, alpha):
+        """Memuat satu gambar lalu merentangkannya ke ukuran tepat"""
+        baked_path = baked_assets.resolve(path, 'scale', size, alpha)
+        image = pygame.image.load(baked_path or path)
+        image = image.convert_alpha() if alpha else image.convert()
+        if image.get_size() != size:
+            image = pygame.transform.scale(image, size)
+        return image
+
+    def preload_frames(self, frame_requests, on_progress=None, workers=None):
+        """Memuat banyak gerakan sekaligus secara paralel sebelum dipinjam
+
+        Semua file dari semua gerakan dikerjakan bersamaan oleh beberapa pekerja,
+        jadi waktu loading ikut turun jika prosesor punya banyak inti.
+        Gambar disimpan di gudang tanpa dipinjam (jumlah pemakai 0), lalu
+        acquire_frames() nanti tinggal mengambilnya.
+
+        Parameter:
+        - frame_requests: Daftar (folder, gerakan, ukuran maksimal, fungsi daftar file)
+        - on_progress: Fungsi on_progress(selesai, total) untuk layar loading
+        - workers: Jumlah pekerja (default: jumlah inti prosesor)
+        """
+        batches = self.missing_frame_batches(frame_requests)
+
+        # Gabungkan semua file menjadi satu daftar pekerjaan
+        jobs = []
+        for _, frame_jobs in batches:
+            jobs.extend(frame_jobs)
+        images = load_images_parallel(jobs, on_progress, workers)
+
+        # Bagikan hasilnya kembali ke setiap gerakan
+        start = 0
+        for key, frame_jobs in batches:
+            self.store_frames(key, images[start:start + len(frame_jobs)])
+            start += len(frame_jobs)
+        return len(jobs)
+
+    def missing_frame_batches(self, frame_requests):
+        """Mencari gerakan yang belum ada di gudang
+
+        Return daftar (kunci, daftar pekerjaan (alamat file, ukuran)) untuk setiap gerakan.
+        Harus dipanggil di thread utama; pekerjaannya boleh dikerjakan pekerja lain.
+        """
+        batches = []
+        seen_keys = set()
+        for folder, action, max_size, list_files in frame_requests:
+            key = frame_key(folder, action, max_size)
+            if key in self.entries or key in seen_keys:
+                continue
+            seen_keys.add(key)
+            batches.append((key, self._frame_jobs(folder, list_files(), max_size)))
+        return batches
+
+    def store_frames(self, key, images):
+        """Menyimpan frame yang sudah dimuat di luar gudang (tanpa meminjamnya)
+
+        images adalah gambar yang sudah di-convert; gambar None (gagal dimuat) dilewati.
+        """
+        if key not in self.entries:
+            self.entries[key] = [make_flipped_pair(image) for image in images if image is not None]
+            self.ref_counts[key] = 0
+
+    def pack_atlas(self, frame_requests):
+        """Menempel semua frame beberapa gerakan (satu karakter) ke lembar atlas
+
+        Frame di gudang diganti di tempat dengan subsurface dari atlas, jadi
+        semua zombie/ninja/boss yang sudah meminjam langsung ikut memakai atlas.
+        Gerakan yang belum dimuat atau sudah ditempel dilewati.
+        Return TextureAtlas yang dibuat, atau None jika tidak ada yang ditempel.
+        """
+        keys = []
+        for folder, action, max_size, _ in frame_requests:
+            key = frame_key(folder, action, max_size)
+            if key in self.entries and key not in self.packed_keys and key not in keys:
+                keys.append(key)
+        surfaces = [surface for key in keys for pair in self.entries[key] for surface in pair]
+        if not surfaces:
+            return None
+
+        atlas = TextureAtlas()
+        subsurfaces = iter(atlas.pack(surfaces))
+        for key in keys:
+            frames = self.entries[key]
+            for index in range(len(frames)):
+                frames[index] = (next(subsurfaces), next(subsurfaces))  # Pasangan (kanan, kiri)
+            self.packed_keys.add(key)
+        return atlas
+
+    def _frame_jobs(self, folder, filenames, max_size):
+        """Membuat daftar pekerjaan (alamat file, ukuran) untuk pemuat paralel"""
+        jobs = []
+        for filename in filenames:
+            path = os.path.join(folder, filename)  # Buat alamat lengkap file
+            # Pakai gambar yang sudah dipanggang (sudah kecil) jika masih segar
+            baked_path = baked_assets.resolve(path, 'fit', max_size)
+            jobs.append((baked_path or path, max_size))
+        return jobs
+
+    def _load_frames(self, folder, filenames, max_size):
+        """Memuat semua frame animasi dari folder (dibuka paralel oleh beberapa pekerja)"""
+        images = load_images_parallel(self._frame_jobs(folder, filenames, max_size))
+        return [make_flipped_pair(image) for image in images if image is not None]
+
+def frame_key(folder, action, max_size):
+    """Kunci gudang untuk daftar frame satu gerakan"""
+    return ('frames', folder, action, max_size)
+
+def make_flipped_pair(sprite):
+    """Membuat pasangan (menghadap kanan, menghadap kiri) dari satu gambar
+
+    Indeks 0 = kanan, indeks 1 = kiri, sehingga pair[facing_left] langsung
+    memilih gambar yang benar (False = 0, True = 1).
+    """
+    return (sprite, pygame.transform.flip(sprite, True, False))
+
+# Satu gudang bersama untuk seluruh game
+registry = AssetRegistry()
@@ -0,0 +1,122 @@
+# File untuk lembar gambar gabungan (texture atlas)
+# File ini menempelkan banyak frame animasi kecil ke satu atau beberapa gambar besar,
+# seperti menempel banyak stiker di satu lembar album
+
+import os, json, pygame  # Library untuk file, catatan JSON, dan game
+
+class TextureAtlas:
+    """Kelas TextureAtlas - Lembar besar berisi banyak frame animasi
+
+    Daripada ratusan gambar kecil yang tersebar di memori, semua frame satu
+    karakter ditempel berdampingan di beberapa lembar besar (page).
+    Setiap frame lalu dipakai sebagai subsurface: "jendela" ke bagian lembar itu,
+    tanpa menyalin pixel. Blit sebuah subsurface sama saja dengan blit lembar
+    besar memakai area (kotak sumber) frame tersebut.
+
+    Cara menempel memakai rak (shelf packing): frame diurutkan dari yang paling
+    tinggi, lalu diletakkan berjajar ke kanan; jika baris penuh, mulai rak baru.
+    """
+    def __init__(self, page_width=1024, page_height=1024, padding=1):
+        """Membuat atlas kosong
+
+        Parameter:
+        - page_width, page_height: Ukuran maksimal satu lembar
+        - padding: Jarak kosong antar frame (pixel)
+        """
+        self.page_width = page_width    # Lebar maksimal satu lembar
+        self.page_height = page_height  # Tinggi maksimal satu lembar
+        self.padding = padding          # Jarak antar frame agar pixel tidak bercampur
+        self.pages = []                 # Lembar-lembar gambar besar
+        self.rects = []                 # Untuk setiap frame: (nomor lembar, pygame.Rect)
+
+    def plan(self, sizes):
+        """Menghitung letak setiap frame di lembar (tanpa menggambar)
+
+        Return (daftar (nomor lembar, Rect) sesuai urutan sizes, daftar ukuran lembar).
+        """
+        order = sorted(range(len(sizes)), key=lambda index: sizes[index][1], reverse=True)
+        placements = [None] * len(sizes)
+        page_sizes = []
+        page = -1
+        x = y = shelf_height = used_width = 0
+        for index in order:
+            width, height = sizes[index]
+            if width > self.page_width or height > self.page_height:
+                raise ValueError(f"Frame {width}x{height} lebih besar dari lembar atlas")
+            # Baris penuh: pindah ke rak berikutnya
+            if page >= 0 and x + width > self.page_width:
+                x = 0
+                y += shelf_height + self.padding
+                shelf_height = 0
+            # Lembar penuh (atau belum ada lembar): mulai lembar baru
+            if page < 0 or y + height > self.page_height:
+                if page >= 0:
+                    page_sizes[page] = (used_width, y - self.padding)
+                page += 1
+                page_sizes.append((0, 0))
+                x = y = shelf_height = used_width = 0
+            placements[index] = (page, pygame.Rect(x, y, width, height))
+            x += width + self.padding
+            used_width = max(used_width, x - self.padding)
+            shelf_height = max(shelf_height, height)
+        if page >= 0:
+            page_sizes[page] = (used_width, y + shelf_height)
+        return placements, page_sizes
+
+    def pack(self, surfaces):
+        """Menempel semua gambar ke lembar atlas
+
+        Return daftar subsurface dengan urutan sama seperti surfaces.
+        """
+        placements, page_sizes = self.plan([surface.get_size() for surface in surfaces])
+        self.pages = [pygame.Surface(size, pygame.SRCALPHA).convert_alpha() for size in page_sizes]
+        self.rects = placements
+        for surface, (page, rect) in zip(surfaces, placements):
+            # BLEND_RGBA_MAX di atas lembar kosong (semua 0) = menyalin pixel apa adanya
+            self.pages[page].blit(surface, rect.topleft, special_flags=pygame.BLEND_RGBA_MAX)
+        return self.subsurfaces()
+
+    def subsurfaces(self):
+        """Membuat "jendela" (subsurface) untuk setiap frame di lembar"""
+        return [self.pages[page].subsurface(rect) for page, rect in self.rects]
+
+    def get_source(self, index):
+        """Mengambil (lembar, kotak sumber) frame ke-index untuk screen.blit(lembar, posisi, area=kotak)"""
+        page, rect = self.rects[index]
+        return self.pages[page], rect
+
+    def get_bytes(self):
+        """Jumlah memori (byte) yang dipakai semua lembar"""
+        return sum(page.get_width() * page.get_height() * page.get_bytesize() for page in self.pages)
+
+    def save(self, path):
+        """Menyimpan atlas ke disk: satu PNG per lembar dan satu file indeks JSON
+
+        Contoh: save('cache/zombie_male') menulis zombie_male_0.png dan zombie_male.json
+        """
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        page_files = []
+        for number, page in enumerate(self.pages):
+            page_file = f"{path}_{number}.png"
+            pygame.image.save(page, page_file)
+            page_files.append(os.path.basename(page_file))
+        index = {
+            'pages': page_files,
+            'frames': [[page, rect.x, rect.y, rect.width, rect.height] for page, rect in self.rects],
+        }
+        with open(path + '.json', 'w') as file:
+            json.dump(index, file)
+
+    @classmethod
+    def load(cls, path):
+        """Membuka atlas yang disimpan oleh save()
+
+        Return (atlas, daftar subsurface frame).
+        """
+        with open(path + '.json') as file:
+            index = json.load(file)
+        atlas = cls()
+        folder = os.path.dirname(path)
+        atlas.pages = [pygame.image.load(os.path.join(folder, page_file)).convert_alpha() for page_file in index['pages']]
+        atlas.rects = [(page, pygame.Rect(x, y, width, height)) for page, x, y, width, height in index['frames']]
+        return atlas, atlas.subsurfaces()
@@ -0,0 +1,95 @@
+# File untuk "memanggang" gambar game sebelum dimainkan (bake assets)
+# Gambar asli boss berukuran 900x900 pixel, padahal di game hanya dipakai 150x150.
+# Perintah ini mengecilkan semua gambar sekali saja dan menyimpannya di folder cache,
+# sehingga game tidak perlu membuka gambar besar setiap kali dijalankan.
+#
+# Cara memakai: python3 bake_assets.py          (panggang gambar yang berubah saja)
+#               python3 bake_assets.py --force  (panggang ulang semua gambar)
+
+import os, sys  # Library untuk file dan perintah
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')  # Tidak perlu membuka jendela game
+import pygame  # Library untuk membuat game
+from asset_cache import baked_assets  # Catatan gambar yang sudah dipanggang
+from constants import CHARACTER_FOLDER, ENEMIES_FOLDER, OBJECTS_FOLDER, BOSS_FOLDER, SCREEN_WIDTH, SCREEN_HEIGHT
+from helper import resize_with_aspect_ratio  # Fungsi untuk mengubah ukuran gambar
+from ninja import Ninja  # Aturan ukuran gambar ninja
+from zombie import Zombie  # Aturan ukuran gambar zombie
+from boss import Boss  # Aturan ukuran gambar boss
+
+GENDERS = ['male', 'female']  # Jenis ninja dan zombie yang ada di folder gambar
+
+def collect_bake_jobs():
+    """Mengumpulkan daftar gambar yang perlu dipanggang
+
+    Ukuran setiap gambar diambil dari aturan di kelas Ninja, Zombie, dan Boss,
+    jadi hasil panggangan selalu sama dengan ukuran yang dipakai di game.
+    Return daftar (file asli, mode, ukuran, transparan?).
+    """
+    frame_requests = []
+    for gender in GENDERS:
+        frame_requests += Ninja.frame_requests(os.path.join(CHARACTER_FOLDER, gender))
+        frame_requests += Zombie.frame_requests(os.path.join(ENEMIES_FOLDER, gender))
+    frame_requests += Boss.frame_requests(BOSS_FOLDER)
+
+    jobs = []
+    for folder, action, max_size, list_files in frame_requests:
+        for filename in list_files():
+            jobs.append((os.path.join(folder, filename), 'fit', max_size, True))
+
+    # Gambar kunai ninja
+    for gender in GENDERS:
+        jobs.append((os.path.join(CHARACTER_FOLDER, gender, 'Kunai.png'), 'fit', Ninja.KUNAI_SIZE, True))
+
+    # Latar belakang yang direntangkan seukuran layar
+    jobs.append((os.path.join(OBJECTS_FOLDER, 'Background.png'), 'scale', (SCREEN_WIDTH, SCREEN_HEIGHT), False))
+    return jobs
+
+def bake_image(source_path, mode, size, alpha):
+    """Membuka gambar asli dan mengubah ukurannya persis seperti di dalam game"""
+    image = pygame.image.load(source_path)
+    image = image.convert_alpha() if alpha else image.convert()
+    if mode == 'fit':
+        return resize_with_aspect_ratio(image, size[0], size[1])
+    return pygame.transform.scale(image, size)
+
+def bake(force=False):
+    """Memanggang semua gambar yang belum ada atau sudah berubah
+
+    Return (jumlah dipanggang, jumlah dilewati).
+    """
+    pygame.init()
+    pygame.display.set_mode((1, 1))  # convert_alpha() butuh layar, walaupun hanya layar palsu
+
+    baked_assets.load_manifest()
+    old_entries = baked_assets.entries
+    baked_assets.entries = {}  # Catatan baru hanya berisi gambar yang masih dipakai game
+    baked_count = 0
+    skipped_count = 0
+    for source_path, mode, size, alpha in collect_bake_jobs():
+        key = baked_assets.entry_key(source_path, mode, size, alpha)
+        output_path = baked_assets.baked_path(source_path, mode, size, alpha)
+        entry = old_entries.get(key)
+        if not force and entry is not None:
+            # Cek apakah panggangan lama masih segar
+            baked_assets.entries[key] = entry
+            if baked_assets.resolve(source_path, mode, size, alpha):
+                skipped_count += 1
+                continue
+        try:
+            image = bake_image(source_path, mode, size, alpha)
+        except pygame.error as e:
+            print(f"Error baking {source_path}: {e}")
+            baked_assets.entries.pop(key, None)
+            continue
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        pygame.image.save(image, output_path)
+        baked_assets.record(source_path, mode, size, alpha, output_path)
+        baked_count += 1
+
+    baked_assets.save_manifest()
+    pygame.quit()
+    return baked_count, skipped_count
+
+if __name__ == '__main__':
+    baked_count, skipped_count = bake(force='--force' in sys.argv)
+    print(f"Baked {baked_count} images, {skipped_count} already fresh -> {baked_assets.cache_folder}")
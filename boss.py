@@ -1,17 +1,46 @@
 # File untuk karakter boss (musuh utama ninja)
 # File ini mengatur bagaimana boss bergerak, menyerang, dan berinteraksi
 
-import os, re, math, random, pygame  # Library untuk membuat game
-from helper import resize_with_aspect_ratio  # Fungsi untuk mengubah ukuran gambar
+import os, re, math, pygame  # Library untuk membuat game
+from asset_registry import registry  # Gudang gambar bersama
+import game_clock  # Waktu simulasi (ikut langkah logika game)
+from game_clock import lerp  # Menggambar di antara dua langkah simulasi
+from game_random import random_streams  # Aliran angka acak per bagian game
 from constants import MAX_WIDTH, MAX_HEIGHT  # Ukuran layar game
 from boss_projectile import BossProjectile  # Import class projectile boss
 
+boss_random = random_streams.get('boss')  # Angka acak untuk keputusan boss
+
 class Boss:
     """Kelas Boss - Cetakan untuk membuat karakter boss
 
     Boss adalah musuh utama ninja yang akan bertarung di scene akhir.
     Boss memiliki health bar, berbagai serangan.
     """
+    # Daftar semua gerakan boss (nama gerakan = nama folder gambar)
+    ACTIONS = [
+        'Idle',              # Gambar saat boss diam
+        'Idle Blinking',     # Gambar saat boss berkedip
+        'Walking',           # Gambar saat boss berjalan
+        'Running',           # Gambar saat boss berlari
+        'Slashing',          # Gambar saat boss menyerang dengan pedang
+        'Kicking',           # Gambar saat boss menendang
+        'Throwing',          # Gambar saat boss melempar
+        'Run Slashing',      # Gambar saat boss berlari sambil menyerang
+        'Run Throwing',      # Gambar saat boss berlari sambil melempar
+        'Slashing in The Air', # Gambar saat boss menyerang di udara
+        'Throwing in The Air', # Gambar saat boss melempar di udara
+        'Jump Start',        # Gambar saat boss mulai melompat
+        'Jump Loop',         # Gambar saat boss di udara
+        'Sliding',           # Gambar saat boss meluncur
+        'Falling Down',      # Gambar saat boss jatuh
+        'Hurt',              # Gambar saat boss terkena serangan
+        'Dying',             # Gambar saat boss mati
+    ]
+
+    # Pola serangan boss
+    ATTACK_PATTERNS = ['Slashing', 'Kicking', 'Throwing', 'Run Slashing']
+
     def __init__(self, sprite_folder, screen, boss_ground, boss_speed, init_pos):
         """Membuat boss baru
 
@@ -23,38 +52,25 @@ class Boss:
         - init_pos: Posisi awal boss
         """
         # Kamus untuk menyimpan semua gerakan boss
-        self.actions = {
-            'Idle': [],              # Gambar saat boss diam
-            'Idle Blinking': [],     # Gambar saat boss berkedip
-            'Walking': [],           # Gambar saat boss berjalan
-            'Running': [],           # Gambar saat boss berlari
-            'Slashing': [],          # Gambar saat boss menyerang dengan pedang
-            'Kicking': [],           # Gambar saat boss menendang
-            'Throwing': [],          # Gambar saat boss melempar
-            'Run Slashing': [],      # Gambar saat boss berlari sambil menyerang
-            'Run Throwing': [],      # Gambar saat boss berlari sambil melempar
-            'Slashing in The Air': [], # Gambar saat boss menyerang di udara
-            'Throwing in The Air': [], # Gambar saat boss melempar di udara
-            'Jump Start': [],        # Gambar saat boss mulai melompat
-            'Jump Loop': [],         # Gambar saat boss di udara
-            'Sliding': [],           # Gambar saat boss meluncur
-            'Falling Down': [],      # Gambar saat boss jatuh
-            'Hurt': [],              # Gambar saat boss terkena serangan
-            'Dying': [],             # Gambar saat boss mati
-        }
+        self.actions = {action: [] for action in Boss.ACTIONS}
 
         self.boss_speed = boss_speed  # Seberapa cepat boss bergerak
         self.screen = screen  # Layar tempat boss muncul
         self.current_action = 'Idle'  # Gerakan yang sedang dilakukan (mulai dengan Idle)
         self.current_frame = 0  # Frame animasi yang sedang ditampilkan
         self.boss_ground = boss_ground  # Tinggi tanah tempat boss berdiri
-        self.load_sprites(sprite_folder)  # Muat semua gambar boss
+        self.sprite_keys = []  # Kunci gambar yang dipinjam dari gudang bersama
+        self.action_requests = {}  # Gerakan yang belum dimuat -> cara memuatnya
+        self.load_sprites(sprite_folder)  # Muat gambar boss yang sering dipakai
 
         # Posisi boss di layar (x = kiri-kanan, y = atas-bawah)
         self.init_pos = init_pos  # Posisi awal boss
         self.relative_x = self.init_pos  # Posisi relatif boss
         self.x = self.init_pos + self.relative_x  # Posisi X boss di layar
         self.y = self.boss_ground  # Posisi Y boss (tinggi tanah)
+        self.prev_x = self.x  # Posisi X di langkah simulasi sebelumnya (untuk menggambar halus)
+        self.rect_cache_key = None  # Gerakan, frame, arah, dan posisi saat kotak tabrakan dihitung
+        self.rect_cache = None  # Kotak tabrakan yang terakhir dihitung
 
         # Arah gerakan boss
         self.facing_left = True  # Boss menghadap kiri (True) atau kanan (False)
@@ -63,7 +79,7 @@ class Boss:
 
         # Pengaturan animasi boss
         self.frame_update_time = 0.05  # Seberapa cepat animasi berubah (0.05 detik untuk gerakan lebih smooth)
-        self.last_frame_update = pygame.time.get_ticks()  # Kapan terakhir animasi berubah
+        self.last_frame_update = game_clock.get_ticks()  # Kapan terakhir animasi berubah
 
         # Status boss saat bertarung
         self.is_hit = False  # Apakah boss sedang terkena serangan
@@ -85,7 +101,7 @@ class Boss:
         self.last_attack_time = 0  # Kapan terakhir boss menyerang
 
         # Pola serangan boss
-        self.attack_patterns = ['Slashing', 'Kicking', 'Throwing', 'Run Slashing']
+        self.attack_patterns = list(Boss.ATTACK_PATTERNS)
         self.current_pattern_index = 0
 
         # Health bar boss
@@ -98,31 +114,86 @@ class Boss:
         self.projectiles = []  # Daftar projectile yang aktif
         self.throwing_frame_trigger = 3  # Frame ke-3 dari animasi throwing untuk spawn projectile
 
-    def load_sprites(self, sprite_folder):
-        """Memuat semua gambar sprite boss dari folder"""
-        for action_name in self.actions.keys():
+    def load_sprites(self, sprite_folder, warm_actions=None):
+        """Meminjam gambar sprite boss dari gudang bersama
+
+        Hanya gerakan di warm_actions (default: Boss.WARM_ACTIONS) yang langsung dimuat.
+        Gerakan lain dicatat dulu dan baru dimuat oleh load_action() saat dipakai,
+        jadi animasi yang tidak pernah dipakai tidak pernah dibuka.
+        """
+        if warm_actions is None:
+            warm_actions = Boss.WARM_ACTIONS
+        for request in Boss.frame_requests(sprite_folder):
+            self.action_requests[request[1]] = request
+        for action_name in warm_actions:
+            self.load_action(action_name)
+
+    def load_action(self, action_name):
+        """Memuat gambar satu gerakan jika belum dimuat (dipanggil saat gerakan dipakai)"""
+        request = self.action_requests.pop(action_name, None)
+        if request is None:
+            return  # Sudah dimuat atau foldernya tidak ada
+        folder, action_name, max_size, list_files = request
+        key, frames = registry.acquire_frames(folder, action_name, max_size, list_files)
+        self.sprite_keys.append(key)
+        self.actions[action_name] = frames
+
+    @classmethod
+    def frame_requests(cls, sprite_folder, actions=None):
+        """Daftar gambar yang dibutuhkan boss: (folder, gerakan, ukuran, fungsi daftar file)
+
+        actions membatasi gerakan yang diminta (default: semua gerakan).
+        Gerakan yang foldernya tidak ada dilewati.
+        Dipakai load_sprites(), pemuat arena boss (boss_preloader.py), dan bake_assets.py.
+        """
+        requests = []
+        for action_name in (cls.ACTIONS if actions is None else actions):
             action_folder = os.path.join(sprite_folder, action_name)
             if os.path.exists(action_folder):
-                # Ambil semua file PNG dalam folder action
-                sprite_files = [f for f in os.listdir(action_folder) if f.endswith('.png')]
-                sprite_files.sort()  # Urutkan file berdasarkan nama
-
-                for sprite_file in sprite_files:
-                    sprite_path = os.path.join(action_folder, sprite_file)
-                    try:
-                        sprite = pygame.image.load(sprite_path).convert_alpha()
-                        # Resize sprite boss agar lebih besar dari zombie biasa
-                        sprite_resized = resize_with_aspect_ratio(sprite, MAX_WIDTH * 1.5, MAX_HEIGHT * 1.5)
-                        self.actions[action_name].append(sprite_resized)
-                    except pygame.error as e:
-                        print(f"Error loading sprite {sprite_path}: {e}")
+                # Resize sprite boss agar lebih besar dari zombie biasa
+                requests.append((action_folder, action_name, cls.sprite_max_size(action_name),
+                                 lambda action_folder=action_folder: cls.list_action_files(action_folder)))
+        return requests
+
+    @classmethod
+    def sprite_max_size(cls, action):
+        """Ukuran maksimal (lebar, tinggi) gambar boss
+
+        Dipakai juga oleh bake_assets.py agar ukurannya selalu sama.
+        """
+        # Sprite boss dibuat lebih besar dari zombie biasa
+        return (MAX_WIDTH * 1.5, MAX_HEIGHT * 1.5)
+
+    @classmethod
+    def list_action_files(cls, action_folder):
+        """Ambil semua file PNG dalam folder action, urut berdasarkan nama"""
+        return [f for f in registry.list_folder(action_folder) if f.endswith('.png')]
+
+    def release_sprites(self):
+        """Mengembalikan gambar yang dipinjam ke gudang bersama"""
+        registry.release_all(self.sprite_keys)
+        self.sprite_keys = []
 
     def get_current_sprite(self):
-        """Mengambil sprite yang sedang ditampilkan"""
+        """Mengambil sprite yang sedang ditampilkan (sesuai arah hadap)"""
         if self.current_action in self.actions and self.actions[self.current_action]:
-            return self.actions[self.current_action][self.current_frame]
+            # Setiap frame berisi pasangan (kanan, kiri) yang sudah dibalik saat dimuat
+            return self.actions[self.current_action][self.current_frame][self.facing_left]
         return None
 
+    def get_current_rect(self):
+        """Mengambil kotak tabrakan boss (None jika tidak ada sprite)
+
+        Kotak disimpan sampai gerakan, frame, arah hadap, atau posisi berubah.
+        Jangan diubah langsung (pakai inflate/copy).
+        """
+        cache_key = (self.current_action, self.current_frame, self.facing_left, self.x, self.y)
+        if cache_key != self.rect_cache_key:
+            sprite = self.get_current_sprite()
+            self.rect_cache = sprite.get_rect(topleft=(self.x, self.y)) if sprite else None
+            self.rect_cache_key = cache_key
+        return self.rect_cache
+
     def get_relative_x(self):
         """Mengambil posisi relatif boss"""
         return self.relative_x
@@ -146,6 +217,7 @@ class Boss:
     def set_action(self, action):
         """Set aksi boss dan reset frame"""
         if action in self.actions and action != self.current_action:
+            self.load_action(action)  # Gerakan jarang dipakai baru dimuat di sini
             self.current_action = action
             self.current_frame = 0
 
@@ -169,12 +241,12 @@ class Boss:
         if self.alive:
             self.set_action('Dying')
             self.alive = False
-            self.death_time = pygame.time.get_ticks()
+            self.death_time = game_clock.get_ticks()
 
     def is_ready_to_remove(self):
         """Cek apakah boss sudah siap untuk dihapus"""
         if self.death_time is not None:
-            current_time = pygame.time.get_ticks()
+            current_time = game_clock.get_ticks()
             if current_time - self.death_time >= self.death_duration:
                 return True
         return False
@@ -188,9 +260,9 @@ class Boss:
     def choose_attack_pattern(self, distance_to_ninja):
         """Pilih pola serangan berdasarkan jarak ke ninja"""
         if distance_to_ninja <= 80:  # Jarak dekat
-            return random.choice(['Slashing', 'Kicking'])
+            return boss_random.choice(['Slashing', 'Kicking'])
         elif distance_to_ninja <= 150:  # Jarak sedang
-            return random.choice(['Run Slashing', 'Throwing'])
+            return boss_random.choice(['Run Slashing', 'Throwing'])
         else:  # Jarak jauh
             return 'Running'  # Mendekat ke ninja
 
@@ -200,9 +272,18 @@ class Boss:
             return self.current_frame >= len(self.actions[self.current_action]) - 1
         return True
 
+    # Gerakan yang dipilih otak (AI) boss dengan set_action() di update_frame, damage,
+    # set_dead, dan reset (pola serangan ada di ATTACK_PATTERNS). Gerakan baru untuk
+    # AI harus ditulis di sini agar ikut dimuat dari awal, bukan di tengah pertarungan.
+    AI_ACTIONS = ['Idle', 'Idle Blinking', 'Running', 'Run Throwing', 'Run Slashing', 'Hurt', 'Dying']
+
+    # Gerakan yang dimuat dari awal: semua gerakan AI dan pola serangan.
+    # Gerakan lain (misalnya 'Sliding' atau 'Jump Loop') baru dimuat saat pertama kali dipakai.
+    WARM_ACTIONS = list(dict.fromkeys(AI_ACTIONS + ATTACK_PATTERNS))
+
     def update_frame(self, road_x, ninja_x, ninja_y):
         """Update frame animasi dan boss"""
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
 
         # Update posisi absolut boss
         self.x = road_x + self.relative_x
@@ -270,7 +351,7 @@ class Boss:
                     # Terlalu jauh, mendekat ke ninja dengan kemungkinan serangan sambil berlari
                     if distance_to_ninja > 250:
                         # Boss bisa menyerang sambil berlari dari jarak jauh - gunakan projectile
-                        if self.attack_cooldown <= 0 and random.randint(1, 4) == 1:  # 25% chance
+                        if self.attack_cooldown <= 0 and boss_random.randint(1, 4) == 1:  # 25% chance
                             self.set_action('Run Throwing')  # Gunakan projectile saat berlari
                             self.attack_cooldown = self.max_attack_cooldown
                         else:
@@ -282,7 +363,7 @@ class Boss:
                             self.relative_x += self.boss_speed * 1.0
                     else:
                         # Jarak menengah - pilih serangan berdasarkan jarak
-                        if self.attack_cooldown <= 0 and random.randint(1, 3) == 1:  # 33% chance
+                        if self.attack_cooldown <= 0 and boss_random.randint(1, 3) == 1:  # 33% chance
                             if distance_to_ninja > 200:
                                 self.set_action('Run Throwing')  # Projectile untuk jarak menengah-jauh
                             else:
@@ -304,11 +385,11 @@ class Boss:
                         if distance_to_ninja > 200:
                             # Jarak jauh - gunakan projectile
                             attack_actions = ['Throwing', 'Run Throwing']
-                            chosen_attack = random.choice(attack_actions)
+                            chosen_attack = boss_random.choice(attack_actions)
                         else:
                             # Jarak dekat - gunakan serangan pedang
                             attack_actions = ['Slashing', 'Run Slashing', 'Kicking']
-                            chosen_attack = random.choice(attack_actions)
+                            chosen_attack = boss_random.choice(attack_actions)
 
                         self.set_action(chosen_attack)
                         self.attack_cooldown = self.max_attack_cooldown
@@ -326,10 +407,10 @@ class Boss:
             # Ninja tidak terdeteksi, idle atau patrol
             # Hanya ganti action jika animasi movement sudah selesai
             if not (is_movement_animation and animation_not_complete):
-                if random.randint(1, 120) == 1:  # Sesekali bergerak random
-                    if random.choice([True, False]):
+                if boss_random.randint(1, 120) == 1:  # Sesekali bergerak random
+                    if boss_random.choice([True, False]):
                         self.set_action('Running')
-                        self.relative_x += random.choice([-1, 1]) * self.boss_speed * 0.3
+                        self.relative_x += boss_random.choice([-1, 1]) * self.boss_speed * 0.3
                     else:
                         self.set_action('Idle Blinking')
                 elif self.current_action not in ['Idle', 'Idle Blinking']:
@@ -337,7 +418,7 @@ class Boss:
             else:
                 # Tetap bergerak sesuai action saat ini
                 if self.current_action == 'Running':
-                    self.relative_x += random.choice([-1, 1]) * self.boss_speed * 0.3
+                    self.relative_x += boss_random.choice([-1, 1]) * self.boss_speed * 0.3
 
         # Boss bergerak sambil melakukan 'Run Slashing'
         if self.current_action == 'Run Slashing' and distance_to_ninja <= self.detection_range:
@@ -374,15 +455,18 @@ class Boss:
 
             self.last_frame_update = current_time
 
-    def draw(self):
-        """Gambar boss di layar"""
-        sprite = self.get_current_sprite()
-        if sprite:
-            # Flip sprite jika menghadap kiri
-            if self.facing_left:
-                sprite = pygame.transform.flip(sprite, True, False)
+    def save_previous_state(self):
+        """Simpan posisi sebelum langkah simulasi berikutnya (untuk interpolasi)"""
+        self.prev_x = self.x
+
+    def draw(self, alpha=1.0):
+        """Gambar boss di layar
 
-            self.screen.blit(sprite, (self.x, self.y))
+        alpha: posisi gambar di antara langkah sebelumnya (0) dan langkah terakhir (1)
+        """
+        sprite = self.get_current_sprite()  # Sudah menghadap arah yang benar
+        if sprite:
+            self.screen.blit(sprite, (lerp(self.prev_x, self.x, alpha), self.y))
 
             # Gambar projectiles
             self.draw_projectiles()
@@ -471,6 +555,7 @@ class Boss:
         """Reset boss ke kondisi awal"""
         self.relative_x = self.init_pos
         self.x = self.init_pos + self.relative_x
+        self.prev_x = self.x
         self.y = self.boss_ground
         self.health = self.max_health
         self.alive = True
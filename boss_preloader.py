@@ -0,0 +1,86 @@
+# File untuk pemuat arena boss di latar belakang (boss arena preloader)
+# Saat ninja hampir sampai di scene terakhir, gambar boss mulai dibuka oleh
+# pekerja (thread) lain, sehingga saat boss muncul game tidak macet lagi
+
+import queue, threading  # Library untuk antrean dan pekerja paralel
+from asset_loader import decode_image, finish_image  # Membuka gambar di pekerja, convert di thread utama
+from asset_registry import registry  # Gudang gambar bersama
+from boss import Boss  # Daftar gambar yang dibutuhkan boss
+
+class BossArenaPreloader:
+    """Kelas BossArenaPreloader - Menyiapkan gambar boss sebelum boss muncul
+
+    Seperti menyiapkan panggung konser sebelum penyanyinya datang!
+    Pekerja membuka dan mengecilkan file PNG boss satu gerakan demi satu gerakan.
+    Setiap frame game, thread utama mengambil hasilnya sedikit demi sedikit
+    dan menyimpannya di gudang bersama, jadi Boss() nanti tinggal meminjam.
+    """
+    def __init__(self, sprite_folder):
+        """Membuat pemuat untuk folder gambar boss (belum mulai bekerja)"""
+        self.sprite_folder = sprite_folder  # Folder gambar boss
+        self.results = queue.Queue()        # Hasil pekerja: (kunci, ukuran, daftar gambar)
+        self.thread = None                  # Pekerja yang sedang membuka gambar
+        self.cancelled = False              # True jika pemuatan dibatalkan (misalnya game di-reset)
+        self.remaining = 0                  # Jumlah gerakan yang belum disimpan di gudang
+
+    def start(self):
+        """Mulai membuka gambar boss di latar belakang"""
+        if self.thread is not None:
+            return  # Sudah berjalan
+        # Cari gerakan yang belum ada di gudang (harus di thread utama)
+        # Hanya gerakan yang dipakai AI boss; gerakan jarang dimuat saat dibutuhkan
+        batches = registry.missing_frame_batches(Boss.frame_requests(self.sprite_folder, Boss.WARM_ACTIONS))
+        self.remaining = len(batches)
+        self.thread = threading.Thread(target=self._work, args=(batches,), daemon=True)
+        self.thread.start()
+
+    def is_started(self):
+        """Apakah pemuat sudah mulai bekerja?"""
+        return self.thread is not None
+
+    def is_ready(self):
+        """Apakah semua gambar boss sudah ada di gudang?"""
+        return self.thread is not None and self.remaining == 0
+
+    def _work(self, batches):
+        """Dikerjakan pekerja: buka dan kecilkan semua file, satu gerakan per kiriman"""
+        for key, jobs in batches:
+            if self.cancelled:
+                return
+            images = [decode_image(path, max_size) for path, max_size in jobs]
+            max_size = jobs[0][1] if jobs else None
+            self.results.put((key, max_size, images))
+
+    def _store(self, key, max_size, images):
+        """Di thread utama: convert gambar lalu simpan di gudang bersama"""
+        registry.store_frames(key, [finish_image(image, max_size) for image in images if image is not None])
+        self.remaining -= 1
+
+    def poll(self, max_batches=1):
+        """Dipanggil setiap frame: simpan beberapa gerakan yang sudah selesai dibuka
+
+        Dibatasi max_batches agar satu frame tidak terlalu lama.
+        """
+        for _ in range(max_batches):
+            try:
+                key, max_size, images = self.results.get_nowait()
+            except queue.Empty:
+                return
+            self._store(key, max_size, images)
+
+    def finish(self):
+        """Tunggu pekerja selesai lalu simpan semua sisa gambar (saat boss muncul)"""
+        if self.thread is None:
+            return
+        while self.remaining > 0 and not self.cancelled:
+            try:
+                key, max_size, images = self.results.get(timeout=0.1)
+            except queue.Empty:
+                if not self.thread.is_alive():
+                    break  # Pekerja berhenti, sisa gambar dimuat biasa oleh Boss()
+                continue
+            self._store(key, max_size, images)
+
+    def cancel(self):
+        """Hentikan pemuatan (gambar yang sudah disimpan tetap ada di gudang)"""
+        self.cancelled = True
@@ -0,0 +1,63 @@
+# File untuk peta jurang (chasm map)
+# Nomor ubin jurang diubah sekali menjadi daftar rentang jurang yang terurut.
+# Jurang yang bersebelahan digabung menjadi satu rentang panjang.
+# Pembuat dunia, zombie, gerombolan zombie, dan ninja bertanya ke peta yang sama,
+# dan setiap pertanyaan dijawab dengan pencarian biner (bisect), bukan memeriksa
+# semua jurang satu per satu.
+
+import bisect  # Library untuk mencari di daftar yang sudah terurut
+
+class ChasmMap:
+    """Kelas ChasmMap - Peta jurang di sepanjang jalan
+
+    Seperti daftar isi buku: karena rentang jurang sudah terurut dari kiri
+    ke kanan, kita bisa langsung membuka halaman yang tepat tanpa membaca
+    semuanya dari awal.
+    """
+    def __init__(self, tiles, road_width):
+        """Membuat peta jurang
+
+        Parameter:
+        - tiles: Nomor ubin yang berupa jurang (contoh: [6, 9, 14, 15])
+        - road_width: Lebar satu ubin jalan (pixel)
+        """
+        self.road_width = road_width                # Lebar satu ubin jalan
+        self.tiles = sorted(set(tiles))             # Nomor ubin jurang, terurut
+        self.tile_set = frozenset(self.tiles)       # Untuk cek satu ubin dengan cepat
+        self.starts = []                            # Posisi X awal setiap rentang jurang
+        self.ends = []                              # Posisi X akhir setiap rentang jurang
+        for tile in self.tiles:
+            start = tile * road_width
+            if self.ends and self.ends[-1] == start:
+                self.ends[-1] = start + road_width  # Jurang bersebelahan: perpanjang rentang
+            else:
+                self.starts.append(start)
+                self.ends.append(start + road_width)
+
+    def __len__(self):
+        """Banyaknya rentang jurang (0 = jalan tanpa jurang)"""
+        return len(self.starts)
+
+    def spans(self):
+        """Daftar (awal, akhir) setiap rentang jurang, dari kiri ke kanan"""
+        return list(zip(self.starts, self.ends))
+
+    def is_chasm_tile(self, index):
+        """Apakah ubin ke-index berupa jurang?"""
+        return index in self.tile_set
+
+    def has_chasm_tile(self, first, last):
+        """Apakah ada ubin jurang di antara ubin first sampai last (termasuk keduanya)?"""
+        position = bisect.bisect_left(self.tiles, first)
+        return position < len(self.tiles) and self.tiles[position] <= last
+
+    def span_at(self, position):
+        """Rentang (awal, akhir) jurang di posisi X, atau None jika posisi itu jalan"""
+        index = bisect.bisect_right(self.starts, position) - 1  # Rentang terakhir yang mulai di kiri posisi
+        if index >= 0 and position <= self.ends[index]:
+            return self.starts[index], self.ends[index]
+        return None
+
+    def is_position_safe(self, position):
+        """Mengecek apakah posisi aman (tidak di jurang, ujung jurang termasuk jurang)"""
+        return self.span_at(position) is None
@@ -0,0 +1,42 @@
+# File untuk deteksi tabrakan (collision) antara banyak benda sekaligus
+# Setiap benda (ninja, kunai, zombie) punya get_current_rect() yang menyimpan
+# kotak tabrakannya, jadi kotak itu hanya dihitung satu kali per langkah simulasi.
+# Di sini kotak-kotak diurutkan dari kiri ke kanan lalu "disapu" (sort and sweep):
+# hanya benda yang kotaknya bertumpuk di sumbu X yang diperiksa dengan colliderect.
+# Jadi kerjanya sebanding dengan banyaknya tumpukan, bukan jumlah kunai x jumlah zombie.
+
+import heapq  # Antrean yang selalu memberi isi terkecil lebih dulu
+def sweep_pairs(movers, targets):
+    """Semua pasangan (mover, target) yang kotak tabrakannya bertumpuk
+
+    Parameter:
+    - movers: Benda penyerang (contoh: [ninja] atau daftar kunai)
+    - targets: Benda sasaran (contoh: zombie di dekat ninja)
+
+    Pasangan diurutkan seperti dua perulangan biasa: menurut urutan movers,
+    lalu menurut urutan targets. Jadi hasilnya sama dengan memeriksa setiap
+    pasangan satu per satu, hanya lebih cepat.
+    """
+    # Setiap kotak: (kotak, sisi (0 = mover, 1 = target), nomor urut, benda)
+    boxes = [(thing.get_current_rect(), 0, order, thing) for order, thing in enumerate(movers)]
+    boxes += [(thing.get_current_rect(), 1, order, thing) for order, thing in enumerate(targets)]
+    boxes.sort(key=lambda box: (box[0].left, box[1], box[2]))  # Urutkan dari kiri ke kanan
+
+    # Kotak yang masih mungkin bertumpuk dengan kotak berikutnya, per sisi.
+    # Disimpan di heap (right, nomor kotak, kotak): kotak yang paling dulu berakhir selalu di depan.
+    active = ([], [])
+    found = []
+    for number, box in enumerate(boxes):
+        rect, side, order, thing = box
+        for waiting in active:
+            # Kotak yang sudah berakhir di kiri kotak ini tidak akan bertumpuk lagi
+            while waiting and waiting[0][0] <= rect.left:
+                heapq.heappop(waiting)
+        for _, _, other in active[1 - side]:
+            if rect.colliderect(other[0]):
+                mover, target = (box, other) if side == 0 else (other, box)
+                found.append((mover[2], target[2], mover[3], target[3]))
+        heapq.heappush(active[side], (rect.right, number, box))
+
+    found.sort(key=lambda pair: (pair[0], pair[1]))
+    return [(mover, target) for _, _, mover, target in found]
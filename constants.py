@@ -5,12 +5,28 @@
 CHARACTER_FOLDER = 'assets/ninja'  # 🥷 Folder gambar ninja
 ENEMIES_FOLDER = 'assets/zombie'   # 🧟‍♂️ Folder gambar zombie
 OBJECTS_FOLDER = 'assets/tiles'    # 🏞️ Folder gambar latar belakang dan tanah
+BOSS_FOLDER = 'assets/boss'        # 👹 Folder gambar boss (satu folder per gerakan)
+
+# 🍪 Folder gambar yang sudah "dipanggang" (diperkecil sebelumnya) oleh bake_assets.py
+BAKE_FOLDER = 'assets/.cache'
 
 # 🎬 Pengaturan layar dan gerakan
+SCREEN_WIDTH = 1024  # 🖥️ Lebar layar game (pixel)
+SCREEN_HEIGHT = 600  # 🖥️ Tinggi layar game (pixel)
 MAX_SCENE = 20       # 📺 Jumlah maksimal layar yang bisa dilihat (diperpanjang untuk menampung 140 zombie)
 BOSS_SCENE = 2       # 👹 Scene khusus untuk boss fight (hanya 3 scene saat melawan boss)
+BOSS_PRELOAD_SCENES = 3  # ⏳ Mulai menyiapkan gambar boss saat ninja tinggal 3 scene lagi dari akhir
 NINJA_SPEED = 8      # 🏃 Seberapa cepat ninja bergerak (8 pixel per frame)
 ZOMBIE_SPEED = 4     # 🚶 Seberapa cepat zombie bergerak (4 pixel per frame)
+ZOMBIE_WAKE_MARGIN = 400  # 😴 Zombie diam yang lebih jauh dari ini (pixel di luar layar) ditidurkan
+ZOMBIE_BACKEND = 'objects'  # 🧟 'objects' = satu objek Zombie per zombie, 'horde' = semua zombie dalam array NumPy (untuk ribuan zombie)
+HORDE_BLOOD_SPLASHES = 1  # 🩸 Percikan darah maksimal per langkah untuk gerombolan NumPy (ribuan zombie terkena sekaligus)
+
+# 🕳️ Nomor ubin jalan yang berupa jurang (diperbanyak untuk tantangan lebih sulit)
+DOWNFALL_POSITIONS = [6, 9, 11, 14, 15, 18, 22, 25, 28, 31, 35, 38, 42, 45, 48, 52, 55, 58, 62, 65, 68, 72, 75, 78, 82, 85]
+
+# 🌱 Benih (seed) dunia: angka yang sama = letak pohon dan zombie yang sama
+WORLD_SEED = 42
 
 # 🔤 Font untuk tulisan di game
 FONT_GAME = 'assets/fonts/PressStart2P-Regular.ttf'  # 📝 Font bergaya retro
@@ -20,6 +36,14 @@ BACKGROUND_START_GAME = 'assets/bg.png'  # 🌅 Gambar untuk layar awal
 
 # ⚡ Kecepatan game
 FPS = 60  # 🎯 Frame per detik (60 = sangat halus)
+SIMULATION_FPS = 60       # 🧮 Langkah logika game per detik (kecepatan di game dihitung "per langkah")
+MAX_SIMULATION_STEPS = 5  # 🏃 Langkah maksimal per gambar jika komputer sedang lambat
+RENDER_FPS = 144          # 🖼️ Batas gambar per detik (cukup untuk layar 60/120/144 Hz)
+
+# 🎚️ Pengatur efek hiasan (effect_governor.py): kurangi percikan, hujan, abu, dan daun jika frame terlalu lama
+FRAME_BUDGET_MS = 16                          # ⏱️ Batas waktu kerja satu frame (milidetik)
+EFFECT_QUALITY_LEVELS = (1.0, 0.75, 0.5, 0.3) # 📉 Tingkat efek hiasan (1.0 = penuh)
+BOSS_RAIN_INTENSITY = 150                     # 🌧️ Jumlah tetes hujan di arena boss (tingkat penuh)
 
 # 📏 Ukuran karakter di layar
 MAX_WIDTH = 100   # 📐 Lebar maksimal karakter (100 pixel)
@@ -27,3 +51,15 @@ MAX_HEIGHT = 100  # 📐 Tinggi maksimal karakter (100 pixel)
 
 # 🌍 Tinggi tanah tempat ninja berdiri
 NINJA_GROND = 360  # 📍 Posisi Y tanah (360 pixel dari atas layar)
+
+# 🧠 Batas memori gambar per bagian game (dalam megabyte), dicek oleh memory_report.py (tekan F9)
+MEMORY_BUDGETS_MB = {
+    'GamePlay': 12,            # Layar, latar belakang, overlay merah
+    'Ninja': 10,               # Semua gerakan ninja + versi serangan yang diperbesar
+    'Zombie': 8,               # Gambar zombie laki-laki dan perempuan (dipakai bersama)
+    'Boss': 25,                # Gerakan boss yang sudah dimuat
+    'Object': 12,              # Latar belakang, potongan jalan yang sudah jadi, dan objek alam
+    'MovingShadowEffect': 5,   # Efek bayangan (vignette)
+    'RainEffect': 3,           # Efek hujan
+    'AssetRegistry': 8,        # Gambar di gudang yang sedang tidak dipinjam
+}
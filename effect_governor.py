@@ -0,0 +1,83 @@
+# File untuk pengatur jumlah efek hiasan (effect governor)
+# Saat komputer lambat (misalnya hujan badai, petir, dan percikan darah di arena boss),
+# waktu untuk menggambar satu frame bisa lebih lama dari batasnya. Pengatur ini
+# mencatat waktu kerja frame-frame terakhir lalu menurunkan tingkat efek hiasan
+# (percikan, hujan, abu, daun) satu tingkat, dan menaikkannya lagi saat komputer longgar.
+#
+# Hanya efek hiasan yang dikurangi. Zombie, boss, kunai, dan proyektil tidak pernah
+# dikurangi, jadi permainannya tetap sama persis.
+
+import collections  # Library untuk antrean dengan panjang tetap
+from constants import FRAME_BUDGET_MS, EFFECT_QUALITY_LEVELS  # Batas waktu frame dan tingkat efek
+
+class EffectGovernor:
+    """Kelas EffectGovernor - Pengatur banyaknya efek hiasan berdasarkan waktu frame
+
+    Seperti termostat: jika ruangan terlalu panas (frame terlalu lama), efek
+    dikurangi; jika sudah cukup dingin, efek ditambah lagi. Ada dua batas yang
+    berbeda (turun saat lewat batas, naik saat jauh di bawah batas) dan waktu
+    tunggu setelah setiap perubahan (hysteresis), jadi tingkatnya tidak naik-turun
+    setiap frame.
+    """
+    def __init__(self, budget_ms=FRAME_BUDGET_MS, levels=EFFECT_QUALITY_LEVELS, window=30,
+                 recover_ratio=0.7, hold_frames=60):
+        """Membuat pengatur efek
+
+        Parameter:
+        - budget_ms: Batas waktu kerja satu frame (milidetik)
+        - levels: Tingkat efek dari penuh ke paling hemat (1.0 = semua efek)
+        - window: Banyaknya frame terakhir yang dirata-rata
+        - recover_ratio: Efek naik lagi jika rata-rata di bawah budget_ms x recover_ratio
+        - hold_frames: Frame minimal di antara dua perubahan tingkat
+        """
+        self.budget_ms = budget_ms              # Batas waktu kerja satu frame
+        self.levels = levels                    # Tingkat efek yang tersedia
+        self.frame_times = collections.deque(maxlen=window)  # Waktu kerja frame-frame terakhir
+        self.recover_ratio = recover_ratio      # Batas bawah untuk menaikkan efek lagi
+        self.hold_frames = hold_frames          # Waktu tunggu setelah perubahan
+        self.level = 0                          # Nomor tingkat saat ini (0 = efek penuh)
+        self.frames_since_change = 0            # Frame sejak tingkat terakhir berubah
+        self.changes = 0                        # Berapa kali tingkat sudah berubah
+
+    @property
+    def quality(self):
+        """Tingkat efek saat ini (1.0 = penuh, 0.3 = 30% efek)"""
+        return self.levels[self.level]
+
+    def average_ms(self):
+        """Rata-rata waktu kerja frame-frame terakhir (0 jika belum ada)"""
+        return sum(self.frame_times) / len(self.frame_times) if self.frame_times else 0.0
+
+    def record_frame(self, frame_ms):
+        """Catat waktu kerja satu frame; return True jika tingkat efek berubah"""
+        self.frame_times.append(frame_ms)
+        self.frames_since_change += 1
+        if len(self.frame_times) < self.frame_times.maxlen or self.frames_since_change < self.hold_frames:
+            return False
+
+        average = self.average_ms()
+        if average > self.budget_ms and self.level < len(self.levels) - 1:
+            self.level += 1  # Terlalu lambat: kurangi efek
+        elif average < self.budget_ms * self.recover_ratio and self.level > 0:
+            self.level -= 1  # Cukup longgar: tambah efek lagi
+        else:
+            return False
+
+        self.frames_since_change = 0
+        self.frame_times.clear()  # Mulai mengukur lagi dengan tingkat yang baru
+        self.changes += 1
+        return True
+
+    def scale(self, count):
+        """Jumlah efek setelah dikurangi sesuai tingkat (contoh: scale(150) -> 75 saat tingkat 0.5)"""
+        return int(round(count * self.quality))
+
+    def status(self):
+        """Keadaan pengatur untuk dicetak atau dicatat"""
+        return {
+            'level': self.level,
+            'quality': self.quality,
+            'average_ms': round(self.average_ms(), 2),
+            'budget_ms': self.budget_ms,
+            'changes': self.changes,
+        }
@@ -3,7 +3,9 @@
 
 import pygame
 import math
-import random
+from game_random import random_streams
+
+explosion_random = random_streams.get('explosion')  # Angka acak ledakan
 
 class Explosion:
     """Kelas Explosion - Cetakan untuk membuat efek ledakan
@@ -12,12 +14,13 @@ class Explosion:
     Ledakan terdiri dari partikel-partikel yang menyebar ke segala arah dengan warna yang berubah.
     """
     
-    def __init__(self, x, y, size=50):
+    def __init__(self, x, y, particles, size=50):
         """Membuat ledakan baru
         
         Parameter:
         - x: Posisi X ledakan
         - y: Posisi Y ledakan  
+        - particles: ParticleSystem tempat serpihan ledakan disimpan
         - size: Ukuran maksimum ledakan
         """
         self.x = x
@@ -25,54 +28,42 @@ class Explosion:
         self.size = size
         self.max_size = size
         self.current_size = 0
-        self.particles = []
         self.alive = True
-        self.duration = 30  # Frame durasi ledakan
+        self.duration = 30  # Frame durasi ledakan (serpihan paling lama hidup 25 frame)
         self.frame_count = 0
         
         # Buat partikel ledakan
-        self.create_particles()
+        self.create_particles(particles)
     
-    def create_particles(self):
-        """Buat partikel-partikel ledakan"""
-        particle_count = random.randint(15, 25)
+    def create_particles(self, particles):
+        """Buat serpihan ledakan di sistem partikel"""
+        particle_count = explosion_random.randint(15, 25)
+        velocities, colors, sizes, lives = [], [], [], []
         
         for _ in range(particle_count):
             # Arah acak untuk setiap partikel
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 8)
-            
-            # Posisi awal partikel (di tengah ledakan)
-            particle_x = self.x
-            particle_y = self.y
+            angle = explosion_random.uniform(0, 2 * math.pi)
+            speed = explosion_random.uniform(2, 8)
             
             # Kecepatan partikel berdasarkan arah
-            vel_x = math.cos(angle) * speed
-            vel_y = math.sin(angle) * speed
+            velocities.append((math.cos(angle) * speed, math.sin(angle) * speed))
             
             # Warna partikel (gradasi dari putih ke merah ke hitam)
-            color_phase = random.uniform(0, 1)
+            color_phase = explosion_random.uniform(0, 1)
             if color_phase < 0.3:
                 color = (255, 255, 255)  # Putih (inti ledakan)
             elif color_phase < 0.7:
-                color = (255, random.randint(100, 200), 0)  # Orange-merah
+                color = (255, explosion_random.randint(100, 200), 0)  # Orange-merah
             else:
                 color = (255, 0, 0)  # Merah
+            colors.append(color)
             
-            # Ukuran partikel
-            particle_size = random.randint(2, 6)
-            
-            particle = {
-                'x': particle_x,
-                'y': particle_y,
-                'vel_x': vel_x,
-                'vel_y': vel_y,
-                'color': color,
-                'size': particle_size,
-                'life': random.randint(15, 25)
-            }
-            
-            self.particles.append(particle)
+            # Ukuran dan umur partikel
+            sizes.append(explosion_random.randint(2, 6))
+            lives.append(explosion_random.randint(15, 25))
+        
+        # Semua serpihan mulai dari tengah ledakan
+        particles.emit_debris(self.x, self.y, velocities, colors, sizes, lives)
     
     def update(self):
         """Update ledakan dan partikel-partikelnya"""
@@ -94,38 +85,8 @@ class Explosion:
             fade_progress = (progress - 0.7) / 0.3
             self.current_size = self.max_size * (1 - fade_progress)
         
-        # Update partikel
-        for particle in self.particles[:]:
-            # Update posisi partikel
-            particle['x'] += particle['vel_x']
-            particle['y'] += particle['vel_y']
-            
-            # Tambahkan gravitasi ringan
-            particle['vel_y'] += 0.1
-            
-            # Reduksi kecepatan (friction)
-            particle['vel_x'] *= 0.98
-            particle['vel_y'] *= 0.98
-            
-            # Kurangi life partikel
-            particle['life'] -= 1
-            
-            # Fade warna partikel
-            if particle['life'] < 10:
-                fade_factor = particle['life'] / 10
-                r, g, b = particle['color']
-                particle['color'] = (
-                    int(r * fade_factor),
-                    int(g * fade_factor), 
-                    int(b * fade_factor)
-                )
-            
-            # Hapus partikel yang sudah mati
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
-        
-        # Cek apakah ledakan sudah selesai
-        if self.frame_count >= self.duration and len(self.particles) == 0:
+        # Serpihan digerakkan oleh ParticleSystem; ledakan selesai saat durasinya habis
+        if self.frame_count >= self.duration:
             self.alive = False
     
     def draw(self, screen):
@@ -154,13 +115,6 @@ class Explosion:
                     
                     pygame.draw.circle(explosion_surface, color, (size, size), size)
                     screen.blit(explosion_surface, (self.x - size, self.y - size))
-        
-        # Gambar partikel
-        for particle in self.particles:
-            if particle['size'] > 0:
-                pygame.draw.circle(screen, particle['color'], 
-                                 (int(particle['x']), int(particle['y'])), 
-                                 particle['size'])
     
     def is_alive(self):
         """Cek apakah ledakan masih aktif"""
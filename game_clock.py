@@ -0,0 +1,103 @@
+# File untuk jam simulasi game (fixed timestep)
+# Logika game (gerak, gravitasi, tabrakan) selalu maju dengan langkah waktu yang sama,
+# berapa pun kecepatan gambar di layar. Layar tinggal menggambar di antara dua langkah.
+
+import time  # Library untuk membaca waktu yang sangat teliti
+from constants import SIMULATION_FPS, MAX_SIMULATION_STEPS  # Pengaturan langkah simulasi
+
+def lerp(start, end, alpha):
+    """Mencari nilai di antara start dan end (alpha 0 = start, alpha 1 = end)
+
+    Contoh: lerp(10, 20, 0.5) = 15
+    """
+    return start + (end - start) * alpha
+
+class FixedTimestep:
+    """Kelas FixedTimestep - Jam yang membagi waktu nyata menjadi langkah-langkah sama besar
+
+    Seperti celengan waktu (accumulator): setiap frame, waktu yang berlalu
+    dimasukkan ke celengan. Selama isinya cukup untuk satu langkah, game
+    menjalankan satu langkah simulasi dan mengambil waktunya dari celengan.
+    Sisa di celengan (alpha) dipakai untuk menggambar posisi di antara
+    langkah sebelumnya dan langkah terakhir, sehingga gerakan tetap halus.
+
+    Jika komputer terlalu lambat, paling banyak max_steps langkah dijalankan
+    per frame (gambar frame yang tertinggal dilewati). Waktu yang masih tersisa
+    dibuang agar game tidak terus-menerus mengejar ketinggalan.
+    """
+    def __init__(self, steps_per_second=60, max_steps=5, max_frame_time=0.25):
+        """Membuat jam simulasi
+
+        Parameter:
+        - steps_per_second: Jumlah langkah simulasi per detik
+        - max_steps: Langkah maksimal dalam satu frame gambar
+        - max_frame_time: Waktu maksimal satu frame (detik), misalnya setelah jendela di-drag
+        """
+        self.step_seconds = 1.0 / steps_per_second  # Lama satu langkah simulasi (detik)
+        self.max_steps = max_steps                    # Batas langkah per frame
+        self.max_frame_time = max_frame_time          # Batas waktu yang dihitung per frame
+        self.accumulator = 0.0                        # Isi celengan waktu (detik)
+        self.last_time = None                         # Waktu frame sebelumnya
+        self.total_steps = 0                          # Jumlah semua langkah yang sudah selesai
+        self.dropped_time = 0.0                       # Jumlah waktu yang dibuang karena terlalu lambat
+
+    def reset(self):
+        """Mulai menghitung dari sekarang (dipanggil setelah layar yang menunggu, misalnya game over)"""
+        self.accumulator = 0.0
+        self.last_time = None
+
+    def advance(self):
+        """Masukkan waktu yang berlalu ke celengan
+
+        Return jumlah langkah simulasi yang harus dijalankan frame ini.
+        """
+        now = time.perf_counter()
+        if self.last_time is None:
+            self.last_time = now - self.step_seconds  # Frame pertama: tepat satu langkah
+        elapsed = min(now - self.last_time, self.max_frame_time)
+        self.last_time = now
+        self.accumulator += elapsed
+
+        steps = int(self.accumulator / self.step_seconds)
+        if steps > self.max_steps:
+            # Terlalu tertinggal: buang waktu yang tidak sempat disimulasikan
+            self.dropped_time += (steps - self.max_steps) * self.step_seconds
+            steps = self.max_steps
+            self.accumulator = self.accumulator % self.step_seconds + self.step_seconds * steps
+        self.accumulator -= steps * self.step_seconds
+        return steps
+
+    def finish_step(self):
+        """Dipanggil setelah satu langkah simulasi selesai: jam simulasi maju satu langkah"""
+        self.total_steps += 1
+
+    def get_ticks(self):
+        """Waktu simulasi dalam milidetik (seperti pygame.time.get_ticks, tapi ikut langkah simulasi)
+
+        Timer gameplay (animasi zombie, serangan boss) memakai waktu ini, jadi
+        saat beberapa langkah dijalankan dalam satu frame, timer juga ikut maju.
+        """
+        return self.ticks_at(self.total_steps)
+
+    def ticks_at(self, step):
+        """Waktu simulasi (milidetik) selama langkah ke-step berjalan"""
+        return int(step * self.step_seconds * 1000)
+
+    def first_step_after(self, ticks):
+        """Langkah pertama yang waktunya sudah lebih dari ticks milidetik"""
+        step = max(0, int(ticks / (self.step_seconds * 1000)))
+        while step > 0 and self.ticks_at(step - 1) > ticks:
+            step -= 1
+        while self.ticks_at(step) <= ticks:
+            step += 1
+        return step
+
+    def get_alpha(self):
+        """Seberapa jauh waktu sekarang di antara langkah terakhir dan langkah berikutnya (0 sampai 1)"""
+        return min(self.accumulator / self.step_seconds, 1.0)
+
+simulation_clock = FixedTimestep(SIMULATION_FPS, MAX_SIMULATION_STEPS)  # Jam simulasi bersama untuk seluruh game
+
+def get_ticks():
+    """Waktu simulasi saat ini dalam milidetik (lihat FixedTimestep.get_ticks)"""
+    return simulation_clock.get_ticks()
@@ -0,0 +1,43 @@
+# File untuk angka acak game, satu aliran (stream) untuk setiap bagian game
+# Setiap bagian (boss, percikan darah, ledakan, petir, hujan, abu, daun) punya
+# random.Random sendiri. Semua aliran dibuat dari satu benih sesi (session seed),
+# jadi benih yang sama menghasilkan game yang persis sama.
+# Karena alirannya terpisah, hujan yang memakai banyak angka acak tidak mengubah
+# serangan boss, dan sebaliknya. Letak objek alam dan zombie memakai benih dunia
+# sendiri (WORLD_SEED di world_generation.py) dan tidak memakai aliran di sini.
+
+import random  # Library untuk angka acak
+
+STREAM_NAMES = ('boss', 'blood', 'explosion', 'lightning', 'lightning_flicker', 'rain', 'ash', 'leaves')  # Semua aliran
+
+class RandomStreams:
+    """Kelas RandomStreams - Kumpulan aliran angka acak, satu per bagian game
+
+    Seperti beberapa dadu yang masing-masing punya pemilik: melempar dadu
+    milik hujan tidak mengubah angka berikutnya di dadu milik boss.
+    """
+    def __init__(self, names=STREAM_NAMES):
+        """Membuat semua aliran, lalu memberi benih sesi acak"""
+        self.streams = {name: random.Random() for name in names}  # Nama bagian -> random.Random
+        self.session_seed = None  # Benih sesi yang terakhir dipakai
+        self.seed(random.randrange(2 ** 31))
+
+    def get(self, name):
+        """Aliran angka acak milik satu bagian game (objeknya tetap sama walau diberi benih baru)"""
+        return self.streams[name]
+
+    def seed(self, session_seed):
+        """Memberi benih baru ke semua aliran dari satu benih sesi
+
+        Benih setiap aliran = benih sesi + nama aliran (contoh: "1234:boss"),
+        jadi setiap aliran mendapat urutan angka yang berbeda tapi selalu sama.
+        """
+        self.session_seed = session_seed
+        for name, stream in self.streams.items():
+            stream.seed(f"{session_seed}:{name}")
+
+random_streams = RandomStreams()  # Aliran angka acak bersama untuk seluruh game
+
+def seed_session(seed):
+    """Memberi benih baru ke semua aliran angka acak (benih sama = game sama)"""
+    random_streams.seed(seed)
@@ -2,22 +2,37 @@
 # File utama untuk menjalankan permainan Shinobi vs Zombie
 # File ini mengatur semua yang terjadi dalam game: ninja, zombie, objek, dan layar
 
-import random, pygame, math  # Library untuk membuat game
+import pygame, math, zlib  # Library untuk membuat game (zlib untuk sidik jari keadaan)
 from ninja import Ninja  # Karakter ninja (pemain)
 from object import Object  # Objek-objek dalam game (tanah, latar belakang)
 from zombie import Zombie  # Karakter zombie (musuh)
 from boss import Boss  # Karakter boss (musuh utama)
-from spark import Spark  # Efek percikan darah
+from particles import ParticleSystem  # Percikan darah, percikan tanah, dan serpihan ledakan
 from explosion import Explosion  # Efek ledakan
 from rain_effect import RainEffect  # Efek hujan
 from lightning_effect import LightningEffect  # Efek petir
 from moving_shadow_effect import MovingShadowEffect  # Efek shadow bergerak
 from ash_effect import AshEffect  # Efek partikel abu gelap
+from asset_registry import registry  # Gudang gambar bersama
+from boss_preloader import BossArenaPreloader  # Pemuat gambar boss di latar belakang
+from zombie_sleep import SleepingZombies  # Tempat tidur zombie yang jauh dari layar
+from zombie_index import ZombieIndex  # Zombie yang urut berdasarkan posisi di jalan
+from zombie_horde import ZombieHorde  # Gerombolan zombie dalam array NumPy
+from collision import sweep_pairs  # Deteksi tabrakan sort and sweep
+from effect_governor import EffectGovernor  # Pengatur jumlah efek hiasan
+import memory_report  # Laporan pemakaian memori gambar (tekan F9)
+import world_generation  # Pembuat letak zombie dan objek alam
+from game_clock import simulation_clock  # Jam simulasi dengan langkah tetap
+from input_source import KeyboardInput  # Tombol dari keyboard sungguhan
+from game_random import random_streams, seed_session  # Aliran angka acak per bagian game
 
 pygame.init()  # Mulai pygame
 
+blood_random = random_streams.get('blood')  # Angka acak percikan darah
+explosion_random = random_streams.get('explosion')  # Angka acak ledakan tanah
+
 # Import semua pengaturan game
-from constants import CHARACTER_FOLDER, ENEMIES_FOLDER, OBJECTS_FOLDER, MAX_SCENE, BOSS_SCENE, NINJA_SPEED, ZOMBIE_SPEED, FPS, NINJA_GROND, FONT_GAME, BACKGROUND_START_GAME
+from constants import MAX_WIDTH, CHARACTER_FOLDER, ENEMIES_FOLDER, OBJECTS_FOLDER, BOSS_FOLDER, SCREEN_WIDTH, SCREEN_HEIGHT, MAX_SCENE, BOSS_SCENE, BOSS_PRELOAD_SCENES, DOWNFALL_POSITIONS, WORLD_SEED, NINJA_SPEED, ZOMBIE_SPEED, ZOMBIE_WAKE_MARGIN, ZOMBIE_BACKEND, HORDE_BLOOD_SPLASHES, FPS, RENDER_FPS, BOSS_RAIN_INTENSITY, NINJA_GROND, FONT_GAME, BACKGROUND_START_GAME
 
 class GamePlay:
     """Kelas GamePlay - Otak dari seluruh permainan
@@ -28,13 +43,19 @@ class GamePlay:
     - Layar game dan menu
     - Skor dan game over
     """
-    def __init__(self):
+    def __init__(self, input_source=None, recorder=None):
         """Mempersiapkan semua yang dibutuhkan untuk game
 
         Fungsi ini seperti menyiapkan panggung sebelum pertunjukan dimulai!
+        input_source: Asal tombol yang ditekan (default: keyboard sungguhan,
+        headless.py memakai ScriptedInput agar game bisa dimainkan oleh program)
+        recorder: InputRecorder untuk merekam permainan pertama (lihat replay.py), atau None
         """
+        self.input_source = input_source or KeyboardInput()  # Asal tombol dan kejadian
+        self.recorder = recorder  # Perekam tombol (None = tidak merekam)
+        self.character_type = None  # Ninja yang dipilih ('male' atau 'female')
         # Buat layar game dengan ukuran 1024x600 pixel
-        self.screen = pygame.display.set_mode((1024, 600))
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         self.clock = pygame.time.Clock()  # Pengatur kecepatan game
         self.ninja_ground = NINJA_GROND  # Tinggi tanah tempat ninja berdiri
 
@@ -52,13 +73,17 @@ class GamePlay:
         # Preload semua zombie - tidak ada lazy loading lagi
         # Zombie bisa laki-laki atau perempuan (dipilih secara acak)
         self.zombies_sprite = ['/male', '/female']
-        self.zombies = []  # Daftar semua zombie yang akan dimuat saat loading
+        self.zombies = []  # Daftar semua zombie yang akan dimuat saat loading (yang sedang bangun)
+        self.sleeping_zombies = SleepingZombies(ZOMBIE_WAKE_MARGIN)  # Zombie jauh dari layar yang sedang tidur
+        self.zombies_spawned = 0  # Banyaknya objek Zombie yang sudah dibuat (untuk spawn_order)
+        self.zombie_index = ZombieIndex()  # Zombie yang bangun, urut dari kiri ke kanan (untuk mencari dengan cepat)
+        self.zombie_reach = MAX_WIDTH + 20  # Lebar gambar zombie terbesar (gambar mati sedikit lebih besar)
+        self.zombie_backend = ZOMBIE_BACKEND  # 'objects' (Zombie) atau 'horde' (ZombieHorde)
+        self.horde = None  # ZombieHorde jika zombie_backend == 'horde'
         # Posisi zombie akan di-generate secara dinamis untuk menghindari jurang
         self.zombie_positions = []  # Akan diisi oleh generate_dynamic_zombie_positions()
 
         # Variabel untuk mengontrol game
-        self.now = 0  # Waktu saat ini dalam game
-        self.last_update = 0  # Waktu update terakhir untuk FPS control
         self.running = True  # Apakah game masih berjalan
 
         # Sistem skor
@@ -68,10 +93,13 @@ class GamePlay:
         self.boss = None  # Boss instance
         self.boss_mode = False  # Apakah sedang dalam mode boss
         self.boss_alert_shown = False  # Apakah alert boss sudah ditampilkan
+        self.boss_alert_pending = False  # Boss baru muncul, layar peringatan belum digambar
         self.boss_defeated = False  # Apakah boss sudah dikalahkan
         self.boss_trigger_score = 300  # Score untuk memicu boss fight (setelah mengalahkan ~60 zombie)
+        self.boss_preloader = BossArenaPreloader(BOSS_FOLDER)  # Menyiapkan gambar boss sebelum boss muncul
 
-        self.sparks = []  # Daftar efek percikan darah
+        self.particles = ParticleSystem()  # Semua percikan dan serpihan ledakan
+        self.blood_splashes_left = None  # Sisa percikan darah langkah ini (None = tanpa batas)
         self.explosions = []  # Daftar efek ledakan
 
         self.zombie_is_hit = False  # Apakah ada zombie yang terkena serangan
@@ -99,13 +127,13 @@ class GamePlay:
         # Background akan dimuat saat loading
         self.background_start_game = None
         self.background_resized = None
-        self.background_character = None
 
         # Efek cuaca untuk mode boss
         self.rain_effect = None  # Akan diinisialisasi saat mode boss
         self.lightning_effect = None  # Akan diinisialisasi saat mode boss
         self.weather_active = False  # Status efek cuaca
         self.background_character_resized = None
+        self.background_character_key = None  # Kunci latar pemilihan karakter di gudang bersama
 
         # Efek shadow bergerak untuk atmosfer horor
         self.shadow_effect = MovingShadowEffect(self.screen.get_width(), self.screen.get_height())
@@ -114,6 +142,9 @@ class GamePlay:
         # Efek partikel abu gelap untuk atmosfer suram
         self.ash_effect = AshEffect(self.screen.get_width(), self.screen.get_height())
 
+        # Pengatur efek hiasan: kurangi percikan, hujan, abu, dan daun jika frame terlalu lama
+        self.effect_governor = EffectGovernor()
+
         # Sistem Score
         self.score = 0  # Skor pemain (bertambah 5 setiap membunuh zombie)
 
@@ -126,46 +157,22 @@ class GamePlay:
         - max_distance: Jarak maksimum antar zombie
 
         Return:
-        - List posisi X yang aman untuk zombie
+        - List (posisi X, jenis zombie) yang aman untuk zombie
         """
-        import random
         from constants import MAX_WIDTH
 
         # Pastikan object sudah dimuat
         if self.object is None:
             return []
 
-        positions = []
-        current_x = 1000  # Mulai dari posisi 1000 (setelah area awal)
-        # Dapatkan max_x dari sistem game (lebar layar * jumlah scene)
-        max_x = self.screen.get_width() * self.object.max_scene
-        # Dapatkan lebar zombie dari konstanta yang digunakan sistem
-        zombie_width = MAX_WIDTH
-
-        # Set seed untuk konsistensi (opsional)
-        random.seed(42)
-
-        # Hitung estimasi zombie yang bisa dibuat berdasarkan area
-        available_area = max_x - current_x
-        estimated_max_zombies = int(available_area / min_distance)
-
-        # Sesuaikan target zombie jika melebihi kapasitas area
-        if num_zombies > estimated_max_zombies:
-            print(f"⚠️  Target zombie ({num_zombies}) melebihi kapasitas area ({estimated_max_zombies})")
-            print(f"🔧 Menyesuaikan target zombie menjadi {estimated_max_zombies}")
-            num_zombies = estimated_max_zombies
-
-        while current_x < max_x and len(positions) < num_zombies:
-            # Cek apakah posisi saat ini aman
-            if self.object._is_safe_position(current_x, zombie_width):
-                positions.append(current_x)
-                # Tambah jarak acak untuk posisi zombie berikutnya
-                current_x += random.randint(min_distance, max_distance)
-            else:
-                # Jika tidak aman, lompat ke posisi berikutnya
-                current_x += 50  # Lompat 50 pixel dan coba lagi
-
-        return positions
+        # Dunia normal (bukan arena boss): lebar layar * jumlah scene, dengan semua jurang.
+        # Hasilnya disimpan oleh world_generation, jadi restart tidak membuatnya ulang.
+        return world_generation.zombie_layout(
+            WORLD_SEED, self.object.get_road_width(), DOWNFALL_POSITIONS, self.zombies_sprite,
+            start_x=1000,  # Mulai dari posisi 1000 (setelah area awal)
+            max_x=self.screen.get_width() * MAX_SCENE,
+            zombie_width=MAX_WIDTH,  # Lebar zombie dari konstanta yang digunakan sistem
+            num_zombies=num_zombies, min_distance=min_distance, max_distance=max_distance)
 
     def show_loading_screen(self):
         """🔄 Tampilkan loading screen dan muat semua asset game."""
@@ -176,7 +183,8 @@ class GamePlay:
         # Estimasi jumlah zombie untuk perhitungan progress yang akurat
         estimated_zombies = 140  # Estimasi berdasarkan parameter default generate_dynamic_zombie_positions
         zombie_progress_calls = len([i for i in range(estimated_zombies) if i % 10 == 0 or i == estimated_zombies - 1])
-        total_items = 7 + zombie_progress_calls + 1  # 7 basic + zombie calls + 1 finalizing
+        sprite_progress_calls = 10  # Bar loading gambar maju 10 langkah (setiap 10%)
+        total_items = 7 + sprite_progress_calls + zombie_progress_calls + 1  # 7 basic + sprite + zombie calls + 1 finalizing
         loaded_items = 0
 
         def update_progress(message):
@@ -227,15 +235,41 @@ class GamePlay:
         self.background_resized = pygame.transform.scale(self.background_start_game, (self.screen.get_width(), self.screen.get_height()))
 
         update_progress("Loading character selection images...")
-        self.background_character = pygame.image.load("assets/tiles/Background.png").convert()
-        self.background_character_resized = pygame.transform.scale(self.background_character, (self.screen.get_width(), self.screen.get_height()))
+        # Latar pemilihan karakter sama dengan latar Object, jadi dipinjam dari gudang bersama
+        self.release_background_character()  # Muat ulang: kembalikan pinjaman yang lama dulu
+        self.background_character_key, self.background_character_resized = registry.acquire_scaled(OBJECTS_FOLDER + '/Background.png', (self.screen.get_width(), self.screen.get_height()), alpha=False)
 
         update_progress("Loading ninja character images...")
         self.male_character_image = pygame.image.load("assets/ninja/male/Attack__009.png").convert_alpha()
         self.female_character_image = pygame.image.load("assets/ninja/female/Attack__009.png").convert_alpha()
 
+        # Buka semua gambar ninja dan zombie sekaligus memakai semua inti prosesor
+        character_requests = []  # Daftar gambar per karakter
+        for character_type in ['male', 'female']:
+            character_requests.append(Ninja.frame_requests(CHARACTER_FOLDER + '/' + character_type))
+        for zombie_type in self.zombies_sprite:
+            character_requests.append(Zombie.frame_requests(ENEMIES_FOLDER + zombie_type))
+        frame_requests = [request for requests in character_requests for request in requests]
+        sprite_steps_shown = 0
+
+        def update_sprite_progress(done, total):
+            nonlocal sprite_steps_shown
+            # Gambar ulang bar hanya setiap 10%, bukan setiap gambar
+            while sprite_steps_shown < sprite_progress_calls and done * sprite_progress_calls >= (sprite_steps_shown + 1) * total:
+                sprite_steps_shown += 1
+                update_progress(f"Memuat gambar karakter... ({done}/{total})")
+
+        registry.preload_frames(frame_requests, update_sprite_progress)
+        while sprite_steps_shown < sprite_progress_calls:  # Semua gambar sudah ada di gudang
+            sprite_steps_shown += 1
+            update_progress("Memuat gambar karakter...")
+
+        # Tempel semua frame setiap karakter ke lembar atlas
+        for requests in character_requests:
+            registry.pack_atlas(requests)
+
         update_progress("Loading game objects and tiles...")
-        self.object = Object(OBJECTS_FOLDER, self.screen, MAX_SCENE, NINJA_SPEED)
+        self.object = Object(OBJECTS_FOLDER, self.screen, MAX_SCENE, NINJA_SPEED, input_source=self.input_source)
 
         update_progress("Generating dynamic zombie positions...")
         # Generate posisi zombie secara dinamis setelah object dimuat
@@ -243,16 +277,14 @@ class GamePlay:
 
         # Update total_items dengan jumlah zombie yang sebenarnya untuk akurasi progress
         actual_zombie_calls = len([i for i in range(len(self.zombie_positions)) if i % 10 == 0 or i == len(self.zombie_positions) - 1])
-        total_items = 7 + actual_zombie_calls + 1  # Update dengan jumlah sebenarnya
+        total_items = 7 + sprite_progress_calls + actual_zombie_calls + 1  # Update dengan jumlah sebenarnya
 
         update_progress("Menginisialisasi sistem game...")
 
         # Preload semua zombie dengan posisi dinamis
         update_progress(f"Memuat zombie... (0/{len(self.zombie_positions)})")
-        for i, x_offset in enumerate(self.zombie_positions):
-            zombie_type = random.choice(self.zombies_sprite)
-            zombie = Zombie(ENEMIES_FOLDER + zombie_type, self.screen, NINJA_GROND, ZOMBIE_SPEED, x_offset, self.add_score)
-            self.zombies.append(zombie)
+        for i, (x_offset, zombie_type) in enumerate(self.zombie_positions):
+            self.add_zombie(x_offset, zombie_type)
 
             # Update progress setiap 10 zombie untuk performa
             if i % 10 == 0 or i == len(self.zombie_positions) - 1:
@@ -287,11 +319,48 @@ class GamePlay:
                         waiting = False
             self.clock.tick(60)
 
+    def release_background_character(self):
+        """Mengembalikan latar pemilihan karakter ke gudang bersama"""
+        if self.background_character_key is not None:
+            registry.release(self.background_character_key)
+            self.background_character_key = None
+        self.background_character_resized = None
+
+    def load_world(self, num_zombies=70, min_distance=80, max_distance=200):
+        """Memuat jalan dan semua zombie tanpa layar loading (dipakai oleh headless.py)
+
+        Parameter zombie sama dengan generate_dynamic_zombie_positions, jadi
+        headless.py bisa mencoba ribuan zombie (lihat zombie_backend 'horde').
+        """
+        self.object = Object(OBJECTS_FOLDER, self.screen, MAX_SCENE, NINJA_SPEED, input_source=self.input_source)
+        self.zombie_positions = self.generate_dynamic_zombie_positions(num_zombies, min_distance, max_distance)
+        self.release_zombies()
+        for x_offset, zombie_type in self.zombie_positions:
+            self.add_zombie(x_offset, zombie_type)
+        self.assets_loaded = True
+
+    def add_zombie(self, x_offset, zombie_type):
+        """Tambahkan satu zombie: sebagai objek Zombie, atau ke gerombolan NumPy (zombie_backend 'horde')"""
+        if self.zombie_backend == 'horde':
+            if self.horde is None:
+                self.horde = ZombieHorde(self.screen, NINJA_GROND, ZOMBIE_SPEED, self.add_score)
+            self.horde.spawn(ENEMIES_FOLDER + zombie_type, x_offset)
+        else:
+            zombie = Zombie(ENEMIES_FOLDER + zombie_type, self.screen, NINJA_GROND, ZOMBIE_SPEED, x_offset, self.add_score)
+            zombie.spawn_order = self.zombies_spawned  # Zombie yang bangun tetap diurutkan seperti saat dibuat
+            self.zombies_spawned += 1
+            self.zombies.append(zombie)
+
     def load_sprites(self, character_type):
+        self.character_type = character_type
+        # Kembalikan gambar ninja lama ke gudang sebelum membuat ninja baru
+        if self.ninja:
+            self.ninja.release_sprites()
+
         if character_type == 'male':
-            self.ninja = Ninja(CHARACTER_FOLDER + '/' + character_type, self.screen, NINJA_GROND, NINJA_SPEED)  # Membuat instance Ninja
+            self.ninja = Ninja(CHARACTER_FOLDER + '/' + character_type, self.screen, NINJA_GROND, NINJA_SPEED, self.input_source)  # Membuat instance Ninja
         else:
-            self.ninja = Ninja(CHARACTER_FOLDER + '/' + character_type, self.screen, NINJA_GROND, NINJA_SPEED)  # Membuat instance Ninja
+            self.ninja = Ninja(CHARACTER_FOLDER + '/' + character_type, self.screen, NINJA_GROND, NINJA_SPEED, self.input_source)  # Membuat instance Ninja
 
     def show_reset_loading_screen(self):
         """🔄 Tampilkan loading screen khusus untuk reset game."""
@@ -367,15 +436,13 @@ class GamePlay:
                     exit()
 
         # Proses pembuatan zombie dengan progress yang terlihat
-        import random
-
         # Regenerate zombie positions
         self.zombie_positions = self.generate_dynamic_zombie_positions()
-        self.zombies = []  # Clear zombie list
+        self.release_zombies()  # Clear zombie list
 
         # Buat ulang semua zombie dengan progress bar
         total_zombies = len(self.zombie_positions)
-        for i, x_offset in enumerate(self.zombie_positions):
+        for i, (x_offset, zombie_type) in enumerate(self.zombie_positions):
             # Hitung progress untuk pembuatan zombie (30% sisanya)
             zombie_progress = 0.7 + (i + 1) / total_zombies * 0.3
 
@@ -422,9 +489,7 @@ class GamePlay:
                 pygame.display.flip()
 
             # Buat zombie
-            zombie_type = random.choice(self.zombies_sprite)
-            zombie = Zombie(ENEMIES_FOLDER + zombie_type, self.screen, NINJA_GROND, ZOMBIE_SPEED, x_offset, self.add_score)
-            self.zombies.append(zombie)
+            self.add_zombie(x_offset, zombie_type)
 
             # Handle events untuk mencegah freeze
             for event in pygame.event.get():
@@ -450,50 +515,113 @@ class GamePlay:
         if not self.ninja:
             return []
 
-        visible_zombies = []
+        # Hanya render zombie yang terlihat di layar dengan buffer
+        left, right = self.visible_range()
+        if self.horde is not None:
+            return self.horde.in_range(left, right)
+        return self.zombie_index.in_range(left, right)
+
+    def visible_range(self):
+        """Rentang relative_x zombie yang terlihat di layar (dengan buffer satu layar)"""
         ninja_x = self.ninja.get_x()
         screen_width = self.screen.get_width()
+        road_x = self.object.get_road_x()  # Posisi layar = road_x + relative_x
+        return ninja_x - screen_width - road_x, ninja_x + screen_width - road_x
 
-        for zombie in self.zombies:
-            zombie_x = zombie.get_x()
-            # Hanya render zombie yang terlihat di layar dengan buffer
-            if zombie_x > ninja_x - screen_width and zombie_x < ninja_x + screen_width:
-                visible_zombies.append(zombie)
+    def zombies_near_rect(self, rect):
+        """Zombie yang gambarnya mungkin menyentuh rect (posisi layar)
 
-        return visible_zombies
+        Gambar zombie digambar di tengah get_x(), jadi cukup mencari zombie
+        yang posisinya tidak lebih jauh dari lebar gambar zombie terbesar.
+        """
+        road_x = self.object.get_road_x()
+        if self.horde is not None:
+            return self.horde.in_range(rect.left - self.zombie_reach - road_x, rect.right + self.zombie_reach - road_x)
+        return self.zombie_index.in_range(rect.left - self.zombie_reach - road_x, rect.right + self.zombie_reach - road_x)
 
     def downfall_action(self):
+        """Ninja atau zombie yang berdiri di atas jurang mulai jatuh (dicek lewat peta jurang)"""
+        chasms = self.object.get_chasms()
         ninja_size_x, _ = self.ninja.get_current_sprite().get_size()
 
-        for idx, x in enumerate(self.object.get_downfall_positions()):
-            block_width = x + self.object.get_road_width()
-
-            if idx + 1 < len(self.object.get_downfall_positions()):
-                if x + self.object.get_road_width() == self.object.get_downfall_positions()[idx + 1]:
-                    block_width = x + (self.object.get_road_width() * 2)
-
-            # Ninja downfall
-            if self.object.get_x() + self.ninja.get_x() >= x  and self.object.get_x() + self.ninja.get_x() <= (block_width - ninja_size_x) and self.ninja.get_y() >= self.ninja_ground:
-                self.object.set_downfall()
-                self.ninja.add_y()
-
-                if self.ninja.get_y() >= self.screen.get_height():
-                    # self.reset()
-                    self.ninja.set_alive(False)
-                    self.ninja.health = 0
-                    break
-
-            # Zombie downfall
-            for i, zombie in enumerate(self.zombies):
-                zombie_size_x, _ = zombie.get_current_sprite().get_size()
-                if zombie.get_relative_x() >= x and zombie.get_relative_x() <= block_width:
-                    if not zombie.is_downfall:
-                        zombie.set_action('Idle')
-                        zombie.set_downfall()
+        # Ninja downfall (ujung kanan jurang dikurangi lebar ninja, jadi ninja bisa berdiri di tepinya)
+        ninja_world_x = self.object.get_x() + self.ninja.get_x()
+        span = chasms.span_at(ninja_world_x)
+        if span and ninja_world_x <= (span[1] - ninja_size_x) and self.ninja.get_y() >= self.ninja_ground:
+            self.object.set_downfall()
+            self.ninja.add_y()
+
+            if self.ninja.get_y() >= self.screen.get_height():
+                # self.reset()
+                self.ninja.set_alive(False)
+                self.ninja.health = 0
+                return
+
+        # Zombie downfall (hanya zombie yang berada di atas jurang)
+        if self.horde is not None:
+            self.horde.set_downfall_over(chasms)
+            return
+        for start, end in chasms.spans():
+            for zombie in self.zombie_index.in_range(start, end):
+                if not zombie.is_downfall:
+                    zombie.set_action('Idle')
+                    zombie.set_downfall()
 
     def remove_dead_zombies(self):
         """Menghapus zombie yang sudah mati dari daftar."""
-        self.zombies = [zombie for zombie in self.zombies if zombie.get_alive() or not zombie.is_ready_to_remove()]
+        if self.horde is not None:
+            self.horde.remove_dead()
+            return
+        remaining_zombies = []
+        for zombie in self.zombies:
+            if zombie.get_alive() or not zombie.is_ready_to_remove():
+                remaining_zombies.append(zombie)
+            else:
+                zombie.release_sprites()  # Kembalikan gambar zombie ke gudang
+        self.zombies = remaining_zombies
+        self.zombie_index.rebuild(self.zombies)
+
+    def release_zombies(self):
+        """Menghapus semua zombie dan mengembalikan gambarnya ke gudang."""
+        for zombie in self.zombies + self.sleeping_zombies.clear():
+            zombie.release_sprites()
+        self.zombies = []
+        self.zombies_spawned = 0
+        self.zombie_index.rebuild(self.zombies)
+        if self.horde is not None:
+            self.horde.release()
+            self.horde = None
+
+    def zombie_sprite_keys(self):
+        """Semua kunci gambar yang dipinjam zombie (bangun, tidur, dan gerombolan)"""
+        keys = []
+        for zombie in self.zombies + self.sleeping_zombies.zombies:
+            keys += zombie.sprite_keys
+        if self.horde is not None:
+            keys += self.horde.sprite_keys
+        return keys
+
+    def update_sleeping_zombies(self):
+        """😴 Bangunkan zombie yang dekat kamera dan tidurkan zombie diam yang jauh
+
+        Hanya zombie yang bangun (self.zombies) yang diperbarui, diperiksa
+        tabrakannya, dan digambar setiap langkah. self.zombies tetap urut
+        menurut spawn_order, sama seperti jika tidak ada zombie yang tidur.
+        """
+        left = -self.object.get_road_x()  # Tepi kiri kamera di jalan
+        right = left + self.screen.get_width()  # Tepi kanan kamera di jalan
+        step = simulation_clock.total_steps  # Langkah simulasi yang sedang berjalan
+        woken = self.sleeping_zombies.wake(left, right, step)
+        if woken:
+            self.zombies = sorted(self.zombies + woken, key=lambda zombie: zombie.spawn_order)
+
+        awake_zombies = []
+        for zombie in self.zombies:
+            if self.sleeping_zombies.can_sleep(zombie, left, right):
+                self.sleeping_zombies.park(zombie, step)
+            else:
+                awake_zombies.append(zombie)
+        self.zombies = awake_zombies
 
     def add_score(self, points=5):
         """🏆 Menambah poin score
@@ -507,56 +635,88 @@ class GamePlay:
         """📊 Mengambil score saat ini"""
         return self.score
 
+    def is_boss_fight_due(self):
+        """Apakah ninja sudah sampai di scene terakhir dan boss belum muncul?"""
+        return self.object.get_scene() >= MAX_SCENE and not self.boss_mode and not self.boss_alert_shown
+
+    def start_boss_fight_if_due(self):
+        """Mulai boss fight di awal langkah simulasi jika ninja sudah sampai scene terakhir
+
+        Dicek per langkah (bukan per frame), jadi game, headless, dan replay
+        memunculkan boss di langkah yang sama persis. Layar peringatan digambar
+        nanti oleh run() setelah langkah selesai.
+
+        Return True jika boss baru saja dimunculkan.
+        """
+        if not self.is_boss_fight_due():
+            return False
+        self.boss_alert_shown = True
+        self.boss_alert_pending = True  # run() menampilkan peringatan setelah langkah ini
+        self.initialize_boss()
+        return True
+
     def initialize_boss(self):
         """👹 Inisialisasi boss fight"""
         if self.boss is None:
             # Buat object baru dengan mode boss (tanpa jurang)
-            self.object = Object(OBJECTS_FOLDER, self.screen, MAX_SCENE, NINJA_SPEED, boss_mode=True)
+            freed_keys = list(self.object.sprite_keys)  # Gambar yang dikembalikan langkah ini
+            self.object.release_sprites()
+            self.object = Object(OBJECTS_FOLDER, self.screen, MAX_SCENE, NINJA_SPEED, boss_mode=True, input_source=self.input_source)
+
+            # Ambil gambar boss yang sudah disiapkan di latar belakang (jika pemuat sudah mulai)
+            self.boss_preloader.finish()
 
             # Buat boss di posisi yang tepat
             boss_init_pos = self.screen.get_width() + 200  # Boss muncul dari kanan
             boss_ground = NINJA_GROND - 30  # Boss lebih tinggi dari ninja (50 pixel ke atas)
-            self.boss = Boss('assets/boss', self.screen, boss_ground, ZOMBIE_SPEED * 0.8, boss_init_pos)
+            self.boss = Boss(BOSS_FOLDER, self.screen, boss_ground, ZOMBIE_SPEED * 0.8, boss_init_pos)
+            registry.pack_atlas(Boss.frame_requests(BOSS_FOLDER, Boss.WARM_ACTIONS))  # Tempel frame boss ke atlas
 
             # Set mode boss
             self.boss_mode = True
 
             # Inisialisasi efek cuaca untuk mode boss
-            self.rain_effect = RainEffect(self.screen.get_width(), self.screen.get_height(), intensity=150)
+            self.rain_effect = RainEffect(self.screen.get_width(), self.screen.get_height(),
+                                          intensity=self.effect_governor.scale(BOSS_RAIN_INTENSITY))
             self.lightning_effect = LightningEffect(self.screen.get_width(), self.screen.get_height(), self.create_ground_explosion)
             self.weather_active = True
 
             # Hapus semua zombie yang tersisa
-            self.zombies = []
+            freed_keys += self.zombie_sprite_keys()
+            self.release_zombies()
+
+            # Buang gambar zombie dari memori karena tidak dipakai di arena boss.
+            # Hanya gambar yang dikembalikan di sini: gambar ninja lain dan layar
+            # pemilihan karakter tetap disimpan untuk dipilih lagi setelah restart.
+            registry.evict_all(freed_keys)
 
     def create_ground_explosion(self, x, y):
         """💥 Buat efek ledakan tanah saat petir menyambar - berhamburan seperti spark"""
         # Buat banyak partikel tanah yang berhamburan dalam jumlah sangat besar
-        particle_count = random.randint(50, 80)  # Jumlah partikel yang sangat banyak
+        particle_count = explosion_random.randint(50, 80)  # Jumlah partikel yang sangat banyak
+
+        # Variasi warna tanah - coklat gelap, coklat muda, dan abu-abu
+        colors = [
+            (101, 67, 33),   # Coklat gelap
+            (139, 69, 19),   # Coklat sedang
+            (160, 82, 45),   # Coklat muda
+            (105, 105, 105), # Abu-abu gelap
+            (128, 128, 128), # Abu-abu terang
+            (87, 59, 12),    # Coklat sangat gelap
+            (205, 133, 63),  # Coklat terang
+            (139, 90, 43)    # Coklat kekuningan
+        ]
 
+        xs, ys, angles, speeds, spark_colors = [], [], [], [], []
         for _ in range(particle_count):
             # Posisi acak di sekitar titik sambaran dengan area yang lebih luas
-            spark_x = x + random.randint(-60, 60)
-            spark_y = y + random.randint(-25, 10)
-
-            # Variasi warna tanah - coklat gelap, coklat muda, dan abu-abu
-            colors = [
-                (101, 67, 33),   # Coklat gelap
-                (139, 69, 19),   # Coklat sedang
-                (160, 82, 45),   # Coklat muda
-                (105, 105, 105), # Abu-abu gelap
-                (128, 128, 128), # Abu-abu terang
-                (87, 59, 12),    # Coklat sangat gelap
-                (205, 133, 63),  # Coklat terang
-                (139, 90, 43)    # Coklat kekuningan
-            ]
-            color = random.choice(colors)
-
-            # Buat spark dengan parameter yang sesuai dengan konstruktor Spark
-            angle = random.uniform(0, 2 * math.pi)  # Arah acak
-            speed = random.uniform(3, 10)  # Kecepatan yang lebih bervariasi
-            spark = Spark([spark_x, spark_y], angle, speed, color)
-            self.sparks.append(spark)
+            xs.append(x + explosion_random.randint(-60, 60))
+            ys.append(y + explosion_random.randint(-25, 10))
+            spark_colors.append(explosion_random.choice(colors))
+            angles.append(explosion_random.uniform(0, 2 * math.pi))  # Arah acak
+            speeds.append(explosion_random.uniform(3, 10))  # Kecepatan yang lebih bervariasi
+
+        self.particles.emit_sparks(xs, ys, angles, speeds, spark_colors)
 
     def show_boss_alert(self):
         """🚨 Tampilkan alert sebelum boss fight"""
@@ -636,15 +796,20 @@ class GamePlay:
         self.boss_mode = False
         self.boss_defeated = False
         self.boss_alert_shown = False
+        self.boss_alert_pending = False
         self.boss = None
 
+        # Pemuat boss baru (gambar yang sudah disiapkan tetap ada di gudang)
+        self.boss_preloader.cancel()
+        self.boss_preloader = BossArenaPreloader(BOSS_FOLDER)
+
         # Reset efek cuaca
         self.weather_active = False
         self.rain_effect = None
         self.lightning_effect = None
 
         # Reset efek visual
-        self.sparks = []
+        self.particles.clear()
         self.explosions = []
 
         # Reset status serangan
@@ -653,8 +818,6 @@ class GamePlay:
         self.zombie_attack_time = 0
 
         # Reset timer dan state variables
-        self.now = 0
-        self.last_update = 0
         self.blink_start_time = pygame.time.get_ticks()
         self.show_instruction = True
 
@@ -662,7 +825,9 @@ class GamePlay:
         # Tidak perlu membuat zombie di sini lagi untuk menghindari jeda
 
         pygame.display.update()
-        self.update_frame()
+        # Bukan langkah simulasi: hanya samakan posisi lama dan baru untuk interpolasi
+        self.save_previous_state()
+        simulation_clock.reset()  # Waktu menunggu di layar game over tidak ikut disimulasikan
 
     def hit_ninja(self, zombie, ninja):
         """Cek jika zombie menabrak ninja."""
@@ -671,8 +836,8 @@ class GamePlay:
 
         if ninja_sprite and zombie_sprite:
             # Sesuaikan posisi collision box dengan posisi visual sprite yang di-center
-            zombie_rect = zombie_sprite.get_rect(topleft=(zombie.get_x() - zombie_sprite.get_width() // 2, zombie.get_y()))
-            ninja_rect = ninja_sprite.get_rect(topleft=(ninja.get_x(), ninja.get_y()))
+            zombie_rect = zombie.get_current_rect()
+            ninja_rect = ninja.get_current_rect()
 
             # Perluas area serangan zombie untuk deteksi yang lebih konsisten
             attack_buffer = 20  # Buffer tambahan untuk jangkauan serangan
@@ -701,45 +866,43 @@ class GamePlay:
                 self.zombie_is_hit = False
 
     def hit_zombie(self, zombies, ninja):
-        """Deteksi tabrakan dengan semua zombie."""
-        for zombie in zombies:
-            ninja_rect = ninja.get_current_sprite().get_rect(topleft=(ninja.get_x(), ninja.get_y()))
-            zombie_sprite = zombie.get_current_sprite()
-            zombie_rect = zombie_sprite.get_rect(topleft=(zombie.get_x() - zombie_sprite.get_width() // 2, zombie.get_y()))
-
-            if ninja_rect.colliderect(zombie_rect):
-                if ninja.current_action in ['Jump_Attack'] and zombie.get_alive():
-                    self.spark_zombie_blood(zombie)
-                    # zombie.set_dead()
-                    zombie.damage('Double')
-                if ninja.current_action in ['Attack'] and zombie.get_alive():
-                    self.spark_zombie_blood(zombie)
-                    # zombie.set_dead()
-                    zombie.damage()
+        """Deteksi tabrakan ninja dengan zombie (zombies: zombie di dekat ninja, lihat zombies_near_rect)."""
+        for _, zombie in sweep_pairs([ninja], zombies):
+            if ninja.current_action in ['Jump_Attack'] and zombie.get_alive():
+                self.spark_zombie_blood(zombie)
+                # zombie.set_dead()
+                zombie.damage('Double')
+            if ninja.current_action in ['Attack'] and zombie.get_alive():
+                self.spark_zombie_blood(zombie)
+                # zombie.set_dead()
+                zombie.damage()
 
         self.remove_dead_zombies()
 
-    def hit_zombie_kunais(self, zombies, ninja):
-        """Deteksi tabrakan kunai dengan zombie."""
-        for zombie in zombies:
-            for kunai in ninja.kunais:
-                kunai_rect = kunai.get_current_sprite().get_rect(topleft=(kunai.get_x(), kunai.get_y()))
-                zombie_sprite = zombie.get_current_sprite()
-                zombie_rect = zombie_sprite.get_rect(topleft=(zombie.get_x() - zombie_sprite.get_width() // 2, zombie.get_y()))
-
-                if kunai_rect.colliderect(zombie_rect):
-                    if zombie.get_alive():
-                        self.spark_zombie_blood(zombie)
-                        # zombie.set_dead()
-                        zombie.damage('Kunai')
-
-                        if kunai in ninja.kunais:
-                            ninja.kunais.remove(kunai)
+    def hit_zombie_kunais(self, ninja):
+        """Deteksi tabrakan kunai dengan zombie (hanya pasangan yang bertumpuk, lihat collision.py)."""
+        if ninja.kunais:
+            kunais = list(ninja.kunais)
+            kunai_area = kunais[0].get_current_rect().unionall([kunai.get_current_rect() for kunai in kunais[1:]])
+            spent = []  # Kunai yang sudah mengenai zombie
+            for kunai, zombie in sweep_pairs(kunais, self.zombies_near_rect(kunai_area)):
+                if kunai in spent or not zombie.get_alive():
+                    continue
+                self.spark_zombie_blood(zombie)
+                # zombie.set_dead()
+                zombie.damage('Kunai')
+                ninja.kunais.remove(kunai)  # Satu kunai hanya mengenai satu zombie
+                spent.append(kunai)
 
-        self.remove_dead_zombies
+        self.remove_dead_zombies()
 
     def spark_zombie_blood(self, zombie):
         """Buat sparks darah saat ninja menyerang zombie."""
+        if self.blood_splashes_left is not None:
+            if self.blood_splashes_left <= 0:
+                return  # Batas percikan langkah ini sudah habis (lihat update_horde)
+            self.blood_splashes_left -= 1
+
         direction = 1 if zombie.facing_left else -1  # Arah berdasarkan orientasi zombie
 
         # Warna darah dengan variasi untuk efek realistis
@@ -754,19 +917,19 @@ class GamePlay:
         ]
 
         # Tambah jumlah partikel untuk efek yang lebih dramatis
-        for _ in range(random.randint(15, 25)):
+        xs, ys, angles, speeds, scales, colors = [], [], [], [], [], []
+        for _ in range(blood_random.randint(15, 25)):
             # Sudut yang lebih lebar untuk efek percikan yang lebih natural
-            angle = random.uniform(-math.pi / 3, math.pi / 3)
-            speed = random.uniform(3, 8)  # Kecepatan yang lebih bervariasi
-            scale = random.uniform(0.8, 3.0)  # Ukuran partikel yang lebih bervariasi
-            color = random.choice(blood_colors)  # Pilih warna darah
+            angles.append(blood_random.uniform(-math.pi / 3, math.pi / 3))
+            speeds.append(blood_random.uniform(3, 8))  # Kecepatan yang lebih bervariasi
+            scales.append(blood_random.uniform(0.8, 3.0))  # Ukuran partikel yang lebih bervariasi
+            colors.append(blood_random.choice(blood_colors))  # Pilih warna darah
 
             # Posisi spawn yang lebih tersebar untuk efek percikan natural
-            spawn_x = zombie.get_x() + random.randint(35, 55)
-            spawn_y = zombie.get_y() + random.randint(50, 70)
+            xs.append(zombie.get_x() + blood_random.randint(35, 55))
+            ys.append(zombie.get_y() + blood_random.randint(50, 70))
 
-            spark = Spark([spawn_x, spawn_y], angle, speed, color, scale=scale, direction=direction)
-            self.sparks.append(spark)
+        self.particles.emit_sparks(xs, ys, angles, speeds, colors, scales, direction)
 
     def spark_boss_blood(self, boss):
         """Buat sparks darah saat ninja menyerang boss."""
@@ -784,20 +947,20 @@ class GamePlay:
         ]
 
         # Lebih banyak partikel untuk boss karena lebih besar
-        for _ in range(random.randint(20, 30)):
+        boss_sprite = boss.get_current_sprite()
+        xs, ys, angles, speeds, scales, colors = [], [], [], [], [], []
+        for _ in range(blood_random.randint(20, 30)):
             # Sudut yang lebih lebar untuk efek percikan yang lebih natural
-            angle = random.uniform(-math.pi / 3, math.pi / 3)
-            speed = random.uniform(4, 10)  # Kecepatan lebih tinggi untuk boss
-            scale = random.uniform(1.0, 4.0)  # Ukuran partikel lebih besar untuk boss
-            color = random.choice(blood_colors)  # Pilih warna darah
+            angles.append(blood_random.uniform(-math.pi / 3, math.pi / 3))
+            speeds.append(blood_random.uniform(4, 10))  # Kecepatan lebih tinggi untuk boss
+            scales.append(blood_random.uniform(1.0, 4.0))  # Ukuran partikel lebih besar untuk boss
+            colors.append(blood_random.choice(blood_colors))  # Pilih warna darah
 
             # Posisi spawn yang lebih tersebar untuk efek percikan natural
-            boss_sprite = boss.get_current_sprite()
-            spawn_x = boss.get_x() + random.randint(40, boss_sprite.get_width() - 40)
-            spawn_y = boss.get_y() + random.randint(60, boss_sprite.get_height() - 20)
+            xs.append(boss.get_x() + blood_random.randint(40, boss_sprite.get_width() - 40))
+            ys.append(boss.get_y() + blood_random.randint(60, boss_sprite.get_height() - 20))
 
-            spark = Spark([spawn_x, spawn_y], angle, speed, color, scale=scale, direction=direction)
-            self.sparks.append(spark)
+        self.particles.emit_sparks(xs, ys, angles, speeds, colors, scales, direction)
 
     def get_distance(self, point1, point2):
         """Menghitung jarak antara dua titik (x, y)."""
@@ -805,18 +968,10 @@ class GamePlay:
         x2, y2 = point2
         return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
 
-    def find_nearest_zombie(self, ninja, zombies):
-        """Temukan zombie terdekat dengan ninja."""
-        nearest_zombie_index = -1
-        min_distance = float('inf')
-
-        for index, zombie in enumerate(zombies):
-            distance = self.get_distance((ninja.get_x(), ninja.get_y()), (zombie.get_x(), zombie.get_y()))
-            if distance < min_distance:
-                min_distance = distance
-                nearest_zombie_index = index
-
-        return nearest_zombie_index
+    def find_nearest_zombie(self, ninja):
+        """Temukan zombie terdekat dengan ninja (nomor di self.zombies, atau -1 jika tidak ada)."""
+        # self.zombies adalah daftar yang sama dengan zombie_index.zombies, jadi nomornya sama
+        return self.zombie_index.nearest(ninja.get_x() - self.object.get_road_x(), ninja.get_y())
 
     def reset_attacking_zombies_out_of_range(self):
         """Reset zombie yang sedang menyerang tapi tidak lagi dalam jangkauan ninja."""
@@ -827,8 +982,8 @@ class GamePlay:
 
                 if ninja_sprite and zombie_sprite:
                     # Sesuaikan posisi collision box dengan posisi visual sprite yang di-center
-                    zombie_rect = zombie_sprite.get_rect(topleft=(zombie.get_x() - zombie_sprite.get_width() // 2, zombie.get_y()))
-                    ninja_rect = ninja_sprite.get_rect(topleft=(self.ninja.get_x(), self.ninja.get_y()))
+                    zombie_rect = zombie.get_current_rect()
+                    ninja_rect = self.ninja.get_current_rect()
 
                     # Perluas area serangan zombie untuk deteksi yang lebih konsisten
                     attack_buffer = 20  # Buffer tambahan untuk jangkauan serangan
@@ -847,8 +1002,8 @@ class GamePlay:
         boss_sprite = boss.get_current_sprite()
 
         if ninja_sprite and boss_sprite:
-            ninja_rect = ninja_sprite.get_rect(topleft=(ninja.get_x(), ninja.get_y()))
-            boss_rect = boss_sprite.get_rect(topleft=(boss.get_x(), boss.get_y()))
+            ninja_rect = ninja.get_current_rect()
+            boss_rect = boss.get_current_rect()
 
             # Cek collision untuk serangan ninja
             if ninja.current_action in ['Attack', 'Jump_Attack'] and ninja_rect.colliderect(boss_rect):
@@ -875,10 +1030,10 @@ class GamePlay:
         if not boss_sprite:
             return
 
-        boss_rect = boss_sprite.get_rect(topleft=(boss.get_x(), boss.get_y()))
+        boss_rect = boss.get_current_rect()
 
         for kunai in ninja.kunais[:]:
-            kunai_rect = kunai.get_current_sprite().get_rect(topleft=(kunai.get_x(), kunai.get_y()))
+            kunai_rect = kunai.get_current_rect()
 
             if kunai_rect.colliderect(boss_rect):
                 boss.damage(15)  # Kunai damage ke boss
@@ -896,8 +1051,8 @@ class GamePlay:
         ninja_sprite = ninja.get_current_sprite()
 
         if ninja_sprite and boss_sprite:
-            boss_rect = boss_sprite.get_rect(topleft=(boss.get_x(), boss.get_y()))
-            ninja_rect = ninja_sprite.get_rect(topleft=(ninja.get_x(), ninja.get_y()))
+            boss_rect = boss.get_current_rect()
+            ninja_rect = ninja.get_current_rect()
 
             # Buffer untuk serangan boss
             attack_buffer = 30
@@ -919,10 +1074,9 @@ class GamePlay:
                     spark_x = ninja.get_x() + ninja_sprite.get_width() // 2
                     spark_y = ninja.get_y() + ninja_sprite.get_height() // 2
                     for _ in range(6):
-                        angle = random.uniform(0, 2 * math.pi)  # Arah acak
-                        speed = random.uniform(2, 5)  # Kecepatan acak
-                        spark = Spark([spark_x, spark_y], angle, speed, (255, 0, 0))
-                        self.sparks.append(spark)
+                        angle = blood_random.uniform(0, 2 * math.pi)  # Arah acak
+                        speed = blood_random.uniform(2, 5)  # Kecepatan acak
+                        self.particles.emit_spark(spark_x, spark_y, angle, speed, (255, 0, 0))
             else:
                 # Reset flag ketika tidak ada collision atau boss tidak sedang menyerang
                 if boss.current_action not in ['Slashing', 'Throwing', 'Run Slashing']:
@@ -937,7 +1091,7 @@ class GamePlay:
         if not ninja_sprite:
             return
 
-        ninja_rect = ninja_sprite.get_rect(topleft=(ninja.get_x(), ninja.get_y()))
+        ninja_rect = ninja.get_current_rect()
 
         # Cek collision dengan semua projectile boss
         for projectile in boss.get_projectiles()[:]:
@@ -954,11 +1108,11 @@ class GamePlay:
                     explosion_y = ninja.get_y() + ninja_sprite.get_height() // 2
 
                     # Buat efek ledakan
-                    explosion = Explosion(explosion_x, explosion_y, 60)
+                    explosion = Explosion(explosion_x, explosion_y, self.particles, 60)
                     self.explosions.append(explosion)
 
                     # Buat spark effect tambahan
-                    self.sparks.append(Spark([explosion_x, explosion_y], 0, 5, (255, 0, 0)))
+                    self.particles.emit_spark(explosion_x, explosion_y, 0, 5, (255, 0, 0))
 
                     # Hapus projectile
                     boss.remove_projectile(projectile)
@@ -966,7 +1120,86 @@ class GamePlay:
                     # Hanya satu projectile yang bisa hit per frame
                     break
 
+    def save_previous_state(self):
+        """Ingat posisi semua yang bergerak sebelum langkah simulasi (untuk interpolasi)"""
+        self.object.save_previous_state()
+        self.ninja.save_previous_state()
+        if self.boss_mode and self.boss:
+            self.boss.save_previous_state()
+        elif self.horde is not None:
+            self.horde.save_previous_state()
+        else:
+            for zombie in self.zombies:
+                zombie.save_previous_state()
+
+    def simulation_step(self):
+        """🧮 Satu langkah simulasi: boss, gravitasi, gerakan, tabrakan, efek, dan jurang"""
+        self.start_boss_fight_if_due()  # Cek trigger boss fight berdasarkan scene terakhir
+        self.save_previous_state()
+        self.ninja.update_physics()  # Gravitasi ninja (dulu dijalankan saat menggambar)
+        self.update_frame()
+
+        # Cek downfall (ninja atau zombie jatuh ke jurang)
+        self.downfall_action()
+        simulation_clock.finish_step()
+        if self.recorder is not None:
+            self.recorder.record_hash(self.state_hash())
+
+    def update_horde(self):
+        """🧟 Satu langkah untuk gerombolan NumPy (sama seperti bagian zombie di update_frame)
+
+        Semua zombie diperbarui sekaligus; hanya zombie di dekat ninja yang
+        dibuatkan ZombieView untuk diperiksa tabrakannya.
+        """
+        road_x = self.object.get_road_x()
+        self.horde.update_frame(road_x, abs(road_x - self.ninja.get_x()), self.object.get_chasms())
+
+        # Di gerombolan rapat satu serangan bisa mengenai puluhan zombie sekaligus:
+        # batasi percikan darah (hanya hiasan) agar partikel tidak menumpuk ribuan
+        self.blood_splashes_left = HORDE_BLOOD_SPLASHES
+        self.hit_zombie(self.zombies_near_rect(self.ninja.get_current_rect()), self.ninja)
+        self.hit_zombie_kunais(self.ninja)
+        self.blood_splashes_left = None
+
+        nearest_zombie = self.horde.nearest(self.ninja.get_x(), self.ninja.get_y())
+        if nearest_zombie is not None:
+            self.hit_ninja(nearest_zombie, self.ninja)
+
+        # Reset zombie yang sedang menyerang tapi tidak lagi dalam jangkauan
+        self.horde.reset_attacking_out_of_range(self.ninja.get_current_rect())
+
+    def state_hash(self):
+        """🔎 Sidik jari (crc32) keadaan game saat ini
+
+        Dua permainan yang keadaannya sama persis punya sidik jari yang sama.
+        replay.py membandingkan sidik jari setiap langkah untuk menemukan
+        langkah pertama saat replay mulai berbeda dari rekaman.
+        Percikan dan efek hiasan lain tidak dihitung, karena jumlahnya diatur
+        oleh effect_governor sesuai kecepatan komputer. Zombie yang tidur ikut
+        dihitung (animasinya dikejar dulu), jadi sidik jari sama dengan atau
+        tanpa zombie yang tidur.
+        """
+        ninja = self.ninja
+        self.sleeping_zombies.catch_up(simulation_clock.total_steps)
+        zombies = sorted(self.zombies + self.sleeping_zombies.zombies, key=lambda zombie: zombie.spawn_order)
+        state = [
+            self.score, self.boss_mode, self.object.get_x(), self.object.road_x, self.object.get_scene(),
+            ninja.x, ninja.y, ninja.vel_y, ninja.current_action, ninja.current_frame,
+            ninja.facing_left, ninja.health, ninja.alive,
+            [(kunai.x, kunai.y) for kunai in ninja.kunais],
+            [(zombie.relative_x, zombie.y, zombie.current_action, zombie.current_frame,
+              zombie.health, zombie.alive, zombie.is_downfall) for zombie in zombies],
+            zlib.crc32(self.horde.state_bytes()) if self.horde is not None else 0,
+            len(self.explosions),
+        ]
+        if self.boss:
+            boss = self.boss
+            state.append((boss.relative_x, boss.y, boss.current_action, boss.current_frame, boss.health,
+                          boss.alive, [(projectile.x, projectile.y) for projectile in boss.projectiles]))
+        return zlib.crc32(repr(state).encode())
+
     def update_frame(self):
+        """Perbarui logika game satu langkah (tanpa menggambar)"""
         self.ninja.update_frame()
         self.ninja.update_kunais()
 
@@ -987,31 +1220,33 @@ class GamePlay:
                 self.add_score(100)  # Bonus score untuk mengalahkan boss
                 # Nonaktifkan efek cuaca saat boss dikalahkan
                 self.weather_active = False
+        elif self.horde is not None:
+            self.update_horde()
         else:
-            # Update zombie normal
+            # Update zombie normal (zombie yang tidur dilewati)
+            self.update_sleeping_zombies()
             for zombie in self.zombies:
                 zombie.update_frame(self.object.get_road_x(), abs(self.object.get_road_x() - self.ninja.get_x()), self.zombies,
-                                  self.object.get_downfall_positions(), self.object.get_road_width())
+                                  self.object.get_chasms())
 
-            self.hit_zombie(self.zombies, self.ninja)
-            self.hit_zombie_kunais(self.zombies, self.ninja)
+            self.zombie_index.rebuild(self.zombies)  # Zombie sudah bergerak: urutkan lagi
+            self.hit_zombie(self.zombies_near_rect(self.ninja.get_current_rect()), self.ninja)
+            self.hit_zombie_kunais(self.ninja)
 
-            nearest_zombie_index = self.find_nearest_zombie(self.ninja, self.zombies)
+            nearest_zombie_index = self.find_nearest_zombie(self.ninja)
             if nearest_zombie_index != -1:
                 self.hit_ninja(self.zombies[nearest_zombie_index], self.ninja)
 
             # Reset zombie yang sedang menyerang tapi tidak lagi dalam jangkauan
             self.reset_attacking_zombies_out_of_range()
 
-        for spark in self.sparks:
-            spark.velocity_adjust(1, 0.2, 8, 1)
-            spark.move(5)
+        # Update semua percikan dan serpihan ledakan sekaligus
+        self.particles.update()
 
         # Update explosions
-        for explosion in self.explosions[:]:
+        for explosion in self.explosions:
             explosion.update()
-            if not explosion.is_alive():
-                self.explosions.remove(explosion)
+        self.explosions = [explosion for explosion in self.explosions if explosion.is_alive()]
 
         # Update efek cuaca saat mode boss
         if self.boss_mode and self.weather_active:
@@ -1023,29 +1258,117 @@ class GamePlay:
         # Update efek shadow bergerak
         if self.shadow_effect:
             # Atur intensitas berdasarkan jumlah zombie
-            zombie_count = len([z for z in self.zombies if z.get_alive()])
+            zombie_count = len([z for z in self.zombies if z.get_alive()]) + len(self.sleeping_zombies)
+            if self.horde is not None:
+                zombie_count += self.horde.alive_count()
             self.shadow_effect.create_horror_atmosphere(zombie_count)
             self.shadow_effect.update()
 
         # Update efek partikel abu gelap
         if self.ash_effect:
-            dt = self.clock.get_time() / 1000.0  # Delta time dalam detik
-            self.ash_effect.update(dt)
+            self.ash_effect.update(simulation_clock.step_seconds)  # Satu langkah = 1/60 detik
 
         self.object.update_frame(self.ninja)
-        self.event_handler()
 
-        self.last_update = self.now
-        pygame.display.update()  # Update layar
-        self.clock.tick(FPS)  # Batasi FPS game loop
+    def draw_frame(self, alpha):
+        """🖼️ Gambar satu frame layar
+
+        alpha: seberapa jauh waktu sekarang di antara langkah simulasi sebelumnya (0)
+        dan langkah terakhir (1), agar gerakan tetap halus walau layar lebih cepat dari simulasi.
+        Fungsi ini hanya menggambar, tidak mengubah keadaan game.
+        """
+        self.screen.fill((0, 0, 0))
+
+        # Gambar objek latar belakang
+        self.object.draw(self.screen, alpha)
+
+        # Gambar ninja
+        self.ninja.draw(self.screen, alpha)
+
+        # Gambar health bar ninja
+        self.ninja.draw_health_bar()
+
+        # Tampilkan skor di pojok kanan atas
+        score_text = self.font_small.render(f"Score: {self.score}", True, (255, 255, 255))
+        score_rect = score_text.get_rect(topright=(self.screen.get_width() - 20, 20))
+        self.screen.blit(score_text, score_rect)
+
+        # Gambar explosions
+        for explosion in self.explosions:
+            explosion.draw(self.screen)
+
+        # Gambar sparks dan serpihan ledakan
+        self.particles.draw(self.screen)
+
+        # Gambar boss atau zombie berdasarkan mode
+        if self.boss_mode and self.boss:
+            self.boss.draw(alpha)
+            self.boss.draw_health_bar()
+        else:
+            # Gambar zombie yang terlihat di layar
+            if self.horde is not None:
+                self.horde.draw_range(*self.visible_range(), alpha)  # Ribuan zombie: satu kali blits
+            else:
+                for zombie in self.get_visible_zombies():
+                    zombie.draw(alpha)
+
+        # Gambar efek cuaca saat mode boss (diperbarui sekali per langkah di update_frame)
+        if self.boss_mode and self.weather_active:
+            if self.rain_effect:
+                self.rain_effect.draw(self.screen)
+            if self.lightning_effect:
+                self.lightning_effect.draw(self.screen)
+
+        # Gambar efek shadow bergerak
+        if self.shadow_effect:
+            self.shadow_effect.draw(self.screen)
+
+        # Gambar efek partikel abu gelap
+        if self.ash_effect:
+            self.ash_effect.draw(self.screen)
+
+        # Tampilkan red overlay jika ninja baru terkena serangan
+        current_time = pygame.time.get_ticks()
+        if (self.zombie_attack_time > 0 and
+            current_time - self.zombie_attack_time < self.zombie_attack_duration):
+            self.screen.blit(self.red_overlay, (0, 0))
 
     def event_handler(self):
-        for event in pygame.event.get():
+        events = self.input_source.get_events()
+        if self.recorder is not None:
+            self.recorder.record_events(simulation_clock.total_steps, self.input_source.get_pressed(), events)
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F9:
+                self.dump_memory_report()  # F9 = cetak laporan memori gambar
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F10:
+                print(f"Efek hiasan: {self.effect_governor.status()}")  # F10 = cetak tingkat efek hiasan
             else:
                 self.ninja.event_handler(event)
 
+    def apply_effect_quality(self):
+        """🎚️ Terapkan tingkat efek hiasan dari effect_governor ke semua efek hiasan
+
+        Hanya hiasan yang diatur (percikan, hujan, abu, daun); zombie, boss,
+        kunai, dan proyektil tidak pernah dikurangi.
+        """
+        quality = self.effect_governor.quality
+        self.particles.emit_fraction = quality
+        if self.rain_effect:
+            self.rain_effect.set_intensity(self.effect_governor.scale(BOSS_RAIN_INTENSITY))
+        if self.ash_effect:
+            self.ash_effect.set_intensity(quality)
+        self.object.leaf_effect.set_intensity(quality)
+
+    def dump_memory_report(self):
+        """🧠 Cetak laporan memori gambar per bagian game ke terminal"""
+        report = memory_report.build_report(self, registry)
+        print(report.format())
+        for subsystem, used, budget in report.check_budgets():
+            print(f"PERINGATAN: {subsystem} memakai {used / memory_report.MB:.2f} MB, batasnya {budget / memory_report.MB:.2f} MB")
+        return report
+
     def show_start_screen(self):
         """Menampilkan halaman start game."""
         # Load background untuk start screen jika belum dimuat
@@ -1190,93 +1513,70 @@ class GamePlay:
         # Uncomment baris di bawah untuk langsung test boss
         # self.initialize_boss()
 
+        if self.recorder is not None:
+            seed_session(self.recorder.seed)  # Rekaman hanya bisa diputar ulang dengan benih yang sama
+            self.recorder.start(self.character_type, simulation_clock.total_steps)
+
+        # Game loop dengan langkah simulasi tetap:
+        # 1. baca tombol, 2. jalankan langkah simulasi sebanyak waktu yang berlalu,
+        # 3. gambar satu frame di antara dua langkah terakhir (interpolasi)
+        simulation_clock.reset()
         while self.running:
-            self.now = pygame.time.get_ticks()
-            if self.now - self.last_update > 1000 / FPS:
-                self.screen.fill((0, 0, 0))
-
-                # Cek trigger boss fight berdasarkan scene terakhir
-                current_scene = self.object.get_scene()
-                if current_scene >= MAX_SCENE and not self.boss_mode and not self.boss_alert_shown:
-                    self.show_boss_alert()
-                    self.boss_alert_shown = True
-                    self.initialize_boss()
-
-                # Gambar objek latar belakang
-                self.object.draw(self.screen)
-
-                # Gambar ninja
-                self.ninja.draw(self.screen)
-
-                # Gambar health bar ninja
-                self.ninja.draw_health_bar()
-
-                # Tampilkan skor di pojok kanan atas
-                score_text = self.font_small.render(f"Score: {self.score}", True, (255, 255, 255))
-                score_rect = score_text.get_rect(topright=(self.screen.get_width() - 20, 20))
-                self.screen.blit(score_text, score_rect)
-
-                # Gambar sparks
-                for spark in self.sparks[:]:
-                    spark.draw(self.screen)
-                    if not spark.alive:
-                        self.sparks.remove(spark)
-
-                # Gambar explosions
-                for explosion in self.explosions:
-                    explosion.draw(self.screen)
-
-                # Gambar boss atau zombie berdasarkan mode
-                if self.boss_mode and self.boss:
-                    self.boss.draw()
-                    self.boss.draw_health_bar()
-
-                    # Cek apakah boss sudah dikalahkan
-                    if self.boss_defeated:
-                        self.show_victory_screen()
-                        break
-                else:
-                    # Gambar semua zombie
-                    for zombie in self.zombies:
-                        zombie.draw()
-
-                # Update dan gambar efek cuaca saat mode boss
-                if self.boss_mode and self.weather_active:
-                    # Update efek hujan
-                    if self.rain_effect:
-                        self.rain_effect.update()
-                        self.rain_effect.draw(self.screen)
-
-                    # Update efek petir
-                    if self.lightning_effect:
-                        self.lightning_effect.update()
-                        self.lightning_effect.draw(self.screen)
-
-                # Gambar efek shadow bergerak
-                if self.shadow_effect:
-                    self.shadow_effect.draw(self.screen)
-
-                # Gambar efek partikel abu gelap
-                if self.ash_effect:
-                    self.ash_effect.draw(self.screen)
-
-                # Tampilkan red overlay jika ninja baru terkena serangan
-                current_time = pygame.time.get_ticks()
-                if (self.zombie_attack_time > 0 and
-                    current_time - self.zombie_attack_time < self.zombie_attack_duration):
-                    self.screen.blit(self.red_overlay, (0, 0))
-
-                # Update frame
-                self.update_frame()
-
-                # Cek downfall (ninja atau zombie jatuh ke jurang)
-                self.downfall_action()
-
-                # Cek apakah ninja mati
-                if not self.ninja.get_alive():
-                    self.show_game_over_screen()
-                    # Jika self.running masih True setelah game over screen, lanjutkan game
-                    if not self.running:
-                        break
+            self.event_handler()
+
+            current_scene = self.object.get_scene()
+
+            # Mulai siapkan arena boss saat ninja sudah dekat scene terakhir
+            if not self.boss_mode:
+                if current_scene >= MAX_SCENE - BOSS_PRELOAD_SCENES and not self.boss_preloader.is_started():
+                    self.boss_preloader.start()
+                self.boss_preloader.poll()
+
+            # Jalankan langkah simulasi yang tertinggal (paling banyak MAX_SIMULATION_STEPS)
+            for _ in range(simulation_clock.advance()):
+                self.simulation_step()
+                if self.boss_alert_pending:
+                    break  # Boss baru muncul: tampilkan peringatan dulu
+
+            if self.boss_alert_pending:
+                self.show_boss_alert()
+                self.boss_alert_pending = False
+                simulation_clock.reset()  # Waktu peringatan boss tidak ikut disimulasikan
+
+            # Cek apakah boss sudah dikalahkan
+            if self.boss_mode and self.boss and self.boss_defeated:
+                self.finish_recording()
+                self.show_victory_screen()
+                break
+
+            # Cek apakah ninja mati
+            if not self.ninja.get_alive():
+                self.finish_recording()  # Rekaman hanya berisi permainan pertama
+                self.show_game_over_screen()
+                # Jika self.running masih True setelah game over screen, lanjutkan game
+                if not self.running:
+                    break
+                continue
+
+            self.draw_frame(simulation_clock.get_alpha())
+            pygame.display.update()  # Tampilkan frame di layar
+            self.clock.tick(RENDER_FPS)  # Batasi gambar per detik (simulasi tetap SIMULATION_FPS)
 
+            # Waktu kerja frame ini (tanpa waktu menunggu) menentukan tingkat efek hiasan
+            self.effect_governor.record_frame(self.clock.get_rawtime())
+            self.apply_effect_quality()  # Juga untuk efek yang baru dibuat (misalnya daun setelah restart)
+
+        self.finish_recording()
+        self.release_background_character()
         pygame.quit()
+
+    def finish_recording(self):
+        """💾 Simpan rekaman tombol (jika sedang merekam) lalu berhenti merekam"""
+        if self.recorder is None or not self.recorder.is_recording():
+            return
+        try:
+            self.recorder.save()
+            print(f"Rekaman disimpan: {self.recorder.path} ({len(self.recorder.hashes)} langkah)")
+        except OSError as e:
+            print(f"Gagal menyimpan rekaman {self.recorder.path}: {e}")
+        self.recorder = None
@@ -0,0 +1,231 @@
+# File untuk menjalankan game tanpa jendela (headless), secepat mungkin
+# Game dimainkan oleh "pilot otomatis": tombol ditekan oleh program, bukan oleh tangan.
+# Tidak ada yang digambar, jadi satu permainan penuh (20 scene + boss) selesai dalam hitungan detik.
+# Berguna untuk tes di server dan untuk mencari error yang jarang muncul (soak test).
+#
+# Cara memakai: python3 headless.py                   (ninja laki-laki, maksimal 20000 langkah)
+#               python3 headless.py female 50000      (ninja perempuan, maksimal 50000 langkah)
+#               python3 headless.py --invincible      (ninja tidak bisa terluka oleh musuh)
+#               python3 headless.py --horde=5000      (5000 zombie dalam array NumPy, lihat zombie_horde.py)
+#               python3 headless.py --seed=1234       (benih sesi tetap: hasil yang sama bisa diulang)
+#               python3 headless.py --check-sleep     (zombie tidur dan tanpa tidur harus sama persis)
+
+import os, sys, time, random  # Library untuk pengaturan, perintah, waktu, dan angka acak
+os.environ['SDL_VIDEODRIVER'] = 'dummy'  # Layar palsu: tidak ada jendela yang dibuka
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')  # Tidak perlu suara
+import pygame  # Library untuk membuat game
+from gameplay import GamePlay  # Otak permainan
+from input_source import ScriptedInput  # Tombol yang ditekan oleh program
+from game_clock import simulation_clock  # Jam simulasi dengan langkah tetap
+from game_random import seed_session  # Benih untuk semua aliran angka acak
+from zombie_sleep import SleepingZombies  # Tempat tidur zombie (untuk --check-sleep)
+from constants import MAX_SCENE, SIMULATION_FPS  # Jumlah scene dan langkah per detik
+
+class Autopilot:
+    """Kelas Autopilot - Pemain otomatis yang sederhana
+
+    Setiap langkah, pilot melihat keadaan game lalu menekan tombol:
+    - Tahan D untuk berlari ke kanan
+    - Lompat (W) lalu melayang (J) saat jurang sudah dekat
+    - Lempar kunai (L) atau serang (K) saat musuh ada di depan
+    - Di arena boss: berhenti, menghadap boss, dan terus menyerang
+    """
+    def __init__(self, input_source, jump_distance=40, throw_interval=20):
+        """Membuat pilot untuk sebuah ScriptedInput
+
+        Parameter:
+        - input_source: ScriptedInput yang dipakai game
+        - jump_distance: Jarak (pixel) ke jurang saat mulai melompat
+        - throw_interval: Jeda (langkah) antar lemparan kunai
+        """
+        self.input = input_source
+        self.jump_distance = jump_distance
+        self.throw_interval = throw_interval
+        self.cooldown = 0  # Langkah sampai boleh menyerang lagi
+
+    def steer_over_chasms(self, game):
+        """Lompat dan melayang melewati jurang di depan ninja"""
+        ninja = game.ninja
+        world_x = game.object.get_x() + ninja.get_x()  # Posisi ninja di dunia
+        ninja_width = ninja.get_current_sprite().get_width()
+        ahead = [span for span in game.object.get_chasms().spans() if span[1] > world_x]
+        if not ahead:
+            self.input.release(pygame.K_j)
+            return
+        start, end = ahead[0]
+
+        if ninja.on_ground and 0 <= start - world_x <= self.jump_distance:
+            self.input.tap(pygame.K_w)  # Lompat!
+        elif ninja.current_action == 'Jump' and pygame.K_j not in self.input.held:
+            self.input.press(pygame.K_j)  # Melayang agar bisa menyeberangi jurang lebar
+        elif ninja.current_action == 'Glide' and world_x > end - ninja_width // 2:
+            self.input.release(pygame.K_j)  # Sudah lewat jurang: turun
+        elif ninja.current_action not in ('Jump', 'Glide'):
+            self.input.release(pygame.K_j)
+
+    def attack_enemy(self, game, enemy_x, facing_left):
+        """Serang musuh di depan: pukul jika dekat, lempar kunai jika jauh"""
+        ninja = game.ninja
+        if self.cooldown > 0 or not ninja.on_ground or ninja.facing_left != facing_left:
+            return
+        distance = abs(enemy_x - ninja.get_x())
+        if distance < 120:
+            self.input.tap(pygame.K_k)
+            self.cooldown = self.throw_interval // 2
+        elif distance < game.screen.get_width() // 2:
+            self.input.tap(pygame.K_l)
+            self.cooldown = self.throw_interval
+
+    def update(self, game):
+        """Pilih tombol untuk langkah berikutnya"""
+        self.cooldown = max(0, self.cooldown - 1)
+        ninja = game.ninja
+        if game.boss_mode and game.boss:
+            # Arena boss: dekati boss, lalu berhenti, menghadap boss, dan menyerang
+            self.input.release(pygame.K_j)
+            boss_center = game.boss.get_x() + game.boss.get_current_sprite().get_width() // 2
+            boss_on_left = boss_center < ninja.get_x()
+            if not boss_on_left and boss_center - ninja.get_x() > game.screen.get_width() // 3:
+                self.input.press(pygame.K_d)
+                return
+            self.input.release(pygame.K_d)
+            if ninja.facing_left != boss_on_left and ninja.on_ground:
+                self.input.tap(pygame.K_a if boss_on_left else pygame.K_d)  # Balik badan
+            self.attack_enemy(game, boss_center, boss_on_left)
+            return
+
+        self.input.press(pygame.K_d)
+        self.steer_over_chasms(game)
+        ahead = [zombie.get_x() for zombie in game.get_visible_zombies()
+                 if zombie.get_alive() and zombie.get_x() > ninja.get_x()]
+        if ahead:
+            self.attack_enemy(game, min(ahead), False)
+
+class HeadlessRunner:
+    """Kelas HeadlessRunner - Menjalankan langkah simulasi berturut-turut tanpa menggambar"""
+    def __init__(self, character_type='male', invincible=False, horde_size=None, seed=None, sleep=True):
+        """Menyiapkan game tanpa layar loading, menu, maupun jendela
+
+        Parameter:
+        - character_type: 'male' atau 'female'
+        - invincible: True agar nyawa ninja dipulihkan setiap langkah (jurang tetap berbahaya)
+        - horde_size: Jumlah zombie dalam gerombolan NumPy (None = zombie biasa)
+        - seed: Benih sesi untuk semua aliran angka acak (None = benih acak, dicetak di hasil)
+        - sleep: False agar tidak ada zombie yang ditidurkan (pembanding untuk check_sleep)
+        """
+        self.input = ScriptedInput()
+        self.autopilot = Autopilot(self.input)
+        self.invincible = invincible
+        self.game = GamePlay(self.input)
+        if not sleep:
+            self.game.sleeping_zombies = SleepingZombies(float('inf'))  # Jendela tanpa batas: semua zombie bangun
+        if horde_size:
+            # Zombie sangat rapat (1-2 pixel) agar ribuan zombie muat di jalan
+            self.game.zombie_backend = 'horde'
+            self.game.load_world(horde_size, min_distance=1, max_distance=2)
+        else:
+            self.game.load_world()
+        self.game.load_sprites(character_type)
+        # Benih diberikan setelah game siap (sama seperti replay.py), jadi benih yang sama = permainan yang sama
+        self.seed = random.randrange(2 ** 31) if seed is None else seed
+        seed_session(self.seed)
+
+    def run(self, max_steps=20000, hashes=None):
+        """Jalankan simulasi sampai boss kalah, ninja mati, atau max_steps habis
+
+        hashes: Daftar untuk menampung state_hash setiap langkah (None = tidak dicatat)
+
+        Return kamus hasil: langkah, waktu, langkah per detik, scene, skor, dan status akhir.
+        """
+        game = self.game
+        start_ticks = simulation_clock.get_ticks()
+        boss_step = None
+        start = time.perf_counter()
+        steps = 0
+        while steps < max_steps and game.running:
+            self.autopilot.update(game)
+            game.event_handler()  # Kejadian dari ScriptedInput
+            game.simulation_step()  # Boss dimunculkan di dalam langkah (tanpa layar peringatan)
+            if game.boss_mode and boss_step is None:
+                boss_step = steps
+            steps += 1
+            if hashes is not None:
+                hashes.append(game.state_hash())
+
+            if self.invincible:
+                game.ninja.health = 100
+            if game.boss_defeated or not game.ninja.get_alive():
+                break
+        elapsed = time.perf_counter() - start
+
+        if game.boss_defeated:
+            outcome = 'boss dikalahkan'
+        elif not game.ninja.get_alive():
+            outcome = 'ninja mati'
+        else:
+            outcome = 'langkah habis'
+        return {
+            'steps': steps,
+            'simulated_seconds': (simulation_clock.get_ticks() - start_ticks) / 1000,
+            'wall_seconds': elapsed,
+            'steps_per_second': steps / elapsed if elapsed > 0 else 0.0,
+            'realtime_factor': steps / SIMULATION_FPS / elapsed if elapsed > 0 else 0.0,
+            'scene': MAX_SCENE if game.boss_mode else game.object.get_scene(),
+            'boss_step': boss_step,
+            'score': game.get_score(),
+            'outcome': outcome,
+            'seed': self.seed,
+        }
+
+def format_result(result):
+    """Membuat teks hasil yang mudah dibaca"""
+    boss_text = 'belum' if result['boss_step'] is None else f"langkah {result['boss_step']}"
+    return (f"{result['outcome']}: {result['steps']} langkah "
+            f"({result['simulated_seconds']:.1f} detik game) dalam {result['wall_seconds']:.2f} detik\n"
+            f"{result['steps_per_second']:.0f} langkah simulasi per detik "
+            f"({result['realtime_factor']:.1f}x lebih cepat dari game asli)\n"
+            f"scene {result['scene']}/{MAX_SCENE}, boss: {boss_text}, skor {result['score']}\n"
+            f"benih sesi {result['seed']} (ulangi dengan --seed={result['seed']})")
+
+def check_sleep(character_type='male', max_steps=20000, seed=None):
+    """Mainkan game yang sama dua kali, dengan dan tanpa zombie yang tidur
+
+    Zombie yang tidur harus bangun seperti tidak pernah tidur, jadi sidik jari
+    (state_hash) setiap langkah harus sama. Return (jumlah langkah, langkah
+    pertama yang berbeda atau None, benih sesi).
+    """
+    if seed is None:
+        seed = random.randrange(2 ** 31)
+    runs = []
+    for sleep in (True, False):
+        simulation_clock.total_steps = 0  # Kedua permainan mulai dari waktu simulasi yang sama
+        hashes = []
+        HeadlessRunner(character_type, seed=seed, sleep=sleep).run(max_steps, hashes)
+        runs.append(hashes)
+    divergence = next((step for step, (slept, awake) in enumerate(zip(*runs)) if slept != awake), None)
+    if divergence is None and len(runs[0]) != len(runs[1]):
+        divergence = min(len(runs[0]), len(runs[1]))
+    return len(runs[0]), divergence, seed
+
+if __name__ == '__main__':
+    arguments = [argument for argument in sys.argv[1:] if not argument.startswith('--')]
+    character_type = arguments[0] if arguments else 'male'
+    max_steps = int(arguments[1]) if len(arguments) > 1 else 20000
+    horde_size = None
+    seed = None
+    for argument in sys.argv[1:]:
+        if argument.startswith('--horde='):
+            horde_size = int(argument.split('=', 1)[1])
+        elif argument.startswith('--seed='):
+            seed = int(argument.split('=', 1)[1])
+    if '--check-sleep' in sys.argv:
+        steps, divergence, seed = check_sleep(character_type, max_steps, seed)
+        if divergence is None:
+            print(f"zombie tidur cocok: {steps} langkah sama persis (benih sesi {seed})")
+        else:
+            print(f"zombie tidur BERBEDA mulai langkah {divergence} (benih sesi {seed})")
+        pygame.quit()
+        sys.exit(0 if divergence is None else 1)
+    runner = HeadlessRunner(character_type, invincible='--invincible' in sys.argv, horde_size=horde_size, seed=seed)
+    print(format_result(runner.run(max_steps)))
+    pygame.quit()
@@ -0,0 +1,88 @@
+# File untuk merekam tombol yang ditekan pemain (input recording)
+# Setiap kali game membaca kejadian tombol, perekam mencatat nomor langkah simulasi,
+# tombol yang sedang ditahan, dan kejadian tombolnya. Setelah setiap langkah,
+# perekam juga mencatat "sidik jari" keadaan game. Rekaman ini bisa diputar ulang
+# oleh replay.py dan hasilnya harus persis sama, langkah demi langkah.
+
+import json, random, pygame  # Library untuk file JSON, angka acak, dan game
+
+RECORDING_VERSION = 4  # Naikkan jika isi file rekaman berubah
+WATCHED_KEYS = (pygame.K_a, pygame.K_d)  # Tombol yang dibaca game lewat get_pressed()
+RECORDED_EVENTS = (pygame.KEYDOWN, pygame.KEYUP, pygame.QUIT)  # Kejadian yang dipakai event_handler
+
+class InputRecorder:
+    """Kelas InputRecorder - Perekam tombol dan sidik jari keadaan game
+
+    Rekaman hanya menyimpan frame yang punya kejadian baru atau tombol tahan yang
+    berubah, jadi ukurannya kecil. Formatnya:
+    frames = [[langkah, [tombol ditahan], [[jenis kejadian, tombol], ...]], ...]
+    hashes = [sidik jari setelah langkah 0, setelah langkah 1, ...]
+    """
+    def __init__(self, path, seed=None):
+        """Membuat perekam yang akan menyimpan hasilnya ke path
+
+        seed: Benih sesi untuk semua aliran angka acak (default: dipilih acak)
+        """
+        self.path = path                # File tujuan rekaman
+        self.seed = seed if seed is not None else random.randrange(2 ** 31)  # Benih sesi (lihat game_random.py)
+        self.character_type = None      # Ninja yang dipilih ('male' atau 'female')
+        self.start_step = None          # Nomor langkah simulasi saat rekaman dimulai
+        self.frames = []                # Kejadian tombol per langkah
+        self.hashes = []                # Sidik jari keadaan setelah setiap langkah
+        self.held = []                  # Tombol tahan yang terakhir dicatat
+
+    def is_recording(self):
+        """Apakah perekam sedang merekam?"""
+        return self.start_step is not None
+
+    def start(self, character_type, start_step):
+        """Mulai merekam dari langkah simulasi start_step"""
+        self.character_type = character_type
+        self.start_step = start_step
+
+    def record_events(self, step, pressed, events):
+        """Catat kejadian yang dibaca game sebelum langkah simulasi step"""
+        if not self.is_recording():
+            return
+        held = [key for key in WATCHED_KEYS if pressed[key]]
+        recorded = [[event.type, getattr(event, 'key', 0)] for event in events if event.type in RECORDED_EVENTS]
+        if recorded or held != self.held:
+            self.frames.append([step - self.start_step, held, recorded])
+            self.held = held
+
+    def record_hash(self, state_hash):
+        """Catat sidik jari keadaan game setelah satu langkah simulasi"""
+        if self.is_recording():
+            self.hashes.append(state_hash)
+
+    def save(self):
+        """Simpan rekaman ke file JSON"""
+        recording = {
+            'version': RECORDING_VERSION,
+            'character': self.character_type,
+            'seed': self.seed,
+            'start_step': self.start_step,
+            'frames': self.frames,
+            'hashes': self.hashes,
+        }
+        with open(self.path, 'w') as file:
+            json.dump(recording, file, separators=(',', ':'))
+
+def load_recording(path):
+    """Membuka file rekaman yang disimpan oleh InputRecorder.save()"""
+    with open(path) as file:
+        recording = json.load(file)
+    if recording.get('version') != RECORDING_VERSION:
+        raise ValueError(f"Versi rekaman {recording.get('version')} tidak didukung (butuh {RECORDING_VERSION})")
+    return recording
+
+def frame_events(frame):
+    """Mengubah satu frame rekaman menjadi (tombol ditahan, daftar pygame.event.Event)"""
+    _, held, recorded = frame
+    events = []
+    for event_type, key in recorded:
+        if event_type == pygame.QUIT:
+            events.append(pygame.event.Event(event_type))
+        else:
+            events.append(pygame.event.Event(event_type, key=key))
+    return held, events
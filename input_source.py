@@ -0,0 +1,57 @@
+# File untuk sumber input game (keyboard asli atau tombol "pura-pura")
+# Ninja dan jalan bertanya ke sumber input, bukan langsung ke keyboard.
+# Dengan begitu game bisa dimainkan oleh program (misalnya untuk tes) tanpa jendela.
+
+import collections, pygame  # Library untuk kamus dengan nilai bawaan dan game
+
+class KeyboardInput:
+    """Kelas KeyboardInput - Input dari keyboard sungguhan (dipakai saat bermain biasa)"""
+    def get_pressed(self):
+        """Tombol yang sedang ditekan, contoh: keys[pygame.K_d] -> True/False"""
+        return pygame.key.get_pressed()
+
+    def get_events(self):
+        """Semua kejadian baru (tombol ditekan/dilepas, jendela ditutup)"""
+        return pygame.event.get()
+
+class ScriptedInput:
+    """Kelas ScriptedInput - Tombol yang ditekan oleh program, bukan oleh tangan
+
+    Seperti remote control: program memanggil press() dan release(),
+    lalu game membaca tombol itu seolah-olah dari keyboard.
+    """
+    def __init__(self):
+        """Membuat input kosong (belum ada tombol yang ditekan)"""
+        self.held = set()  # Tombol yang sedang ditahan
+        self.pending = []  # Kejadian yang belum dibaca game
+
+    def press(self, key):
+        """Tekan dan tahan sebuah tombol (contoh: press(pygame.K_d))"""
+        if key not in self.held:
+            self.held.add(key)
+            self.pending.append(pygame.event.Event(pygame.KEYDOWN, key=key))
+
+    def release(self, key):
+        """Lepaskan tombol yang sedang ditahan"""
+        if key in self.held:
+            self.held.discard(key)
+            self.pending.append(pygame.event.Event(pygame.KEYUP, key=key))
+
+    def load(self, held, events):
+        """Ganti semua tombol yang ditahan dan kejadian yang menunggu (dipakai saat memutar rekaman)"""
+        self.held = set(held)
+        self.pending = list(events)
+
+    def tap(self, key):
+        """Tekan lalu langsung lepaskan sebuah tombol"""
+        self.press(key)
+        self.release(key)
+
+    def get_pressed(self):
+        """Tombol yang sedang ditahan (tombol lain bernilai False)"""
+        return collections.defaultdict(bool, dict.fromkeys(self.held, True))
+
+    def get_events(self):
+        """Ambil semua kejadian yang belum dibaca, lalu kosongkan antreannya"""
+        events, self.pending = self.pending, []
+        return events
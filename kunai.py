@@ -1,6 +1,8 @@
 # File untuk senjata kunai ninja
 # Kunai adalah pisau lempar yang digunakan ninja untuk menyerang zombie
 
+from game_clock import lerp  # Menggambar di antara dua langkah simulasi
+
 class Kunai:
     """Kelas Kunai - Cetakan untuk membuat senjata ninja
     
@@ -19,6 +21,7 @@ class Kunai:
         """
         self.image = image    # Gambar kunai
         self.x = x           # Posisi kiri-kanan kunai
+        self.prev_x = x      # Posisi di langkah simulasi sebelumnya
         self.y = y           # Posisi atas-bawah kunai
         self.speed = speed   # Seberapa cepat kunai terbang
         self.screen = screen # Layar game
@@ -45,21 +48,27 @@ class Kunai:
         """
         return self.image
 
+    def get_current_rect(self):
+        """Mendapatkan kotak tabrakan kunai di posisi saat ini"""
+        return self.image.get_rect(topleft=(self.x, self.y))
+
     def update(self):
         """Menggerakkan kunai setiap frame
         
         Fungsi ini membuat kunai terbang ke kanan dan menghilang
         jika sudah keluar dari layar.
         """
+        self.prev_x = self.x  # Ingat posisi lama untuk menggambar halus
         self.x += self.speed  # Gerakkan kunai ke arah kanan
         
         # Cek apakah kunai sudah keluar dari layar
         if self.x > self.screen.get_width() or self.x < -50:
             self.active = False  # Matikan kunai karena sudah hilang
     
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         """Menggambar kunai di layar
         
         Fungsi ini menampilkan gambar kunai di posisi yang tepat.
+        alpha: posisi gambar di antara langkah sebelumnya (0) dan langkah terakhir (1)
         """
-        screen.blit(self.image, (self.x, self.y))  # Tempel gambar kunai
+        screen.blit(self.image, (lerp(self.prev_x, self.x, alpha), self.y))  # Tempel gambar kunai
@@ -2,8 +2,10 @@
 # File ini mengatur efek daun yang jatuh dari pohon dan bergerak dengan angin
 
 import pygame
-import random
 import math
+from game_random import random_streams
+
+leaf_random = random_streams.get('leaves')  # Angka acak khusus daun
 
 class Leaf:
     """Kelas untuk satu daun yang beterbangan"""
@@ -16,16 +18,16 @@ class Leaf:
         self.screen_height = screen_height
 
         # Properti gerakan daun
-        self.fall_speed = random.uniform(0.5, 2.0)  # Kecepatan jatuh
-        self.wind_speed = random.uniform(-1.0, 1.0)  # Kecepatan angin horizontal
-        self.swing_amplitude = random.uniform(10, 30)  # Amplitudo ayunan
-        self.swing_frequency = random.uniform(0.02, 0.05)  # Frekuensi ayunan
-        self.time = random.uniform(0, 2 * math.pi)  # Waktu untuk ayunan
+        self.fall_speed = leaf_random.uniform(0.5, 2.0)  # Kecepatan jatuh
+        self.wind_speed = leaf_random.uniform(-1.0, 1.0)  # Kecepatan angin horizontal
+        self.swing_amplitude = leaf_random.uniform(10, 30)  # Amplitudo ayunan
+        self.swing_frequency = leaf_random.uniform(0.02, 0.05)  # Frekuensi ayunan
+        self.time = leaf_random.uniform(0, 2 * math.pi)  # Waktu untuk ayunan
 
         # Properti visual daun
-        self.size = random.randint(3, 8)  # Ukuran daun
-        self.rotation = random.uniform(0, 360)  # Rotasi awal
-        self.rotation_speed = random.uniform(-2, 2)  # Kecepatan rotasi
+        self.size = leaf_random.randint(3, 8)  # Ukuran daun
+        self.rotation = leaf_random.uniform(0, 360)  # Rotasi awal
+        self.rotation_speed = leaf_random.uniform(-2, 2)  # Kecepatan rotasi
 
         # Warna daun (variasi musim gugur)
         colors = [
@@ -37,10 +39,10 @@ class Leaf:
             (205, 133, 63),  # Peru
             (222, 184, 135), # Burlywood
         ]
-        self.color = random.choice(colors)
+        self.color = leaf_random.choice(colors)
 
         # Transparansi
-        self.alpha = random.randint(180, 255)
+        self.alpha = leaf_random.randint(180, 255)
 
     def update(self):
         """Update posisi dan rotasi daun"""
@@ -61,7 +63,7 @@ class Leaf:
         # Reset daun jika keluar dari layar
         if self.y > self.screen_height + 50:
             self.y = -50
-            self.x = random.randint(-50, self.screen_width + 50)
+            self.x = leaf_random.randint(-50, self.screen_width + 50)
 
         if self.x < -100:
             self.x = self.screen_width + 50
@@ -99,16 +101,16 @@ class LeafEffect:
 
         # Buat beberapa daun awal
         for _ in range(15):
-            x = random.randint(0, screen_width)
-            y = random.randint(-screen_height, 0)
+            x = leaf_random.randint(0, screen_width)
+            y = leaf_random.randint(-screen_height, 0)
             self.leaves.append(Leaf(x, y, screen_width, screen_height))
 
     def add_leaf_from_tree(self, tree_x, tree_y):
         """Tambahkan daun yang jatuh dari pohon tertentu"""
         if len(self.leaves) < self.max_leaves:
             # Tambahkan sedikit variasi posisi dari pohon
-            x = tree_x + random.randint(-20, 20)
-            y = tree_y + random.randint(-10, 10)
+            x = tree_x + leaf_random.randint(-20, 20)
+            y = tree_y + leaf_random.randint(-10, 10)
             self.leaves.append(Leaf(x, y, self.screen_width, self.screen_height))
 
     def update(self, tree_positions=None):
@@ -118,14 +120,14 @@ class LeafEffect:
             leaf.update()
 
         # Spawn daun baru dari pohon jika ada
-        if tree_positions and random.random() < self.spawn_rate:
+        if tree_positions and leaf_random.random() < self.spawn_rate:
             for tree_pos in tree_positions:
-                if random.random() < 0.1:  # 10% chance per pohon
+                if leaf_random.random() < 0.1:  # 10% chance per pohon
                     self.add_leaf_from_tree(tree_pos['x'], tree_pos['y'])
 
         # Spawn daun random dari atas layar
-        if len(self.leaves) < self.max_leaves and random.random() < self.spawn_rate * 0.5:
-            x = random.randint(-50, self.screen_width + 50)
+        if len(self.leaves) < self.max_leaves and leaf_random.random() < self.spawn_rate * 0.5:
+            x = leaf_random.randint(-50, self.screen_width + 50)
             y = -50
             self.leaves.append(Leaf(x, y, self.screen_width, self.screen_height))
 
@@ -134,7 +136,11 @@ class LeafEffect:
         for leaf in self.leaves:
             leaf.draw(screen)
 
+    def set_intensity(self, intensity):
+        """Atur banyaknya daun (0.0 - 1.0, 1.0 = 30 daun)"""
+        self.max_leaves = int(30 * intensity)
+
     def set_wind_strength(self, strength):
         """Atur kekuatan angin untuk semua daun"""
         for leaf in self.leaves:
-            leaf.wind_speed = random.uniform(-strength, strength)
+            leaf.wind_speed = leaf_random.uniform(-strength, strength)
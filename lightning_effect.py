@@ -1,4 +1,8 @@
-import pygame, random, math  # Library untuk game, random, dan matematika
+import pygame, math  # Library untuk game dan matematika
+from game_random import random_streams  # Aliran angka acak per bagian game
+
+lightning_random = random_streams.get('lightning')  # Kapan dan di mana petir menyambar
+flicker_random = random_streams.get('lightning_flicker')  # Ketebalan petir saat digambar
 
 class Lightning:
     """Kelas untuk satu kilatan petir"""
@@ -7,7 +11,7 @@ class Lightning:
         self.screen_height = screen_height
         self.active = False
         self.duration = 0
-        self.max_duration = random.randint(3, 8)  # Frame durasi kilatan
+        self.max_duration = lightning_random.randint(3, 8)  # Frame durasi kilatan
         self.branches = []
         self.flash_alpha = 0
         
@@ -19,7 +23,7 @@ class Lightning:
         self.branches = []
         
         # Buat cabang-cabang petir
-        num_branches = random.randint(3, 6)
+        num_branches = lightning_random.randint(3, 6)
         for _ in range(num_branches):
             branch = self._create_branch()
             self.branches.append(branch)
@@ -27,7 +31,7 @@ class Lightning:
     def _create_branch(self):
         """Buat satu cabang petir"""
         # Titik awal dari atas layar
-        start_x = random.randint(100, self.screen_width - 100)
+        start_x = lightning_random.randint(100, self.screen_width - 100)
         start_y = 0
         
         points = [(start_x, start_y)]
@@ -35,11 +39,11 @@ class Lightning:
         current_y = start_y
         
         # Buat jalur zigzag ke bawah
-        segments = random.randint(8, 15)
+        segments = lightning_random.randint(8, 15)
         for i in range(segments):
             # Gerakan ke bawah dengan variasi horizontal
-            current_y += random.randint(30, 60)
-            current_x += random.randint(-40, 40)
+            current_y += lightning_random.randint(30, 60)
+            current_x += lightning_random.randint(-40, 40)
             
             # Batasi agar tidak keluar layar
             current_x = max(50, min(self.screen_width - 50, current_x))
@@ -84,7 +88,7 @@ class Lightning:
                 for i in range(len(branch) - 1):
                     # Warna putih terang untuk petir
                     color = (255, 255, 255)
-                    thickness = random.randint(2, 4)
+                    thickness = flicker_random.randint(2, 4)  # Aliran sendiri: menggambar tidak mengubah urutan petir
                     
                     pygame.draw.line(screen, color, branch[i], branch[i + 1], thickness)
                     
@@ -107,7 +111,7 @@ class LightningEffect:
         self.screen_height = screen_height
         self.lightning = Lightning(screen_width, screen_height)
         self.next_strike_time = 0
-        self.strike_interval = random.randint(120, 300)  # Frame antara petir (2-5 detik di 60fps)
+        self.strike_interval = lightning_random.randint(120, 300)  # Frame antara petir (2-5 detik di 60fps)
         
         # Callback untuk efek ledakan tanah
         self.ground_explosion_callback = ground_explosion_callback
@@ -123,7 +127,7 @@ class LightningEffect:
         if self.next_strike_time >= self.strike_interval and not self.lightning.active:
             self.lightning.trigger()
             self.next_strike_time = 0
-            self.strike_interval = random.randint(120, 300)  # Reset interval
+            self.strike_interval = lightning_random.randint(120, 300)  # Reset interval
             self.thunder_ready = True
             
             # Trigger efek ledakan tanah jika callback tersedia
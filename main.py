@@ -4,7 +4,9 @@
 # Dibuat khusus untuk belajar programming dengan cara yang menyenangkan
 
 # Import (mengambil) kode permainan dari file lain
+import sys
 from gameplay import GamePlay
+from input_recording import InputRecorder
 
 def main():
     """Fungsi utama untuk memulai permainan
@@ -12,8 +14,14 @@ def main():
     Fungsi ini seperti tombol 'START' pada game!
     Ketika kita tekan, permainan akan dimulai.
     """
+    # Rekam permainan jika diminta: python3 main.py --record rekaman.json
+    # (putar ulang dengan: python3 replay.py rekaman.json)
+    recorder = None
+    if '--record' in sys.argv[1:-1]:
+        recorder = InputRecorder(sys.argv[sys.argv.index('--record') + 1])
+
     # Membuat objek permainan baru (seperti menyiapkan papan permainan)
-    game = GamePlay()
+    game = GamePlay(recorder=recorder)
     
     # Menjalankan permainan (mulai bermain!)
     game.run()
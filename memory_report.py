@@ -0,0 +1,162 @@
+# File untuk laporan pemakaian memori gambar (memory report)
+# File ini menelusuri semua objek game yang masih hidup, mencari semua Surface
+# (gambar), lalu menghitung berapa byte memori yang dipakai setiap bagian game
+
+import types, zlib, pygame  # Library untuk jenis objek, sidik jari cepat (crc32), dan game
+from constants import MEMORY_BUDGETS_MB  # Batas memori per bagian game
+
+MB = 1024 * 1024  # 1 megabyte dalam byte
+DEFAULT_BUDGETS = {subsystem: megabytes * MB for subsystem, megabytes in MEMORY_BUDGETS_MB.items()}  # Batas dalam byte
+
+def surface_bytes(surface):
+    """Jumlah byte pixel sebuah Surface
+
+    Subsurface (misalnya frame di atlas) hanya "jendela" ke Surface induknya,
+    jadi yang dihitung hanya luas jendelanya (lebar x tinggi x byte per pixel).
+    """
+    if surface.get_parent() is not None:
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+    return surface.get_pitch() * surface.get_height()
+
+def surface_view(surface):
+    """Tanda pengenal pixel sebuah Surface: (induk asli, posisi, ukuran)
+
+    Dua Surface dengan tanda yang sama memakai memori pixel yang sama persis.
+    """
+    return (id(surface.get_abs_parent()), surface.get_abs_offset(), surface.get_size())
+
+class MemoryReport:
+    """Kelas MemoryReport - Buku catatan pemakaian memori gambar
+
+    Setiap pixel hanya dihitung sekali, oleh pemilik pertama yang ditemukan.
+    Pemilik berikutnya (misalnya zombie ke-2 yang meminjam gambar yang sama)
+    dicatat sebagai pemakai bersama dengan 0 byte tambahan.
+    """
+    def __init__(self):
+        """Membuat laporan kosong"""
+        self.rows = []          # Daftar (subsistem, pemilik, byte)
+        self.counted = {}       # Tanda pixel -> pemilik pertama
+        self.surfaces = {}      # Tanda pixel -> Surface (untuk mencari gambar kembar)
+        self.shared_count = 0   # Jumlah Surface yang dipakai bersama (tidak dihitung ulang)
+
+    def add_surface(self, subsystem, owner, surface):
+        """Mencatat satu Surface milik subsistem/pemilik tertentu"""
+        view = surface_view(surface)  # Memori pixel yang dipakai Surface ini
+        if view in self.counted:
+            self.shared_count += 1
+            return
+        self.counted[view] = owner
+        self.surfaces[view] = surface
+        self.rows.append((subsystem, owner, surface_bytes(surface)))
+
+    def total_bytes(self):
+        """Total byte semua gambar"""
+        return sum(size for _, _, size in self.rows)
+
+    def by_subsystem(self):
+        """Total byte per subsistem (nama kelas), contoh: {'Zombie': 3600000}"""
+        totals = {}
+        for subsystem, _, size in self.rows:
+            totals[subsystem] = totals.get(subsystem, 0) + size
+        return totals
+
+    def by_owner(self):
+        """Total byte per pemilik, contoh: {'GamePlay.zombies[0].actions[Walk]': 800000}"""
+        totals = {}
+        for _, owner, size in self.rows:
+            totals[owner] = totals.get(owner, 0) + size
+        return totals
+
+    def find_duplicates(self):
+        """Mencari gambar kembar: Surface berbeda dengan pixel yang persis sama
+
+        Return daftar (byte terbuang, ukuran, daftar pemilik), yang terbesar dulu.
+        """
+        groups = {}
+        for view, surface in self.surfaces.items():
+            fingerprint = (surface.get_size(), zlib.crc32(pygame.image.tobytes(surface, 'RGBA')))
+            groups.setdefault(fingerprint, []).append(view)
+
+        duplicates = []
+        for (size, _), views in groups.items():
+            if len(views) > 1:
+                wasted = sum(surface_bytes(self.surfaces[view]) for view in views[1:])
+                owners = [self.counted[view] for view in views]
+                duplicates.append((wasted, size, owners))
+        return sorted(duplicates, key=lambda duplicate: duplicate[0], reverse=True)
+
+    def check_budgets(self, budgets=DEFAULT_BUDGETS):
+        """Membandingkan pemakaian memori dengan batas (budget) per subsistem
+
+        budgets: {'Zombie': byte, ...} (default: MEMORY_BUDGETS_MB di constants.py)
+        Return daftar (subsistem, byte dipakai, byte batas) yang melewati batas.
+        """
+        totals = self.by_subsystem()
+        return [(subsystem, totals.get(subsystem, 0), budget)
+                for subsystem, budget in budgets.items() if totals.get(subsystem, 0) > budget]
+
+    def format(self, top=15, budgets=DEFAULT_BUDGETS, duplicates=True):
+        """Membuat teks laporan yang mudah dibaca"""
+        lines = [f"=== Memori gambar: {self.total_bytes() / MB:.2f} MB "
+                 f"({len(self.rows)} surface, {self.shared_count} dipakai bersama) ==="]
+        lines.append("-- Per subsistem --")
+        for subsystem, size in sorted(self.by_subsystem().items(), key=lambda item: item[1], reverse=True):
+            budget_text = ''
+            if budgets and subsystem in budgets:
+                status = 'LEWAT BATAS!' if size > budgets[subsystem] else 'ok'
+                budget_text = f"  (batas {budgets[subsystem] / MB:.2f} MB, {status})"
+            lines.append(f"{size / MB:9.2f} MB  {subsystem}{budget_text}")
+        lines.append(f"-- {top} pemilik terbesar --")
+        for owner, size in sorted(self.by_owner().items(), key=lambda item: item[1], reverse=True)[:top]:
+            lines.append(f"{size / MB:9.2f} MB  {owner}")
+        if duplicates:
+            found = self.find_duplicates()
+            lines.append(f"-- Gambar kembar: {len(found)} kelompok, "
+                         f"{sum(wasted for wasted, _, _ in found) / MB:.2f} MB terbuang --")
+            for wasted, size, owners in found[:top]:
+                lines.append(f"{wasted / MB:9.2f} MB  {size[0]}x{size[1]} x{len(owners)}: {', '.join(sorted(set(owners))[:3])}")
+        return '\n'.join(lines)
+
+def walk(value, subsystem, owner, report, visited, depth=0, max_depth=8):
+    """Menelusuri isi sebuah nilai (objek, list, dict) untuk mencari Surface
+
+    Seperti memeriksa isi setiap laci dan kotak di dalam lemari!
+    """
+    if isinstance(value, pygame.Surface):
+        report.add_surface(subsystem, owner, value)
+        return
+    if depth > max_depth or isinstance(value, (str, bytes, int, float, bool, type(None))):
+        return
+    if id(value) in visited:
+        return
+    visited.add(id(value))
+
+    if isinstance(value, dict):
+        for key, item in value.items():
+            walk(item, subsystem, f"{owner}[{key}]", report, visited, depth + 1, max_depth)
+    elif isinstance(value, (list, tuple)):
+        # Daftar frame animasi dan pasangan (kanan, kiri) cukup memakai nama gerakannya
+        is_frames = isinstance(value, tuple) or (value and isinstance(value[0], tuple))
+        for index, item in enumerate(value):
+            item_owner = owner if is_frames else f"{owner}[{index}]"
+            walk(item, subsystem, item_owner, report, visited, depth + 1, max_depth)
+    elif hasattr(value, '__dict__') and not isinstance(value, (type, types.ModuleType, types.FunctionType)):
+        # Objek game: subsistem = nama kelasnya
+        for name, item in vars(value).items():
+            walk(item, type(value).__name__, f"{owner}.{name}", report, visited, depth + 1, max_depth)
+
+def build_report(game, registry=None):
+    """Membuat laporan memori dari objek game (biasanya GamePlay) yang masih hidup
+
+    Gambar yang dipakai karakter dihitung atas nama karakternya.
+    Jika registry diberikan, gambar di gudang yang tidak dipinjam siapa pun
+    dihitung sebagai 'AssetRegistry'.
+    Fungsi ini bisa dipanggil dari tes untuk memeriksa batas memori.
+    """
+    report = MemoryReport()
+    visited = set()
+    walk(game, type(game).__name__, type(game).__name__, report, visited)
+    if registry is not None:
+        for key, entry in registry.entries.items():
+            walk(entry, 'AssetRegistry', f"AssetRegistry{list(key[1:])}", report, visited)
+    return report
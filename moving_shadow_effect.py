@@ -1,8 +1,11 @@
 # File untuk efek vignette gelap
 # Efek ini membuat tepi layar menjadi gelap untuk atmosfer horor
 
+import os
 import pygame
 import math
+import numpy
+from constants import BAKE_FOLDER
 
 class MovingShadowEffect:
     """Kelas untuk mengatur efek vignette gelap"""
@@ -18,63 +21,113 @@ class MovingShadowEffect:
         # Properti vignette
         self.vignette_radius = min(screen_width, screen_height) * 0.6
         self.max_alpha = 120  # Transparansi maksimal tepi
+        self.edge_alpha = 180  # Alpha paling gelap di tepi layar
+        self.vignette_color = (5, 5, 10)  # Warna gelap vignette
+        self.outer_radius_scale = 1.2  # Radius luar = jarak pusat ke pojok x 1.2
+        self.inner_radius_ratio = 0.4  # Area tengah yang tetap terang (40% radius luar)
         
         # Optimasi: cache untuk menghindari regenerasi
         self.last_alpha = 0
         self.update_threshold = 10  # Minimal perubahan alpha untuk update
         
         # Buat surface untuk vignette
-        self.vignette_surface = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
+        # vignette_surface adalah base_vignette yang sama; intensitas diatur lewat alpha surface
         self.base_vignette = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
+        self.vignette_surface = self.base_vignette
+        self.surface_alpha = None  # Alpha surface yang sedang dipasang
         self.create_base_vignette()
         self.update_vignette_alpha()
     
     def create_base_vignette(self):
-        """Buat base vignette melingkar halus (optimized)"""
+        """Buat base vignette melingkar halus (dihitung sekaligus dengan numpy)
+
+        Alpha setiap pixel dihitung bersamaan dalam satu array, bukan satu per satu.
+        Hasilnya juga disimpan di disk, jadi saat game dibuka lagi tinggal dibaca.
+        """
+        alpha = self.load_cached_alpha()
+        if alpha is None:
+            alpha = self.compute_vignette_alpha()
+            self.save_cached_alpha(alpha)
+
+        # Tulis langsung ke pixel surface: warna gelap di tempat yang punya alpha
+        self.base_vignette.fill((0, 0, 0, 0))
+        colors = pygame.surfarray.pixels3d(self.base_vignette)
+        colors[alpha > 0] = self.vignette_color
+        del colors  # Lepas kunci surface
+        alphas = pygame.surfarray.pixels_alpha(self.base_vignette)
+        alphas[:] = alpha
+        del alphas  # Lepas kunci surface
+
+    def compute_vignette_alpha(self):
+        """Hitung alpha vignette untuk semua pixel sekaligus
+
+        Return array numpy berukuran (lebar, tinggi) berisi alpha 0-180.
+        """
         center_x = self.screen_width // 2
         center_y = self.screen_height // 2
-        
-        # Bersihkan surface
-        self.base_vignette.fill((0, 0, 0, 0))
-        
+
         # Radius untuk vignette melingkar
-        max_radius = math.sqrt(center_x**2 + center_y**2) * 1.2
-        inner_radius = max_radius * 0.4  # Area tengah yang tidak terpengaruh
-        
-        # Buat vignette melingkar dengan gradien halus
-        for y in range(self.screen_height):
-            for x in range(self.screen_width):
-                # Hitung jarak dari pusat
-                distance = math.sqrt((x - center_x)**2 + (y - center_y)**2)
-                
-                # Hitung alpha berdasarkan jarak
-                if distance <= inner_radius:
-                    alpha = 0  # Area tengah transparan
-                elif distance >= max_radius:
-                    alpha = 180  # Tepi maksimal gelap
-                else:
-                    # Gradien halus dari inner ke outer radius
-                    progress = (distance - inner_radius) / (max_radius - inner_radius)
-                    # Gunakan fungsi smoothstep untuk transisi yang lebih halus
-                    smooth_progress = progress * progress * (3 - 2 * progress)
-                    alpha = int(180 * smooth_progress)
-                
-                if alpha > 0:
-                    color = (5, 5, 10, alpha)
-                    pygame.draw.rect(self.base_vignette, color, (x, y, 1, 1))
-    
+        max_radius = math.sqrt(center_x**2 + center_y**2) * self.outer_radius_scale
+        inner_radius = max_radius * self.inner_radius_ratio  # Area tengah yang tidak terpengaruh
+
+        # Hitung jarak setiap pixel dari pusat (array x dan y)
+        dx = numpy.arange(self.screen_width, dtype=numpy.float64) - center_x
+        dy = numpy.arange(self.screen_height, dtype=numpy.float64) - center_y
+        distance = numpy.sqrt(dx[:, None]**2 + dy[None, :]**2)
+
+        # Gradien halus dari inner ke outer radius (0 di tengah, 1 di tepi)
+        progress = numpy.clip((distance - inner_radius) / (max_radius - inner_radius), 0.0, 1.0)
+        # Gunakan fungsi smoothstep untuk transisi yang lebih halus
+        smooth_progress = progress * progress * (3 - 2 * progress)
+        return (self.edge_alpha * smooth_progress).astype(numpy.uint8)
+
+    def vignette_cache_path(self):
+        """Alamat file cache vignette (berbeda untuk setiap ukuran layar dan pengaturan)"""
+        name = (f"vignette_{self.screen_width}x{self.screen_height}"
+                f"_r{self.outer_radius_scale:g}_i{self.inner_radius_ratio:g}_a{self.edge_alpha}.npy")
+        return os.path.join(BAKE_FOLDER, name)
+
+    def load_cached_alpha(self):
+        """Baca alpha vignette dari disk (None jika belum ada)"""
+        try:
+            alpha = numpy.load(self.vignette_cache_path())
+        except (OSError, ValueError):
+            return None
+        if alpha.shape != (self.screen_width, self.screen_height):
+            return None
+        return alpha
+
+    def save_cached_alpha(self, alpha):
+        """Simpan alpha vignette ke disk untuk dipakai lagi nanti"""
+        try:
+            os.makedirs(BAKE_FOLDER, exist_ok=True)
+            numpy.save(self.vignette_cache_path(), alpha)
+        except OSError:
+            pass  # Tidak bisa menulis cache, tidak apa-apa: dihitung ulang lain kali
+
+    def resize(self, screen_width, screen_height):
+        """Ubah ukuran vignette saat ukuran layar berubah"""
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.vignette_radius = min(screen_width, screen_height) * 0.6
+        self.base_vignette = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
+        self.vignette_surface = self.base_vignette
+        self.surface_alpha = None
+        self.create_base_vignette()
+        self.update_vignette_alpha()
+
     def update_vignette_alpha(self):
-        """Update alpha vignette berdasarkan intensitas"""
-        # Copy base vignette dan adjust alpha
-        self.vignette_surface = self.base_vignette.copy()
-        
-        # Apply intensity scaling
-        if self.intensity < 1.0:
-            # Buat surface dengan alpha yang disesuaikan
-            temp_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-            temp_surface.fill((255, 255, 255, int(255 * self.intensity)))
-            self.vignette_surface.blit(temp_surface, (0, 0), special_flags=pygame.BLEND_MULT)
-            
+        """Update alpha vignette berdasarkan intensitas
+
+        Tidak ada surface baru yang dibuat: intensitas dipasang sebagai alpha
+        seluruh surface (set_alpha), yang dikalikan dengan alpha setiap pixel
+        saat digambar. Jadi mengganti intensitas sangat murah.
+        """
+        alpha = int(255 * self.intensity) if self.intensity < 1.0 else 255
+        if alpha != self.surface_alpha:
+            self.surface_alpha = alpha
+            self.vignette_surface.set_alpha(alpha)
+
     def set_intensity(self, intensity):
         """Atur intensitas efek vignette (0.0 - 1.0)"""
         new_intensity = max(0.0, min(1.0, intensity))
@@ -140,5 +193,5 @@ class MovingShadowEffect:
         self.intensity = 0.3
         self.time = 0
         self.max_alpha = int(120 * self.intensity)
-        self.create_vignette()
+        self.update_vignette_alpha()
         self.active = True
\ No newline at end of file
@@ -4,9 +4,11 @@
 
 # Import (mengambil) library dan file yang kita butuhkan
 import os, re, random, math, pygame  # Library untuk membuat game
-from helper import resize_with_aspect_ratio  # Fungsi untuk mengubah ukuran gambar
+from asset_registry import registry  # Gudang gambar bersama
 from constants import MAX_WIDTH, MAX_HEIGHT  # Ukuran layar game
 from kunai import Kunai  # File untuk senjata kunai ninja
+from game_clock import lerp  # Menggambar di antara dua langkah simulasi
+from input_source import KeyboardInput  # Tombol dari keyboard sungguhan
 
 class Ninja:
     """Kelas Ninja - Karakter utama dalam permainan!
@@ -14,7 +16,23 @@ class Ninja:
     Kelas ini seperti 'cetakan' untuk membuat karakter ninja.
     Ninja punya banyak kemampuan seperti berlari, melompat, dan menyerang!
     """
-    def __init__(self, sprite_folder, screen, ninja_ground, ninja_speed):
+    # Daftar semua gerakan ninja (nama gerakan = awal nama file gambar)
+    ACTIONS = [
+        'Attack',      # Gerakan menyerang
+        'Climb',       # Gerakan memanjat
+        'Dead',        # Gerakan ketika ninja kalah
+        'Glide',       # Gerakan melayang di udara
+        'Idle',        # Gerakan diam/menunggu
+        'Jump',        # Gerakan melompat
+        'Jump_Attack', # Gerakan menyerang sambil melompat
+        'Jump_Throw',  # Gerakan melempar kunai sambil melompat
+        'Run',         # Gerakan berlari
+        'Slide',       # Gerakan meluncur
+        'Throw',       # Gerakan melempar kunai
+    ]
+    KUNAI_SIZE = (40, 40)  # Ukuran maksimal gambar kunai
+
+    def __init__(self, sprite_folder, screen, ninja_ground, ninja_speed, input_source=None):
         """Fungsi untuk membuat ninja baru (seperti melahirkan ninja!)
 
         Parameter:
@@ -22,39 +40,42 @@ class Ninja:
         - screen: Layar tempat ninja akan muncul
         - ninja_ground: Ketinggian tanah tempat ninja berdiri
         - ninja_speed: Seberapa cepat ninja bisa bergerak
+        - input_source: Asal tombol yang ditekan (default: keyboard sungguhan)
         """
 
         # Dictionary (kamus) untuk menyimpan semua gerakan ninja
         # Seperti buku panduan gerakan ninja!
-        self.actions = {
-            'Attack': [],      # Gerakan menyerang
-            'Climb': [],       # Gerakan memanjat
-            'Dead': [],        # Gerakan ketika ninja kalah
-            'Glide': [],       # Gerakan melayang di udara
-            'Idle': [],        # Gerakan diam/menunggu
-            'Jump': [],        # Gerakan melompat
-            'Jump_Attack': [], # Gerakan menyerang sambil melompat
-            'Jump_Throw': [],  # Gerakan melempar kunai sambil melompat
-            'Run': [],         # Gerakan berlari
-            'Slide': [],       # Gerakan meluncur
-            'Throw': [],       # Gerakan melempar kunai
-        }
+        self.actions = {action: [] for action in Ninja.ACTIONS}
         # Pengaturan kecepatan dan layar
         self.ninja_speed = ninja_speed  # Seberapa cepat ninja bergerak
         self.screen = screen            # Layar tempat ninja muncul
+        self.input_source = input_source or KeyboardInput()  # Asal tombol yang ditekan
 
         # Tentukan jenis kelamin ninja berdasarkan sprite_folder
         self.gender = 'female' if 'female' in sprite_folder else 'male'
 
+        # Gerakan serangan digambar lebih besar agar terlihat lebih keren!
+        # Ninja perempuan diperbesar 10%, ninja laki-laki 20%
+        self.attack_scale = 1.1 if self.gender == 'female' else 1.2
+        self.scaled_actions = {}        # Frame serangan yang sudah diperbesar (dihitung sekali saat dimuat)
+
+        # Cache sprite dan kotak (rect) ninja agar tidak dihitung ulang berkali-kali dalam satu frame
+        self.sprite_cache_key = None
+        self.sprite_cache = None
+        self.rect_cache_key = None
+        self.rect_cache = None
+
         # Pengaturan animasi ninja
         self.current_action = 'Idle'    # Gerakan yang sedang dilakukan (mulai dengan diam)
         self.current_frame = 0          # Frame animasi yang sedang ditampilkan
         self.ninja_ground = ninja_ground # Ketinggian tanah
+        self.sprite_keys = []           # Kunci gambar yang dipinjam dari gudang bersama
         self.load_sprites(sprite_folder) # Memuat semua gambar ninja
 
         # Posisi ninja di layar (koordinat x, y)
         self.x = 0                      # Posisi horizontal (kiri-kanan)
         self.y = self.ninja_ground      # Posisi vertikal (atas-bawah), mulai di tanah
+        self.prev_y = self.y            # Posisi vertikal di langkah simulasi sebelumnya (untuk menggambar halus)
 
         # Pengaturan untuk melompat dan gravitasi
         self.vel_y = 0                  # Kecepatan vertikal (naik/turun)
@@ -69,11 +90,10 @@ class Ninja:
         self.last_direction_key = None  # Tombol arah terakhir yang ditekan ('a' atau 'd')
 
         # Pengaturan senjata Kunai (senjata lempar ninja)
-        self.kunai_image = pygame.image.load(os.path.join(sprite_folder, 'Kunai.png')).convert_alpha()
-        self.kunai_image = resize_with_aspect_ratio(self.kunai_image, 40, 40)  # Ubah ukuran kunai
-        # self.kunai_image = pygame.transform.rotate(self.kunai_image, 270)  # Putar kunai (tidak dipakai)
-        self.kunai_width, _ = self.kunai_image.get_size()  # Dapatkan lebar kunai
-        self.kunai_flip = False         # Apakah kunai perlu dibalik?
+        # Gambar kunai (kanan, kiri) yang sudah diperkecil dan dibalik sekali saat dimuat
+        kunai_key, self.kunai_images = registry.acquire_image_pair(os.path.join(sprite_folder, 'Kunai.png'), Ninja.KUNAI_SIZE)
+        self.sprite_keys.append(kunai_key)
+        self.kunai_width, _ = self.kunai_images[0].get_size()  # Dapatkan lebar kunai
         self.kunais = []                # Daftar semua kunai yang sedang terbang
 
         # Pengaturan untuk sistem pertarungan
@@ -123,55 +143,87 @@ class Ninja:
         self.name = name
 
     def load_sprites(self, sprite_folder):
-        """Memuat semua gambar ninja dari folder
+        """Meminjam semua gambar ninja dari gudang bersama
 
         Fungsi ini seperti membuka album foto ninja!
-        Setiap foto (sprite) akan dikelompokkan berdasarkan gerakan ninja.
+        Setiap foto (sprite) dikelompokkan berdasarkan gerakan ninja,
+        dan album yang sama tidak perlu dimuat dua kali.
+        """
+        for folder, action, max_size, list_files in Ninja.frame_requests(sprite_folder):
+            key, frames = registry.acquire_frames(folder, action, max_size, list_files)
+            self.sprite_keys.append(key)
+            self.actions[action] = frames
+
+            # Siapkan versi besar untuk gerakan serangan
+            if action in ['Attack', 'Jump_Attack', 'Jump_Throw']:
+                scaled_key, scaled_frames = registry.acquire_scaled_frames(sprite_folder, action, max_size, self.attack_scale, list_files)
+                self.sprite_keys.append(scaled_key)
+                self.scaled_actions[action] = scaled_frames
+
+    @classmethod
+    def frame_requests(cls, sprite_folder):
+        """Daftar gambar yang dibutuhkan ninja: (folder, gerakan, ukuran, fungsi daftar file)
+
+        Dipakai load_sprites() dan juga layar loading untuk memuat gambar lebih awal.
         """
-        # Baca semua file gambar di folder ninja
-        for filename in sorted(os.listdir(sprite_folder)):
-            if filename.endswith('.png'):  # Hanya ambil file gambar PNG
-                path = os.path.join(sprite_folder, filename)  # Buat alamat lengkap file
-                sprite = pygame.image.load(path).convert_alpha()  # Muat gambar
-
-                # Cari tahu gambar ini untuk gerakan apa
-                # Seperti mengelompokkan foto berdasarkan aktivitas
-                for action in self.actions:
-                    # Cocokkan nama file dengan nama gerakan
-                    if re.match(rf"^{action}(__\d{{3}}\.png)$", filename) or re.match(rf"^{action}(_\d{{3}}\.png)$", filename):
-                        # Beberapa gerakan perlu ukuran khusus
-                        if action in ['Jump_Throw', 'Slide']:
-                            sprite_resized = resize_with_aspect_ratio(sprite, MAX_WIDTH - 20, MAX_HEIGHT - 20)
-                            self.actions[action].append(sprite_resized)
-                        else:
-                            sprite_resized = resize_with_aspect_ratio(sprite, MAX_WIDTH, MAX_HEIGHT)
-                            self.actions[action].append(sprite_resized)
+        return [(sprite_folder, action, cls.sprite_max_size(action),
+                 lambda action=action: cls.list_action_files(sprite_folder, action))
+                for action in cls.ACTIONS]
+
+    @classmethod
+    def sprite_max_size(cls, action):
+        """Ukuran maksimal (lebar, tinggi) gambar untuk satu gerakan
+
+        Dipakai juga oleh bake_assets.py agar gambar yang dipanggang
+        ukurannya sama persis dengan yang dipakai di dalam game.
+        """
+        # Beberapa gerakan perlu ukuran khusus
+        if action in ['Jump_Throw', 'Slide']:
+            return (MAX_WIDTH - 20, MAX_HEIGHT - 20)
+        return (MAX_WIDTH, MAX_HEIGHT)
+
+    @classmethod
+    def list_action_files(cls, sprite_folder, action):
+        """Mencari file gambar untuk satu gerakan (urut berdasarkan nama)"""
+        # Cocokkan nama file dengan nama gerakan, contoh: 'Run__000.png' atau 'Climb_000.png'
+        return [filename for filename in registry.list_folder(sprite_folder)
+                if re.match(rf"^{action}(__\d{{3}}\.png)$", filename) or re.match(rf"^{action}(_\d{{3}}\.png)$", filename)]
+
+    def release_sprites(self):
+        """Mengembalikan gambar yang dipinjam ke gudang bersama"""
+        registry.release_all(self.sprite_keys)
+        self.sprite_keys = []
 
     def get_current_sprite(self):
         """Mengambil gambar ninja yang sedang aktif
 
         Fungsi ini seperti memilih kostum ninja yang tepat!
         Tergantung gerakan apa yang sedang dilakukan ninja.
+        Hasilnya disimpan sampai gerakan, frame, atau arah hadap berubah.
         """
-        # Ambil gambar sesuai gerakan dan frame saat ini
-        sprite = self.actions[self.current_action][self.current_frame]
-
-        # Perbesar gambar untuk gerakan serangan agar terlihat lebih keren!
-        if self.current_action in ['Attack', 'Jump_Attack', 'Jump_Throw']:
-            if self.gender == 'female':
-                # Ninja perempuan diperbesar 10% lebih besar (1.2 + 0.1 = 1.3)
-                sprite = pygame.transform.smoothscale(sprite, (sprite.get_width() * 1.1, sprite.get_height() * 1.1))
-            else:
-                # Ninja laki-laki tetap 20%
-                sprite = pygame.transform.smoothscale(sprite, (sprite.get_width() * 1.2, sprite.get_height() * 1.2))
-
-        # Balik gambar jika ninja menghadap kiri
-        if self.facing_left:
-            return pygame.transform.flip(sprite, True, False)  # Flip sprite jika bergerak ke kiri
-        return sprite
+        cache_key = (self.current_action, self.current_frame, self.facing_left)
+        if cache_key != self.sprite_cache_key:
+            # Gerakan serangan memakai frame yang sudah diperbesar saat dimuat
+            frames = self.scaled_actions.get(self.current_action, self.actions[self.current_action])
+            # Pilih gambar sesuai frame dan arah hadap (pasangan kanan/kiri sudah dibalik saat dimuat)
+            self.sprite_cache = frames[self.current_frame][self.facing_left]
+            self.sprite_cache_key = cache_key
+        return self.sprite_cache
+
+    def get_current_rect(self):
+        """Mengambil kotak tabrakan ninja di posisi saat ini
+
+        Kotak disimpan dan dipakai bersama oleh semua pengecekan tabrakan
+        dalam frame yang sama, jadi jangan diubah langsung (pakai inflate/copy).
+        """
+        cache_key = (self.current_action, self.current_frame, self.facing_left, self.x, self.y)
+        if cache_key != self.rect_cache_key:
+            self.rect_cache = self.get_current_sprite().get_rect(topleft=(self.x, self.y))
+            self.rect_cache_key = cache_key
+        return self.rect_cache
 
     def _handle_movement_keys(self):
-        keys = pygame.key.get_pressed()
+        keys = self.input_source.get_pressed()
         
         # Jika kedua tombol ditekan, gunakan prioritas tombol terakhir
         if keys[pygame.K_a] and keys[pygame.K_d]:
@@ -184,12 +236,17 @@ class Ninja:
         elif keys[pygame.K_d] and not keys[pygame.K_a]:
             self.facing_left = False
 
+    def _is_run_key_held(self):
+        """Apakah tombol lari (A atau D) sedang ditahan?"""
+        keys = self.input_source.get_pressed()
+        return keys[pygame.K_a] or keys[pygame.K_d]
+
     def _update_action_frame(self):
         if self.current_action == 'Jump' and self.current_frame == len(self.actions['Jump']) - 1:
             if self.on_ground:
                 self.current_frame = len(self.actions['Jump']) - 1  # Pertahankan frame terakhir
                 # Jika tombol run masih ditekan, lanjutkan ke Run setelah mendarat
-                if pygame.key.get_pressed()[pygame.K_a] or pygame.key.get_pressed()[pygame.K_d]:
+                if self._is_run_key_held():
                    self.set_action('Run')
                 else:
                     self.set_action('Idle')  # Ganti aksi ke Idle setelah mendarat
@@ -214,13 +271,13 @@ class Ninja:
         if self.current_action in ['Jump_Attack', 'Jump_Throw']:
             if self.on_ground:
                 # Jika tombol run ditekan, kembali ke Run
-                if pygame.key.get_pressed()[pygame.K_a] or pygame.key.get_pressed()[pygame.K_d]:
+                if self._is_run_key_held():
                     self.set_action('Run')
                 else:
                     self.set_action('Idle')  # Kembali ke Idle jika tidak ada tombol yang ditekan
         elif self.current_action == 'Slide':
             # Jika tombol run ditekan, kembali ke Run
-            if pygame.key.get_pressed()[pygame.K_a] or pygame.key.get_pressed()[pygame.K_d]:
+            if self._is_run_key_held():
                 self.set_action('Run')
                 self.y -= 30
             else:
@@ -229,19 +286,19 @@ class Ninja:
         elif self.current_action == 'Glide':
             if self.on_ground:
                 # Jika tombol run ditekan, kembali ke Run
-                if pygame.key.get_pressed()[pygame.K_a] or pygame.key.get_pressed()[pygame.K_d]:
+                if self._is_run_key_held():
                     self.set_action('Run')
                 else:
                     self.set_action('Idle')  # Kembali ke Idle jika tidak ada tombol yang ditekan
         elif self.current_action == 'Attack':
             # Setelah animasi Attack selesai, cek apakah masih ada input gerakan
-            if pygame.key.get_pressed()[pygame.K_a] or pygame.key.get_pressed()[pygame.K_d]:
+            if self._is_run_key_held():
                 self.set_action('Run')  # Kembali ke Run jika tombol gerakan masih ditekan
             else:
                 self.set_action('Idle')  # Kembali ke Idle jika tidak ada input
         elif self.current_action == 'Throw':
             # Setelah animasi Throw selesai, cek apakah masih ada input gerakan
-            if pygame.key.get_pressed()[pygame.K_a] or pygame.key.get_pressed()[pygame.K_d]:
+            if self._is_run_key_held():
                 self.set_action('Run')  # Kembali ke Run jika tombol gerakan masih ditekan
             else:
                 self.set_action('Idle')  # Kembali ke Idle jika tidak ada input
@@ -312,12 +369,12 @@ class Ninja:
 
     def _handle_keyup_event(self, event):
         if event.key == pygame.K_a or event.key == pygame.K_d:
-            if not pygame.key.get_pressed()[pygame.K_a] and not pygame.key.get_pressed()[pygame.K_d]:
+            if not self._is_run_key_held():
                 if self.current_action != 'Glide':
                     self.set_action('Idle')
 
         if event.key == pygame.K_j and self.current_action == 'Glide':
-            if pygame.key.get_pressed()[pygame.K_a] or pygame.key.get_pressed()[pygame.K_d]:
+            if self._is_run_key_held():
                 self.set_action('Run')
             else:
                 self.set_action('Idle')
@@ -389,55 +446,54 @@ class Ninja:
                 self.vel_y = 0  # Reset kecepatan vertikal
                 self.on_ground = True  # Karakter kembali ke tanah
 
-    def draw(self, screen):
-        """Gambar sprite ninja pada posisi tertentu."""
+    def save_previous_state(self):
+        """Simpan posisi sebelum langkah simulasi berikutnya (untuk interpolasi)"""
+        self.prev_y = self.y
+
+    def update_physics(self):
+        """Satu langkah simulasi: letakkan ninja di tengah layar lalu tarik dengan gravitasi"""
         # Gunakan ukuran sprite asli untuk perhitungan posisi
-        original_sprite = self.actions[self.current_action][self.current_frame]
-        if self.facing_left:
-            original_sprite = pygame.transform.flip(original_sprite, True, False)
+        original_sprite = self.actions[self.current_action][self.current_frame][self.facing_left]
 
         screen_size_x, _ = original_sprite.get_size()
         self.x = self.screen.get_width() / 2 - (screen_size_x / 2)
+        self.apply_gravity()
+
+    def draw(self, screen, alpha=1.0):
+        """Gambar sprite ninja pada posisi tertentu.
 
+        alpha: posisi gambar di antara langkah sebelumnya (0) dan langkah terakhir (1)
+        """
         # Gambar sprite yang sudah di-scale (jika perlu) pada posisi yang benar
         current_sprite = self.get_current_sprite()
-        screen.blit(current_sprite, (self.x, self.y))
+        screen.blit(current_sprite, (self.x, lerp(self.prev_y, self.y, alpha)))
         # # Gambar sparks
         # for spark in self.sparks:
         #     spark.draw(screen)
-        self.draw_kunai()
-        self.apply_gravity()
+        self.draw_kunai(alpha)
 
     def reset(self):
         self.alive = True
         self.health = 100
         self.x = 0  # Reset posisi X ninja ke posisi awal
         self.y = self.ninja_ground
+        self.prev_y = self.y
         self.vel_y = 0
         self.on_ground = True
         self.is_falling_to_cliff = False  # Reset flag jatuh ke jurang
         self.set_action('Jump')
 
-    def draw_kunai(self):
+    def draw_kunai(self, alpha=1.0):
         """Gambar kunai."""
         for kunai in self.kunais:
             if kunai.active:
-                kunai.draw(self.screen)
+                kunai.draw(self.screen, alpha)
 
     def throw_kunai(self):
         """Melempar kunai."""
         kunai_speed = 10 if not self.facing_left else -10  # Tentukan arah kunai
-        if self.facing_left:
-            if not self.kunai_flip:
-                self.kunai_image = pygame.transform.flip(self.kunai_image, True, False)
-                self.kunai_flip = True
-        else:
-            if self.kunai_flip:
-                self.kunai_flip = False
-                self.kunai_image = pygame.transform.flip(self.kunai_image, True, False)
-            else:
-                self.kunai_image = pygame.transform.flip(self.kunai_image, False, False)
-        kunai = Kunai(self.screen, self.kunai_image, self.x + (self.kunai_width // 2), self.y + 40, kunai_speed)  # Buat kunai baru
+        kunai_image = self.kunai_images[self.facing_left]  # Pilih gambar kunai sesuai arah
+        kunai = Kunai(self.screen, kunai_image, self.x + (self.kunai_width // 2), self.y + 40, kunai_speed)  # Buat kunai baru
         self.kunais.append(kunai)  # Tambahkan kunai ke daftar
 
     def update_kunais(self):
@@ -2,8 +2,14 @@
 # File ini mengatur pemandangan game seperti latar belakang dan jalan yang bergerak
 
 import pygame  # Library untuk membuat game
-from constants import BOSS_SCENE  # Import konstanta boss scene
+from asset_registry import registry  # Gudang gambar bersama
+import world_generation  # Pembuat letak objek alam
+from chasm_map import ChasmMap  # Peta jurang bersama
+from scenery_index import SceneryIndex  # Objek alam yang urut per lapisan gambar
+from constants import BOSS_SCENE, DOWNFALL_POSITIONS, WORLD_SEED  # Import konstanta boss scene, jurang, dan seed dunia
 from leaf_effect import LeafEffect  # Import efek daun beterbangan
+from game_clock import lerp  # Menggambar di antara dua langkah simulasi
+from input_source import KeyboardInput  # Tombol dari keyboard sungguhan
 
 class Object:
     """Kelas Object - Cetakan untuk membuat latar belakang game
@@ -14,7 +20,7 @@ class Object:
     - Jurang-jurang berbahaya
     """
 
-    def __init__(self, image_path, screen, max_scene, ninja_speed, boss_mode=False):
+    def __init__(self, image_path, screen, max_scene, ninja_speed, boss_mode=False, input_source=None):
         """Membuat objek latar belakang baru
 
         Parameter:
@@ -23,25 +29,29 @@ class Object:
         - max_scene: Berapa banyak pemandangan yang ada
         - ninja_speed: Seberapa cepat ninja bergerak
         - boss_mode: Mode boss tanpa jurang (default: False)
+        - input_source: Asal tombol yang ditekan (default: keyboard sungguhan)
         """
         self.screen = screen          # Layar game
         # Gunakan BOSS_SCENE jika dalam mode boss, otherwise gunakan max_scene normal
         self.max_scene = BOSS_SCENE if boss_mode else max_scene    # Jumlah pemandangan maksimal
         self.ninja_speed = ninja_speed # Kecepatan ninja
         self.boss_mode = boss_mode    # Mode boss tanpa jurang
+        self.input_source = input_source or KeyboardInput()  # Asal tombol yang ditekan
+        self.sprite_keys = []         # Kunci gambar yang dipinjam dari gudang bersama
 
-        # Muat dan siapkan gambar latar belakang
+        # Muat latar belakang yang sudah diubah ukurannya agar pas dengan layar
         background_path = image_path + '/Background.png'  # Lokasi file gambar latar
-        self.background_image = pygame.image.load(background_path).convert()  # Muat gambar
-        # Ubah ukuran latar belakang agar pas dengan layar
-        self.background_resized = pygame.transform.scale(
-            self.background_image,
-            (screen.get_width(), screen.get_height())
+        background_key, self.background_resized = registry.acquire_scaled(
+            background_path,
+            (screen.get_width(), screen.get_height()),
+            alpha=False
         )
+        self.sprite_keys.append(background_key)
 
         # Muat dan siapkan gambar jalan
         road_path = image_path + '/Tile_11.png'  # Lokasi file gambar jalan
-        self.road_image = pygame.image.load(road_path).convert_alpha()  # Muat gambar jalan
+        road_key, self.road_image = registry.acquire_image(road_path)  # Muat gambar jalan
+        self.sprite_keys.append(road_key)
         self.road_width = self.road_image.get_width()  # Ukur lebar satu ubin jalan
 
         # Variabel posisi dan status
@@ -51,6 +61,11 @@ class Object:
         self.background_x1 = 0               # Posisi latar belakang pertama
         self.background_x2 = screen.get_width()  # Posisi latar belakang kedua
 
+        # Posisi di langkah simulasi sebelumnya, untuk menggambar di antara dua langkah
+        self.prev_x = self.x                 # Posisi kamera sebelumnya
+        self.prev_road_x = self.road_x       # Posisi jalan sebelumnya
+        self.background_shift = 0            # Geseran latar belakang di langkah terakhir
+
         # Muat objek alam untuk latar belakang natural
         self.nature_objects = {}  # Kamus objek alam berdasarkan jenis
 
@@ -69,7 +84,8 @@ class Object:
         for obj_name, obj_number in nature_items.items():
             obj_path = image_path + f'/Object_{obj_number}.png'  # Lokasi file objek
             try:
-                obj_image = pygame.image.load(obj_path).convert_alpha()  # Muat gambar objek
+                obj_key, obj_image = registry.acquire_image(obj_path)  # Muat gambar objek
+                self.sprite_keys.append(obj_key)
                 self.nature_objects[obj_name] = obj_image  # Simpan dengan nama yang mudah diingat
             except pygame.error:
                 print(f"Tidak dapat memuat {obj_path}")  # Peringatan jika file tidak ada
@@ -80,185 +96,30 @@ class Object:
         if self.boss_mode:
             self.downfall_positions = []     # Tidak ada jurang di mode boss
         else:
-            self.downfall_positions = [6, 9, 11, 14, 15, 18, 22, 25, 28, 31, 35, 38, 42, 45, 48, 52, 55, 58, 62, 65, 68, 72, 75, 78, 82, 85]  # Daftar posisi di mana jurang muncul (diperbanyak untuk tantangan lebih sulit)
-        self.x_downfall = []                 # Daftar posisi jurang yang aktif
-
-        # Buat lingkungan alam yang natural
-        self.nature_positions = []  # Posisi objek alam
-
-        # Buat pola alam yang realistis
-        import random
-        random.seed(42)  # Gunakan seed tetap agar pola konsisten
-
-        # Tempatkan objek alam dengan pola natural (hanya di area tiles yang aman)
-        for section in range(0, 80):  # Buat 80 bagian lingkungan untuk scene yang sangat panjang
-            section_x = section * 300  # Setiap bagian selebar 300 pixel
-
-            # Pohon besar (jarang, di belakang jalan)
-            if random.random() < 0.3:  # 30% kemungkinan ada pohon besar
-                for attempt in range(10):  # Coba maksimal 10 kali untuk posisi aman
-                    obj_x = section_x + random.randint(0, 200)
-                    obj_width = self.nature_objects['pohon'].get_width() if 'pohon' in self.nature_objects else 100
-                    if self._is_safe_position(obj_x, obj_width):
-                        # Hitung posisi Y agar bagian bawah objek berada di Y=360 dengan offset tambahan
-                        obj_height = self.nature_objects['pohon'].get_height() if 'pohon' in self.nature_objects else 100
-                        offset_tambahan = 100  # Offset untuk menurunkan objek lebih jauh
-                        self.nature_positions.append({
-                            'type': 'pohon',
-                            'x': obj_x,
-                            'y': 360 - obj_height + offset_tambahan  # Bagian bawah objek di Y=360 + offset
-                        })
-                        break
-
-            # Pohon medium (lebih sering, di samping jalan)
-            if random.random() < 0.5:  # 50% kemungkinan ada pohon medium
-                for attempt in range(10):  # Coba maksimal 10 kali untuk posisi aman
-                    obj_x = section_x + random.randint(50, 250)
-                    obj_width = self.nature_objects['pohon_medium'].get_width() if 'pohon_medium' in self.nature_objects else 80
-                    if self._is_safe_position(obj_x, obj_width):
-                        # Hitung posisi Y agar bagian bawah objek berada di Y=360 dengan offset tambahan
-                        obj_height = self.nature_objects['pohon_medium'].get_height() if 'pohon_medium' in self.nature_objects else 80
-                        offset_tambahan = 100  # Offset untuk menurunkan objek lebih jauh
-                        self.nature_positions.append({
-                            'type': 'pohon_medium',
-                            'x': obj_x,
-                            'y': 360 - obj_height + offset_tambahan  # Bagian bawah objek di Y=360 + offset
-                        })
-                        break
-
-            # Tumbuhan datar (sering, di tepi jalan)
-            for _ in range(random.randint(1, 3)):  # 1-3 tumbuhan per bagian
-                for attempt in range(10):  # Coba maksimal 10 kali untuk posisi aman
-                    obj_x = section_x + random.randint(0, 280)
-                    obj_width = self.nature_objects['tumbuhan'].get_width() if 'tumbuhan' in self.nature_objects else 60
-                    if self._is_safe_position(obj_x, obj_width):
-                        # Hitung posisi Y agar bagian bawah objek berada di Y=360 dengan offset tambahan
-                        obj_height = self.nature_objects['tumbuhan'].get_height() if 'tumbuhan' in self.nature_objects else 60
-                        offset_tambahan = 100  # Offset untuk menurunkan objek lebih jauh
-                        self.nature_positions.append({
-                            'type': 'tumbuhan',
-                            'x': obj_x,
-                            'y': 360 - obj_height + offset_tambahan  # Bagian bawah objek di Y=360 + offset
-                        })
-                        break
-
-            # Rumput (banyak, di area jalan)
-            for _ in range(random.randint(2, 5)):  # 2-5 rumput per bagian
-                for attempt in range(10):  # Coba maksimal 10 kali untuk posisi aman
-                    obj_x = section_x + random.randint(0, 300)
-                    obj_width = self.nature_objects['rumput'].get_width() if 'rumput' in self.nature_objects else 40
-                    if self._is_safe_position(obj_x, obj_width):
-                        # Hitung posisi Y agar bagian bawah objek berada di Y=360 dengan offset tambahan
-                        obj_height = self.nature_objects['rumput'].get_height() if 'rumput' in self.nature_objects else 40
-                        offset_tambahan = 100  # Offset untuk menurunkan objek lebih jauh
-                        self.nature_positions.append({
-                            'type': 'rumput',
-                            'x': obj_x,
-                            'y': 360 - obj_height + offset_tambahan  # Bagian bawah objek di Y=360 + offset
-                        })
-                        break
-
-            # Bunga (cantik, di area jalan yang aman)
-            if random.random() < 0.7:  # 70% kemungkinan ada bunga
-                for _ in range(random.randint(1, 2)):  # 1-2 bunga per bagian
-                    for attempt in range(10):  # Coba maksimal 10 kali untuk posisi aman
-                        obj_x = section_x + random.randint(20, 280)
-                        obj_width = self.nature_objects['bunga'].get_width() if 'bunga' in self.nature_objects else 30
-                        if self._is_safe_position(obj_x, obj_width):
-                            # Hitung posisi Y agar bagian bawah objek berada di Y=360 dengan offset tambahan
-                            obj_height = self.nature_objects['bunga'].get_height() if 'bunga' in self.nature_objects else 30
-                            offset_tambahan = 100  # Offset untuk menurunkan objek lebih jauh
-                            self.nature_positions.append({
-                                'type': 'bunga',
-                                'x': obj_x,
-                                'y': 360 - obj_height + offset_tambahan  # Bagian bawah objek di Y=360 + offset
-                            })
-                            break
-
-            # Batu (jarang, di area jalan yang aman)
-            if random.random() < 0.4:  # 40% kemungkinan ada batu
-                for attempt in range(10):  # Coba maksimal 10 kali untuk posisi aman
-                    obj_x = section_x + random.randint(0, 300)
-                    obj_width = self.nature_objects['batu'].get_width() if 'batu' in self.nature_objects else 50
-                    if self._is_safe_position(obj_x, obj_width):
-                        # Hitung posisi Y agar bagian bawah objek berada di Y=360 dengan offset tambahan
-                        obj_height = self.nature_objects['batu'].get_height() if 'batu' in self.nature_objects else 50
-                        offset_tambahan = 100  # Offset untuk menurunkan objek lebih jauh
-                        self.nature_positions.append({
-                            'type': 'batu',
-                            'x': obj_x,
-                            'y': 360 - obj_height + offset_tambahan  # Bagian bawah objek di Y=360 + offset
-                        })
-                        break
-
-            # Plang (sangat jarang, strategis di area jalan)
-            if random.random() < 0.1:  # 10% kemungkinan ada plang
-                for attempt in range(10):  # Coba maksimal 10 kali untuk posisi aman
-                    obj_x = section_x + random.randint(50, 250)
-                    obj_width = self.nature_objects['plang'].get_width() if 'plang' in self.nature_objects else 70
-                    if self._is_safe_position(obj_x, obj_width):
-                        # Hitung posisi Y agar bagian bawah objek berada di Y=360 dengan offset tambahan
-                        obj_height = self.nature_objects['plang'].get_height() if 'plang' in self.nature_objects else 70
-                        offset_tambahan = 100  # Offset untuk menurunkan objek lebih jauh
-                        self.nature_positions.append({
-                            'type': 'plang',
-                            'x': obj_x,
-                            'y': 360 - obj_height + offset_tambahan  # Bagian bawah objek di Y=360 + offset
-                        })
-                        break
-
-        # Debug: Informasi objek alam (dinonaktifkan untuk performa)
-        # print(f"Total objek alam dibuat: {len(self.nature_positions)}")
-        # print(f"Objek alam yang berhasil dimuat: {list(self.nature_objects.keys())}")
-        # for i, obj in enumerate(self.nature_positions[:5]):
-        #     print(f"   {i+1}. {obj['type']} di posisi ({obj['x']}, {obj['y']})")
-        # if len(self.nature_positions) > 5:
-        #     print(f"   ... dan {len(self.nature_positions) - 5} objek lainnya")
-        
+            self.downfall_positions = list(DOWNFALL_POSITIONS)  # Daftar posisi di mana jurang muncul
+        self.update_chasms()
+
+        # Buat lingkungan alam yang natural (dibuat sekali lalu disimpan oleh world_generation)
+        self.generate_nature_positions()
+
         # Inisialisasi efek daun beterbangan
         self.leaf_effect = LeafEffect(screen.get_width(), screen.get_height())
 
-    def _is_safe_position(self, x_position, obj_width=0):
-        """Mengecek apakah posisi X aman (tidak di area jurang)
+    def generate_nature_positions(self):
+        """Mengambil letak objek alam untuk jalan dan jurang saat ini
 
-        Parameter:
-        - x_position: Posisi X yang akan dicek
-        - obj_width: Lebar objek untuk memastikan seluruh objek aman
-
-        Return:
-        - True jika posisi aman (ada tiles jalan)
-        - False jika posisi berbahaya (area jurang)
+        Letaknya dibuat oleh world_generation dengan seed tetap (WORLD_SEED),
+        dan disimpan di memori dan disk, jadi restart dan arena boss tidak
+        perlu membuatnya ulang.
         """
-        # Hitung indeks tile berdasarkan posisi X relatif terhadap jalan
-        # Posisi objek harus dihitung relatif terhadap posisi jalan awal
-        relative_x = x_position
-        tile_index_start = int(relative_x // self.road_width)
-        tile_index_end = int((relative_x + obj_width) // self.road_width)
-
-        # Cek apakah ada tile jurang di area yang akan ditempati objek
-        for tile_idx in range(tile_index_start, tile_index_end + 1):
-            if tile_idx in self.downfall_positions:
-                return False  # Posisi berbahaya (objek akan melewati jurang)
-
-        # Cek juga tile di sekitarnya untuk memastikan objek tidak terlalu dekat dengan jurang
-        # Cek tile sebelah kiri dan kanan dari area objek
-        left_tile = tile_index_start - 1
-        right_tile = tile_index_end + 1
-
-        # Tambahkan margin keamanan berdasarkan lebar objek
-        safety_margin = max(self.road_width * 0.2, obj_width * 0.5)  # Minimal 20% lebar tile atau 50% lebar objek
+        object_sizes = {name: image.get_size() for name, image in self.nature_objects.items()}
+        layout = world_generation.scenery_layout(WORLD_SEED, self.road_width, self.downfall_positions, object_sizes)
+        self.scenery = SceneryIndex(layout)  # Disimpan per lapisan, urut berdasarkan X
 
-        if left_tile in self.downfall_positions or right_tile in self.downfall_positions:
-            # Jika ada jurang di sebelah, beri jarak aman yang lebih besar
-            tile_start = tile_index_start * self.road_width
-            tile_end = (tile_index_end + 1) * self.road_width
-
-            # Pastikan objek tidak terlalu dekat dengan tepi tile yang berbatasan dengan jurang
-            if (left_tile in self.downfall_positions and (relative_x - tile_start) < safety_margin) or \
-               (right_tile in self.downfall_positions and (tile_end - (relative_x + obj_width)) < safety_margin):
-                return False  # Terlalu dekat dengan jurang
-
-        return True  # Posisi aman (ada tiles jalan)
+    def release_sprites(self):
+        """Mengembalikan gambar yang dipinjam ke gudang bersama"""
+        registry.release_all(self.sprite_keys)
+        self.sprite_keys = []
 
     # Getter methods
     def get_x(self):
@@ -277,54 +138,75 @@ class Object:
         """Mengembalikan lebar tile jalan."""
         return self.road_width
 
-    def get_downfall_positions(self):
-        """Mengembalikan daftar posisi jurang."""
-        return self.x_downfall
+    def get_chasms(self):
+        """Mengembalikan peta jurang (ChasmMap)."""
+        return self.chasms
+
+    def update_chasms(self):
+        """Membuat peta jurang dari nomor ubin jurang (ubin ke-i dimulai di i x lebar ubin)"""
+        self.chasms = ChasmMap(self.downfall_positions, self.road_width)
+        self.build_road_chunks()  # Lubang jurang ikut digambar ke potongan jalan
+
+    def build_road_chunks(self):
+        """Menggambar seluruh jalan sekali ke potongan (chunk) selebar layar, lubang jurang sudah kosong
+
+        Potongan dengan susunan ubin yang sama (misalnya jalan penuh tanpa jurang)
+        memakai satu gambar yang sama, dan hanya baris ubin yang tidak transparan
+        yang disimpan, jadi memorinya tetap kecil. Potongan tanpa ubin sama sekali
+        disimpan sebagai None.
+        """
+        tiles_per_chunk = -(-self.screen.get_width() // self.road_width)  # Bulatkan ke atas: satu potongan >= lebar layar
+        self.road_chunk_width = tiles_per_chunk * self.road_width
+        tile_count = -(-self.screen.get_width() * (self.max_scene + 1) // self.road_width)  # Banyak ubin di seluruh level
+        visible = self.road_image.get_bounding_rect()  # Baris ubin yang tidak transparan
+        self.road_chunk_top = visible.top  # Jarak dari atas ubin ke baris pertama yang terlihat
+
+        chunk_images = {}  # Susunan ubin -> gambar potongan
+        self.road_chunks = []
+        for first_tile in range(0, tile_count, tiles_per_chunk):
+            # True = ada ubin jalan, False = jurang atau ujung level
+            pattern = tuple(index < tile_count and (self.boss_mode or not self.chasms.is_chasm_tile(index))
+                            for index in range(first_tile, first_tile + tiles_per_chunk))
+            if pattern not in chunk_images:
+                chunk = None
+                if any(pattern):
+                    chunk = pygame.Surface((self.road_chunk_width, visible.height), pygame.SRCALPHA)
+                    for slot, has_road in enumerate(pattern):
+                        if has_road:
+                            # BLEND_RGBA_MAX di atas pixel kosong = salinan persis (termasuk tepi transparan)
+                            chunk.blit(self.road_image, (slot * self.road_width, -visible.top), special_flags=pygame.BLEND_RGBA_MAX)
+                chunk_images[pattern] = chunk
+            self.road_chunks.append(chunk_images[pattern])
 
     # Setter methods
     def set_downfall(self, is_downfall=True):
         """Mengatur status downfall."""
         self.is_downfall = is_downfall
 
-    def draw_road(self, screen):
-        """Gambar jalan yang diulang dengan posisi dinamis, melewati area jurang."""
-        road_y = 350  # Posisi Y tetap untuk jalan
-        index = 0
-
-        # Hitung range untuk menggambar jalan
-        start_x = self.road_x
-        end_x = self.road_x + self.screen.get_width() * (self.max_scene + 1)
-
-        for x in range(start_x, end_x, self.road_width):
-            # Jika mode boss, gambar semua jalan tanpa jurang
-            if self.boss_mode:
-                # Gambar tile jalan di semua posisi
-                screen.blit(self.road_image, (x, road_y))
-            else:
-                # Cek apakah posisi ini adalah jurang (mode normal)
-                if index in self.downfall_positions:
-                    # Simpan posisi jurang jika belum ada
-                    if len(self.x_downfall) < len(self.downfall_positions) and x not in self.x_downfall:
-                        self.x_downfall.append(x)
-                    # Skip menggambar jalan di posisi jurang
-                else:
-                    # Gambar tile jalan
-                    screen.blit(self.road_image, (x, road_y))
-
-            index += 1
-
-
-    def draw_background(self, screen):
-        """Gambar latar belakang di layar."""
-        screen.blit(self.background_resized, (self.background_x1, 0))
-        screen.blit(self.background_resized, (self.background_x2, 0))
+    def draw_road(self, screen, road_x=None):
+        """Gambar jalan dari potongan yang sudah jadi (hanya potongan yang terlihat di layar)."""
+        road_y = 350 + self.road_chunk_top  # Posisi Y tetap untuk jalan (potongan dimulai di baris terlihat pertama)
+        start_x = int(round(self.road_x if road_x is None else road_x))
+
+        # Potongan ke-i dimulai di start_x + i x lebar potongan; paling banyak dua yang terlihat
+        first = max(0, -start_x // self.road_chunk_width)
+        last = min(len(self.road_chunks) - 1, (self.screen.get_width() - 1 - start_x) // self.road_chunk_width)
+        for index in range(first, last + 1):
+            chunk = self.road_chunks[index]
+            if chunk is not None:
+                screen.blit(chunk, (start_x + index * self.road_chunk_width, road_y))
+
+    def draw_background(self, screen, shift=0):
+        """Gambar latar belakang di layar (shift: geseran tambahan untuk interpolasi)."""
+        screen.blit(self.background_resized, (self.background_x1 + shift, 0))
+        screen.blit(self.background_resized, (self.background_x2 + shift, 0))
 
     def _update_road_position(self, ninja=None):
         """Update posisi jalan berdasarkan input keyboard dan prioritas tombol ninja."""
         if self.is_downfall:
             return
 
-        keys = pygame.key.get_pressed()
+        keys = self.input_source.get_pressed()
         max_x = self.screen.get_width() * self.max_scene
 
         # Gunakan sistem prioritas tombol yang sama dengan ninja
@@ -374,7 +256,7 @@ class Object:
         screen_width = self.screen.get_width()
 
         if self.x % screen_width == 0:
-            keys = pygame.key.get_pressed()
+            keys = self.input_source.get_pressed()
 
             if keys[pygame.K_a]:  # Bergerak ke kiri
                 self.scene = max(0, self.scene - 1)
@@ -387,17 +269,17 @@ class Object:
         if self.is_downfall or self.x <= 0 or self.x >= (self.screen.get_width() * self.max_scene):
             return
 
-        keys = pygame.key.get_pressed()
+        keys = self.input_source.get_pressed()
         bg_speed = 2  # Kecepatan background (lebih lambat dari jalan)
         screen_width = self.screen.get_width()
 
         # Geser background berdasarkan arah gerakan
         if keys[pygame.K_a]:  # Bergerak ke kiri
-            self.background_x1 += bg_speed
-            self.background_x2 += bg_speed
+            self.background_shift = bg_speed
         else:  # Bergerak ke kanan
-            self.background_x1 -= bg_speed
-            self.background_x2 -= bg_speed
+            self.background_shift = -bg_speed
+        self.background_x1 += self.background_shift
+        self.background_x2 += self.background_shift
 
         # Reset posisi background untuk efek infinite scrolling
         if self.background_x1 <= -screen_width:
@@ -410,9 +292,15 @@ class Object:
         elif self.background_x2 >= screen_width:
             self.background_x2 = self.background_x1 - screen_width
 
+    def save_previous_state(self):
+        """Simpan posisi sebelum langkah simulasi berikutnya (untuk interpolasi)"""
+        self.prev_x = self.x
+        self.prev_road_x = self.road_x
+        self.background_shift = 0
+
     def update_frame(self, ninja=None):
-        """Update semua elemen objek setiap frame."""
-        keys = pygame.key.get_pressed()
+        """Update semua elemen objek setiap langkah simulasi."""
+        keys = self.input_source.get_pressed()
 
         # Update posisi hanya jika ada input gerakan
         if keys[pygame.K_a] or keys[pygame.K_d]:
@@ -420,74 +308,48 @@ class Object:
             self._set_scene()
             self._move_background()
 
-    def draw(self, screen):
+        self.update_leaves()
+
+    def update_leaves(self):
+        """Gerakkan daun beterbangan dan jatuhkan daun baru dari pohon yang terlihat"""
+        # Posisi pohon yang terlihat untuk spawn daun (dicari lewat indeks objek alam)
+        visible_tree_positions = self.scenery.tree_anchors(self.x, self.screen.get_width())
+
+        # Update efek daun dengan posisi pohon yang terlihat
+        self.leaf_effect.update(visible_tree_positions)
+
+    def draw(self, screen, alpha=1.0):
         """
         Menggambar semua elemen latar belakang dan jalan
         Ini adalah method utama untuk menampilkan semua objek di layar
+
+        alpha: posisi gambar di antara langkah sebelumnya (0) dan langkah terakhir (1)
         """
         # Gambar latar belakang yang bergerak
-        self.draw_background(screen)
+        self.draw_background(screen, self.background_shift * (alpha - 1))
 
         # Gambar objek alam natural di latar belakang
-        self.draw_nature_objects(screen)
+        self.draw_nature_objects(screen, lerp(self.prev_x, self.x, alpha))
 
         # Gambar jalan dengan variasi tiles
-        self.draw_road(screen)
+        self.draw_road(screen, lerp(self.prev_road_x, self.road_x, alpha))
 
-    def draw_nature_objects(self, screen):
+    def draw_nature_objects(self, screen, camera_x=None):
         """
         Menggambar objek alam di latar belakang
         Menciptakan lingkungan yang natural dan indah
         """
+        if camera_x is None:
+            camera_x = self.x  # Posisi kamera untuk menggambar
+
         # Gambar setiap objek alam berdasarkan layer (belakang ke depan)
+        # Hanya objek yang terlihat di layar yang diambil dari indeks
         objects_drawn = 0  # Hitung berapa objek yang digambar
-
-        # Layer 1: Pohon besar (paling belakang)
-        for obj_data in self.nature_positions:
-            if obj_data['type'] == 'pohon':
-                obj_x = obj_data['x'] - self.x
-                obj_y = obj_data['y']
-
-                # Hanya gambar objek yang terlihat di layar
-                if -300 <= obj_x <= self.screen.get_width() + 300:
-                    if 'pohon' in self.nature_objects:
-                        screen.blit(self.nature_objects['pohon'], (obj_x, obj_y))
-                        objects_drawn += 1
-
-        # Layer 2: Pohon medium
-        for obj_data in self.nature_positions:
-            if obj_data['type'] == 'pohon_medium':
-                obj_x = obj_data['x'] - self.x
-                obj_y = obj_data['y']
-
-                if -250 <= obj_x <= self.screen.get_width() + 250:
-                    if 'pohon_medium' in self.nature_objects:
-                        screen.blit(self.nature_objects['pohon_medium'], (obj_x, obj_y))
-                        objects_drawn += 1
-
-        # Layer 3: Plang dan batu
-        for obj_data in self.nature_positions:
-            if obj_data['type'] in ['plang', 'batu']:
-                obj_x = obj_data['x'] - self.x
-                obj_y = obj_data['y']
-
-                if -200 <= obj_x <= self.screen.get_width() + 200:
-                    obj_type = obj_data['type']
-                    if obj_type in self.nature_objects:
-                        screen.blit(self.nature_objects[obj_type], (obj_x, obj_y))
-                        objects_drawn += 1
-
-        # Layer 4: Tumbuhan, rumput, dan bunga (paling depan)
-        for obj_data in self.nature_positions:
-            if obj_data['type'] in ['tumbuhan', 'rumput', 'bunga']:
-                obj_x = obj_data['x'] - self.x
-                obj_y = obj_data['y']
-
-                if -150 <= obj_x <= self.screen.get_width() + 150:
-                    obj_type = obj_data['type']
-                    if obj_type in self.nature_objects:
-                        screen.blit(self.nature_objects[obj_type], (obj_x, obj_y))
-                        objects_drawn += 1
+        for obj_type, obj_x, obj_y in self.scenery.visible(camera_x, self.screen.get_width()):
+            image = self.nature_objects.get(obj_type)
+            if image is not None:
+                screen.blit(image, (obj_x, obj_y))
+                objects_drawn += 1
 
         # Debug: Informasi rendering (dinonaktifkan untuk performa)
         # if hasattr(self, 'debug_counter'):
@@ -497,24 +359,6 @@ class Object:
         # if self.debug_counter % 60 == 0:  # Setiap 1 detik (60 FPS)
         #     print(f"Objek alam digambar: {objects_drawn}, Posisi kamera: {self.x}")
         
-        # Update dan gambar efek daun beterbangan
-        # Kumpulkan posisi pohon yang terlihat untuk spawn daun
-        visible_tree_positions = []
-        for obj_data in self.nature_positions:
-            if obj_data['type'] in ['pohon', 'pohon_medium', 'tumbuhan']:
-                obj_x = obj_data['x'] - self.x
-                obj_y = obj_data['y']
-                
-                # Hanya pohon yang terlihat di layar
-                if -300 <= obj_x <= self.screen.get_width() + 300:
-                    visible_tree_positions.append({
-                        'x': obj_x,
-                        'y': obj_y
-                    })
-        
-        # Update efek daun dengan posisi pohon yang terlihat
-        self.leaf_effect.update(visible_tree_positions)
-        
         # Gambar efek daun di atas semua objek alam
         self.leaf_effect.draw(screen)
 
@@ -526,7 +370,9 @@ class Object:
         self.background_x1 = 0
         self.background_x2 = self.screen.get_width()
         self.is_downfall = False
-        self.x_downfall = []
+        self.prev_x = self.x
+        self.prev_road_x = self.road_x
+        self.background_shift = 0
         
         # Reset boss mode ke normal
         self.boss_mode = False
@@ -538,131 +384,11 @@ class Object:
         if self.boss_mode:
             self.downfall_positions = []     # Tidak ada jurang di mode boss
         else:
-            self.downfall_positions = [6, 9, 11, 14, 15, 18, 22, 25, 28, 31, 35, 38, 42, 45, 48, 52, 55, 58, 62, 65, 68, 72, 75, 78, 82, 85]  # Daftar posisi di mana jurang muncul
-        
-        # Regenerate objek alam dengan pola baru
-        self.nature_positions = []  # Reset posisi objek alam
-        
-        # Buat pola alam yang realistis dengan seed tetap
-        import random
-        random.seed(42)  # Gunakan seed tetap agar pola konsisten seperti permainan awal
-        
-        # Tempatkan objek alam dengan pola natural (hanya di area tiles yang aman)
-        for section in range(0, 80):  # Buat 80 bagian lingkungan untuk scene yang sangat panjang
-            section_x = section * 300  # Setiap bagian selebar 300 pixel
-
-            # Pohon besar (jarang, di belakang jalan)
-            if random.random() < 0.3:  # 30% kemungkinan ada pohon besar
-                for attempt in range(10):  # Coba maksimal 10 kali untuk posisi aman
-                    obj_x = section_x + random.randint(0, 200)
-                    obj_width = self.nature_objects['pohon'].get_width() if 'pohon' in self.nature_objects else 100
-                    if self._is_safe_position(obj_x, obj_width):
-                        # Hitung posisi Y agar bagian bawah objek berada di Y=360 dengan offset tambahan
-                        obj_height = self.nature_objects['pohon'].get_height() if 'pohon' in self.nature_objects else 100
-                        offset_tambahan = 100  # Offset untuk menurunkan objek lebih jauh
-                        self.nature_positions.append({
-                            'type': 'pohon',
-                            'x': obj_x,
-                            'y': 360 - obj_height + offset_tambahan  # Bagian bawah objek di Y=360 + offset
-                        })
-                        break
-
-            # Pohon medium (lebih sering, di samping jalan)
-            if random.random() < 0.5:  # 50% kemungkinan ada pohon medium
-                for attempt in range(10):  # Coba maksimal 10 kali untuk posisi aman
-                    obj_x = section_x + random.randint(50, 250)
-                    obj_width = self.nature_objects['pohon_medium'].get_width() if 'pohon_medium' in self.nature_objects else 80
-                    if self._is_safe_position(obj_x, obj_width):
-                        # Hitung posisi Y agar bagian bawah objek berada di Y=360 dengan offset tambahan
-                        obj_height = self.nature_objects['pohon_medium'].get_height() if 'pohon_medium' in self.nature_objects else 80
-                        offset_tambahan = 100  # Offset untuk menurunkan objek lebih jauh
-                        self.nature_positions.append({
-                            'type': 'pohon_medium',
-                            'x': obj_x,
-                            'y': 360 - obj_height + offset_tambahan  # Bagian bawah objek di Y=360 + offset
-                        })
-                        break
-
-            # Tumbuhan datar (sering, di tepi jalan)
-            for _ in range(random.randint(1, 3)):  # 1-3 tumbuhan per bagian
-                for attempt in range(10):  # Coba maksimal 10 kali untuk posisi aman
-                    obj_x = section_x + random.randint(0, 280)
-                    obj_width = self.nature_objects['tumbuhan'].get_width() if 'tumbuhan' in self.nature_objects else 60
-                    if self._is_safe_position(obj_x, obj_width):
-                        # Hitung posisi Y agar bagian bawah objek berada di Y=360 dengan offset tambahan
-                        obj_height = self.nature_objects['tumbuhan'].get_height() if 'tumbuhan' in self.nature_objects else 60
-                        offset_tambahan = 100  # Offset untuk menurunkan objek lebih jauh
-                        self.nature_positions.append({
-                            'type': 'tumbuhan',
-                            'x': obj_x,
-                            'y': 360 - obj_height + offset_tambahan  # Bagian bawah objek di Y=360 + offset
-                        })
-                        break
-
-            # Rumput (banyak, di area jalan)
-            for _ in range(random.randint(2, 5)):  # 2-5 rumput per bagian
-                for attempt in range(10):  # Coba maksimal 10 kali untuk posisi aman
-                    obj_x = section_x + random.randint(0, 300)
-                    obj_width = self.nature_objects['rumput'].get_width() if 'rumput' in self.nature_objects else 40
-                    if self._is_safe_position(obj_x, obj_width):
-                        # Hitung posisi Y agar bagian bawah objek berada di Y=360 dengan offset tambahan
-                        obj_height = self.nature_objects['rumput'].get_height() if 'rumput' in self.nature_objects else 40
-                        offset_tambahan = 100  # Offset untuk menurunkan objek lebih jauh
-                        self.nature_positions.append({
-                            'type': 'rumput',
-                            'x': obj_x,
-                            'y': 360 - obj_height + offset_tambahan  # Bagian bawah objek di Y=360 + offset
-                        })
-                        break
-
-            # Bunga (cantik, di area jalan yang aman)
-            if random.random() < 0.7:  # 70% kemungkinan ada bunga
-                for _ in range(random.randint(1, 2)):  # 1-2 bunga per bagian
-                    for attempt in range(10):  # Coba maksimal 10 kali untuk posisi aman
-                        obj_x = section_x + random.randint(20, 280)
-                        obj_width = self.nature_objects['bunga'].get_width() if 'bunga' in self.nature_objects else 30
-                        if self._is_safe_position(obj_x, obj_width):
-                            # Hitung posisi Y agar bagian bawah objek berada di Y=360 dengan offset tambahan
-                            obj_height = self.nature_objects['bunga'].get_height() if 'bunga' in self.nature_objects else 30
-                            offset_tambahan = 100  # Offset untuk menurunkan objek lebih jauh
-                            self.nature_positions.append({
-                                'type': 'bunga',
-                                'x': obj_x,
-                                'y': 360 - obj_height + offset_tambahan  # Bagian bawah objek di Y=360 + offset
-                            })
-                            break
-
-            # Batu (jarang, di area jalan yang aman)
-            if random.random() < 0.4:  # 40% kemungkinan ada batu
-                for attempt in range(10):  # Coba maksimal 10 kali untuk posisi aman
-                    obj_x = section_x + random.randint(0, 300)
-                    obj_width = self.nature_objects['batu'].get_width() if 'batu' in self.nature_objects else 50
-                    if self._is_safe_position(obj_x, obj_width):
-                        # Hitung posisi Y agar bagian bawah objek berada di Y=360 dengan offset tambahan
-                        obj_height = self.nature_objects['batu'].get_height() if 'batu' in self.nature_objects else 50
-                        offset_tambahan = 100  # Offset untuk menurunkan objek lebih jauh
-                        self.nature_positions.append({
-                            'type': 'batu',
-                            'x': obj_x,
-                            'y': 360 - obj_height + offset_tambahan  # Bagian bawah objek di Y=360 + offset
-                        })
-                        break
-
-            # Plang (sangat jarang, strategis di area jalan)
-            if random.random() < 0.1:  # 10% kemungkinan ada plang
-                for attempt in range(10):  # Coba maksimal 10 kali untuk posisi aman
-                    obj_x = section_x + random.randint(50, 250)
-                    obj_width = self.nature_objects['plang'].get_width() if 'plang' in self.nature_objects else 70
-                    if self._is_safe_position(obj_x, obj_width):
-                        # Hitung posisi Y agar bagian bawah objek berada di Y=360 dengan offset tambahan
-                        obj_height = self.nature_objects['plang'].get_height() if 'plang' in self.nature_objects else 70
-                        offset_tambahan = 100  # Offset untuk menurunkan objek lebih jauh
-                        self.nature_positions.append({
-                            'type': 'plang',
-                            'x': obj_x,
-                            'y': 360 - obj_height + offset_tambahan  # Bagian bawah objek di Y=360 + offset
-                        })
-                        break
+            self.downfall_positions = list(DOWNFALL_POSITIONS)  # Daftar posisi di mana jurang muncul
+        self.update_chasms()
         
+        # Ambil lagi objek alam dengan pola yang sama seperti permainan awal
+        self.generate_nature_positions()
+
         # Reset efek daun beterbangan
         self.leaf_effect = LeafEffect(self.screen.get_width(), self.screen.get_height())
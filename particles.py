@@ -0,0 +1,191 @@
+# File untuk semua partikel kecil: percikan darah, percikan tanah, dan serpihan ledakan
+# Dulu setiap percikan adalah satu objek Spark dan setiap serpihan ledakan satu kamus (dict).
+# Sekarang semua partikel disimpan di beberapa array NumPy yang sudah disiapkan
+# (posisi, kecepatan, warna, ukuran, umur), lalu digerakkan sekaligus dengan
+# hitungan array. Partikel yang mati dibuang bersama-sama setelah setiap langkah.
+#
+# Ada dua jenis partikel:
+# - SPARK: percikan berbentuk tetesan (aturan gerak sama dengan Spark yang lama)
+# - DEBRIS: serpihan bulat dari ledakan (aturan gerak sama dengan partikel Explosion yang lama)
+
+import math  # Library untuk perhitungan matematika
+import numpy  # Library untuk hitungan array
+import pygame  # Library untuk membuat game
+
+SPARK, DEBRIS = 0, 1  # Jenis partikel
+
+class ParticleSystem:
+    """Kelas ParticleSystem - Semua partikel game dalam satu tempat
+
+    Seperti satu lembar tabel besar: setiap baris satu partikel, setiap
+    kolom satu sifat (posisi, kecepatan, warna, ...). Menggerakkan semua
+    partikel berarti menghitung satu kolom sekaligus, bukan baris demi baris.
+
+    Arti kolom untuk setiap jenis:
+    - SPARK: velocity = arah x kecepatan, life = kecepatan (mati saat habis), scale = ukuran tetesan
+    - DEBRIS: velocity = kecepatan, life = sisa langkah hidup, scale = jari-jari lingkaran
+    """
+    def __init__(self, capacity=1024):
+        """Menyiapkan array kosong untuk capacity partikel (bertambah sendiri jika penuh)"""
+        self.count = 0  # Banyaknya partikel yang hidup (baris 0 sampai count-1)
+        self.emit_fraction = 1.0  # Bagian partikel baru yang benar-benar dibuat (diatur EffectGovernor)
+        self.allocate(capacity)
+
+    def allocate(self, capacity):
+        """Membuat array baru sebesar capacity dan menyalin partikel yang masih hidup"""
+        old = getattr(self, 'position', None)
+        fields = {
+            'position': numpy.zeros((capacity, 2)),                 # Posisi (x, y)
+            'velocity': numpy.zeros((capacity, 2)),                 # Gerakan per langkah (x, y)
+            'color': numpy.zeros((capacity, 3), dtype=numpy.uint8), # Warna (merah, hijau, biru)
+            'scale': numpy.zeros(capacity),                         # Ukuran
+            'life': numpy.zeros(capacity),                          # Umur (lihat arti kolom di atas)
+            'kind': numpy.zeros(capacity, dtype=numpy.int8),        # Jenis partikel (SPARK/DEBRIS)
+        }
+        for name, array in fields.items():
+            if old is not None:
+                array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def __len__(self):
+        """Banyaknya partikel yang masih hidup"""
+        return self.count
+
+    def clear(self):
+        """Hapus semua partikel"""
+        self.count = 0
+
+    def emitted(self, count):
+        """Banyaknya partikel yang dibuat dari count partikel yang diminta (paling sedikit 1)"""
+        return max(1, int(round(count * self.emit_fraction))) if count else 0
+
+    def reserve(self, amount):
+        """Baris untuk amount partikel baru (array diperbesar dua kali lipat jika penuh)"""
+        start = self.count
+        if start + amount > self.capacity:
+            self.allocate(max(self.capacity * 2, start + amount))
+        self.count += amount
+        return slice(start, start + amount)
+
+    def emit_sparks(self, xs, ys, angles, speeds, colors, scales=1, direction=1):
+        """Menambahkan beberapa percikan sekaligus (parameter sama dengan Spark yang lama)
+
+        Parameter:
+        - xs, ys: Posisi awal setiap percikan
+        - angles: Arah terbang setiap percikan (dalam radian)
+        - speeds: Seberapa cepat setiap percikan bergerak
+        - colors: Warna setiap percikan (r, g, b)
+        - scales: Ukuran setiap percikan (satu angka = sama untuk semua)
+        - direction: Arah umum (1 = kanan, -1 = kiri, sudut dicerminkan)
+        """
+        keep = self.emitted(len(xs))  # Angka acak sudah diambil semua, yang dibuat hanya sebagian
+        rows = self.reserve(keep)
+        xs, ys, angles, speeds, colors = xs[:keep], ys[:keep], angles[:keep], speeds[:keep], colors[:keep]
+        if not numpy.isscalar(scales):
+            scales = scales[:keep]
+        angles = numpy.asarray(angles, dtype=float)
+        if direction != 1:
+            angles = math.pi - angles  # Cerminkan arah ke kiri
+        speeds = numpy.asarray(speeds, dtype=float)
+        self.position[rows, 0] = xs
+        self.position[rows, 1] = ys
+        self.velocity[rows, 0] = numpy.cos(angles) * speeds
+        self.velocity[rows, 1] = numpy.sin(angles) * speeds
+        self.color[rows] = colors
+        self.scale[rows] = scales
+        self.life[rows] = speeds
+        self.kind[rows] = SPARK
+
+    def emit_spark(self, x, y, angle, speed, color, scale=1, direction=1):
+        """Menambahkan satu percikan"""
+        self.emit_sparks([x], [y], [angle], [speed], [color], scale, direction)
+
+    def emit_debris(self, x, y, velocities, colors, sizes, lives):
+        """Menambahkan serpihan ledakan yang semuanya mulai dari titik (x, y)
+
+        Parameter:
+        - velocities: Kecepatan setiap serpihan [(vel_x, vel_y), ...]
+        - colors: Warna setiap serpihan (r, g, b)
+        - sizes: Jari-jari setiap serpihan
+        - lives: Berapa langkah setiap serpihan hidup
+        """
+        keep = self.emitted(len(velocities))
+        rows = self.reserve(keep)
+        velocities, colors, sizes, lives = velocities[:keep], colors[:keep], sizes[:keep], lives[:keep]
+        self.position[rows] = (x, y)
+        self.velocity[rows] = velocities
+        self.color[rows] = colors
+        self.scale[rows] = sizes
+        self.life[rows] = lives
+        self.kind[rows] = DEBRIS
+
+    def steer_sparks(self, sparks, friction, force, terminal_velocity, dt):
+        """Belokkan arah percikan karena gravitasi dan gesekan (seperti Spark.velocity_adjust)
+
+        Kecepatan percikan tidak berubah, hanya arahnya yang ikut tertarik ke bawah.
+        """
+        movement = self.velocity[sparks] * dt
+        movement[:, 1] = numpy.minimum(terminal_velocity, movement[:, 1] + force * dt)  # Gravitasi
+        movement[:, 0] *= friction  # Gesekan
+        length = numpy.hypot(movement[:, 0], movement[:, 1])
+        still = length == 0
+        length[still] = 1
+        movement /= length[:, None]
+        movement[still] = (1, 0)  # Tanpa gerakan: menghadap kanan (seperti atan2(0, 0) = 0)
+        self.velocity[sparks] = movement * self.life[sparks, None]
+
+    def update(self):
+        """Gerakkan semua partikel satu langkah simulasi, lalu buang yang mati"""
+        count = self.count
+        if not count:
+            return
+        kind = self.kind[:count]
+        sparks = numpy.flatnonzero(kind == SPARK)
+        debris = numpy.flatnonzero(kind == DEBRIS)
+
+        # Percikan: sama seperti velocity_adjust(1, 0.2, 8, 1) lalu move(5) di Spark yang lama
+        if len(sparks):
+            self.steer_sparks(sparks, 1, 0.2, 8, 1)
+            self.position[sparks] += self.velocity[sparks] * 5
+            self.life[sparks] -= 0.05  # Percikan melemah
+            self.steer_sparks(sparks, 0.98, 0.15, 6, 5)
+
+        # Serpihan ledakan: bergerak, gravitasi ringan, gesekan, lalu memudar
+        if len(debris):
+            self.position[debris] += self.velocity[debris]
+            self.velocity[debris, 1] += 0.1
+            self.velocity[debris] *= 0.98
+            self.life[debris] -= 1
+            fading = debris[self.life[debris] < 10]
+            self.color[fading] = (self.color[fading] * (self.life[fading, None] / 10)).astype(numpy.uint8)
+
+        # Buang semua partikel mati sekaligus (geser yang hidup ke depan)
+        alive = self.life[:count] > 0
+        kept = int(alive.sum())
+        if kept < count:
+            for name in ('position', 'velocity', 'color', 'scale', 'life', 'kind'):
+                array = getattr(self, name)
+                array[:kept] = array[:count][alive]
+            self.count = kept
+
+    def draw(self, surface):
+        """Gambar semua partikel: percikan sebagai tetesan, serpihan sebagai lingkaran"""
+        count = self.count
+        if not count:
+            return
+        kind = self.kind[:count]
+        sparks = numpy.flatnonzero(kind == SPARK)
+        if len(sparks):
+            # Titik-titik tetesan: ujung depan, sisi atas, ekor, sisi bawah
+            location = self.position[sparks]
+            reach = self.velocity[sparks] * self.scale[sparks, None]  # Arah x kecepatan x ukuran
+            side = numpy.stack((-reach[:, 1], reach[:, 0]), axis=1) * 0.3  # Tegak lurus arah gerak
+            points = numpy.stack((location + reach, location + side, location - reach * 3.5, location - side), axis=1)
+            for color, polygon in zip(self.color[sparks].tolist(), points.tolist()):
+                pygame.draw.polygon(surface, color, polygon)
+        debris = numpy.flatnonzero(kind == DEBRIS)
+        if len(debris):
+            centers = self.position[debris].astype(int).tolist()
+            for color, center, size in zip(self.color[debris].tolist(), centers, self.scale[debris].astype(int).tolist()):
+                pygame.draw.circle(surface, color, center, size)
@@ -1,5 +1,7 @@
 import pygame
-import random
+from game_random import random_streams
+
+rain_random = random_streams.get('rain')  # Angka acak khusus hujan
 
 class RainDrop:
     """Kelas untuk satu tetes hujan"""
@@ -8,7 +10,7 @@ class RainDrop:
         self.y = y
         self.speed = speed
         self.length = length
-        self.angle = random.uniform(-0.2, 0.2)  # Sedikit miring untuk efek angin
+        self.angle = rain_random.uniform(-0.2, 0.2)  # Sedikit miring untuk efek angin
 
     def update(self, screen_height):
         """Update posisi tetes hujan"""
@@ -17,8 +19,8 @@ class RainDrop:
 
         # Reset jika sudah keluar layar
         if self.y > screen_height + 10:
-            self.y = -random.randint(10, 50)
-            self.x = random.randint(-50, 850)  # Sedikit lebih lebar dari layar
+            self.y = -rain_random.randint(10, 50)
+            self.x = rain_random.randint(-50, 850)  # Sedikit lebih lebar dari layar
 
     def draw(self, screen):
         """Gambar tetes hujan"""
@@ -47,10 +49,10 @@ class RainEffect:
 
         # Buat tetes hujan
         for _ in range(intensity):
-            x = random.randint(-50, screen_width + 50)
-            y = random.randint(-screen_height, 0)
-            speed = random.uniform(8, 15)
-            length = random.randint(10, 20)
+            x = rain_random.randint(-50, screen_width + 50)
+            y = rain_random.randint(-screen_height, 0)
+            speed = rain_random.uniform(8, 15)
+            length = rain_random.randint(10, 20)
             self.raindrops.append(RainDrop(x, y, speed, length))
 
         # Overlay untuk efek gelap
@@ -76,10 +78,10 @@ class RainEffect:
         if new_intensity > len(self.raindrops):
             # Tambah tetes hujan
             for _ in range(new_intensity - len(self.raindrops)):
-                x = random.randint(-50, self.screen_width + 50)
-                y = random.randint(-self.screen_height, 0)
-                speed = random.uniform(8, 15)
-                length = random.randint(10, 20)
+                x = rain_random.randint(-50, self.screen_width + 50)
+                y = rain_random.randint(-self.screen_height, 0)
+                speed = rain_random.uniform(8, 15)
+                length = rain_random.randint(10, 20)
                 self.raindrops.append(RainDrop(x, y, speed, length))
         elif new_intensity < len(self.raindrops):
             # Kurangi tetes hujan
@@ -0,0 +1,106 @@
+# File untuk memutar ulang rekaman permainan (replay)
+# Rekaman dibuat dengan: python3 main.py --record rekaman.json
+# Tombol dari rekaman diberikan lagi ke game pada langkah simulasi yang sama,
+# dengan benih angka acak yang sama, jadi permainannya terulang persis.
+# Setiap langkah, sidik jari keadaan game dibandingkan dengan rekaman.
+#
+# Cara memakai: python3 replay.py rekaman.json               (tanpa jendela, secepat mungkin)
+#               python3 replay.py rekaman.json --render      (dengan jendela, kecepatan asli)
+#               python3 replay.py rekaman.json --render 10   (dengan jendela, 10x lebih cepat)
+
+import os, sys, time  # Library untuk pengaturan, perintah, dan waktu
+if '--render' not in sys.argv:
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'  # Layar palsu: tidak ada jendela yang dibuka
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')  # Tidak perlu suara
+import pygame  # Library untuk membuat game
+from gameplay import GamePlay  # Otak permainan
+from input_source import ScriptedInput  # Tombol yang ditekan oleh program
+from input_recording import load_recording, frame_events  # Membuka file rekaman
+from game_clock import simulation_clock  # Jam simulasi dengan langkah tetap
+from game_random import seed_session  # Benih untuk semua aliran angka acak
+from constants import SIMULATION_FPS  # Langkah simulasi per detik
+
+class ReplayRunner:
+    """Kelas ReplayRunner - Memutar ulang rekaman langkah demi langkah
+
+    Urutan setiap langkah sama dengan game loop di GamePlay.run():
+    baca kejadian tombol, lalu satu langkah simulasi (boss juga dicek di dalam langkah).
+    """
+    def __init__(self, recording):
+        """Menyiapkan game untuk sebuah rekaman (hasil load_recording)"""
+        self.recording = recording
+        self.input = ScriptedInput()
+        simulation_clock.total_steps = recording['start_step']  # Timer game mulai dari angka yang sama
+        self.game = GamePlay(self.input)
+        self.game.load_world()
+        self.game.load_sprites(recording['character'])
+        seed_session(recording['seed'])
+
+    def run(self, render=False, speed=1.0):
+        """Putar seluruh rekaman
+
+        Parameter:
+        - render: True untuk menggambar setiap langkah di jendela
+        - speed: Kecepatan putar saat render (2 = dua kali lebih cepat)
+
+        Return kamus hasil: langkah, waktu, kecepatan, dan langkah pertama yang berbeda (atau None).
+        """
+        game = self.game
+        frames = self.recording['frames']
+        hashes = self.recording['hashes']
+        next_frame = 0
+        divergence = None
+        start = time.perf_counter()
+        step = 0
+        while step < len(hashes) and game.running:
+            # Kejadian tombol yang dibaca game sebelum langkah ini
+            while next_frame < len(frames) and frames[next_frame][0] <= step:
+                held, events = frame_events(frames[next_frame])
+                self.input.load(held, events)
+                game.event_handler()
+                next_frame += 1
+
+            game.simulation_step()
+            if game.state_hash() != hashes[step]:
+                divergence = step
+                break
+            step += 1
+
+            if render:
+                game.draw_frame(1.0)
+                pygame.display.update()
+                game.clock.tick(SIMULATION_FPS * speed)
+        elapsed = time.perf_counter() - start
+
+        return {
+            'steps': step,
+            'recorded_steps': len(hashes),
+            'wall_seconds': elapsed,
+            'steps_per_second': step / elapsed if elapsed > 0 else 0.0,
+            'realtime_factor': step / SIMULATION_FPS / elapsed if elapsed > 0 else 0.0,
+            'divergence': divergence,
+            'score': game.get_score(),
+        }
+
+def format_result(result):
+    """Membuat teks hasil yang mudah dibaca"""
+    if result['divergence'] is None:
+        status = f"cocok: {result['steps']}/{result['recorded_steps']} langkah sama persis"
+    else:
+        status = f"BERBEDA mulai langkah {result['divergence']} (dari {result['recorded_steps']})"
+    return (f"{status}\n"
+            f"{result['wall_seconds']:.2f} detik, {result['steps_per_second']:.0f} langkah per detik "
+            f"({result['realtime_factor']:.1f}x kecepatan asli), skor {result['score']}")
+
+if __name__ == '__main__':
+    arguments = [argument for argument in sys.argv[1:] if not argument.startswith('--')]
+    if not arguments:
+        print("Cara memakai: python3 replay.py rekaman.json [--render [kecepatan]]")
+        sys.exit(1)
+    render = '--render' in sys.argv
+    speed = float(arguments[1]) if len(arguments) > 1 else 1.0
+    runner = ReplayRunner(load_recording(arguments[0]))
+    result = runner.run(render, speed)
+    print(format_result(result))
+    pygame.quit()
+    sys.exit(0 if result['divergence'] is None else 1)
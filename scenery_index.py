@@ -0,0 +1,88 @@
+# File untuk indeks objek alam (pohon, batu, bunga, ...) di sepanjang jalan
+# Objek alam tidak pernah bergerak, jadi cukup diurutkan sekali berdasarkan posisi X.
+# Setiap lapisan gambar (layer) punya daftar urutnya sendiri, disimpan dalam
+# array angka yang hemat memori (array('i')), bukan kamus (dict) per objek.
+# Objek yang terlihat di layar dicari dengan pencarian biner (bisect), jadi
+# pekerjaan per frame hanya sebanyak objek yang terlihat, bukan semua objek di level.
+
+import bisect  # Library untuk mencari di daftar yang sudah urut
+from array import array  # Daftar angka yang hemat memori
+
+# Lapisan gambar dari belakang ke depan: (jenis objek, jarak tambahan di luar layar)
+SCENERY_LAYERS = (
+    (('pohon',), 300),                       # Layer 1: Pohon besar (paling belakang)
+    (('pohon_medium',), 250),                # Layer 2: Pohon medium
+    (('plang', 'batu'), 200),                # Layer 3: Plang dan batu
+    (('tumbuhan', 'rumput', 'bunga'), 150),  # Layer 4: Tumbuhan, rumput, dan bunga (paling depan)
+)
+LEAF_TYPES = ('pohon', 'pohon_medium', 'tumbuhan')  # Objek yang menjatuhkan daun
+LEAF_MARGIN = 300  # Pohon sejauh ini di luar layar masih menjatuhkan daun
+
+class SceneryLayer:
+    """Kelas SceneryLayer - Semua objek alam dalam satu lapisan gambar, urut dari kiri ke kanan"""
+    def __init__(self, types, margin, objects):
+        """Membuat lapisan dari daftar (nomor urut asli, objek) milik lapisan ini
+
+        Parameter:
+        - types: Jenis objek di lapisan ini (contoh: ('plang', 'batu'))
+        - margin: Objek sejauh ini di luar layar masih digambar
+        - objects: Daftar (nomor urut asli, {'type', 'x', 'y'})
+        """
+        self.types = types    # Nomor jenis -> nama jenis
+        self.margin = margin  # Jarak tambahan di luar layar
+        objects = sorted(objects, key=lambda item: (item[1]['x'], item[0]))
+        self.xs = array('i', (obj['x'] for _, obj in objects))                 # Posisi X (urut)
+        self.ys = array('i', (obj['y'] for _, obj in objects))                 # Posisi Y
+        self.kinds = array('b', (types.index(obj['type']) for _, obj in objects))  # Nomor jenis
+        self.orders = array('i', (order for order, _ in objects))              # Nomor urut saat dibuat
+
+    def __len__(self):
+        """Banyaknya objek di lapisan ini"""
+        return len(self.xs)
+
+    def window(self, left, right):
+        """Nomor objek dengan left <= x <= right, dalam urutan objek itu dibuat
+
+        Urutan pembuatan dipakai agar objek yang bertumpuk digambar dengan
+        urutan yang sama seperti sebelum ada indeks ini.
+        """
+        start = bisect.bisect_left(self.xs, left)
+        end = bisect.bisect_right(self.xs, right)
+        return sorted(range(start, end), key=self.orders.__getitem__)
+
+class SceneryIndex:
+    """Kelas SceneryIndex - Semua objek alam, dikelompokkan per lapisan gambar
+
+    Seperti rak buku yang sudah diberi label per huruf: untuk mengambil buku
+    yang terlihat di layar, kita langsung ke rak yang tepat.
+    """
+    def __init__(self, layout):
+        """Membuat indeks dari hasil world_generation.scenery_layout (daftar {'type', 'x', 'y'})"""
+        self.layers = []
+        for types, margin in SCENERY_LAYERS:
+            objects = [(order, obj) for order, obj in enumerate(layout) if obj['type'] in types]
+            self.layers.append(SceneryLayer(types, margin, objects))
+        # Lapisan yang punya objek penjatuh daun
+        self.leaf_layers = [layer for layer in self.layers if any(kind in LEAF_TYPES for kind in layer.types)]
+
+    def __len__(self):
+        """Banyaknya objek alam di seluruh level"""
+        return sum(len(layer) for layer in self.layers)
+
+    def visible(self, camera_x, screen_width):
+        """Objek yang perlu digambar, dari lapisan belakang ke depan: daftar (jenis, x layar, y)"""
+        drawn = []
+        for layer in self.layers:
+            for index in layer.window(camera_x - layer.margin, camera_x + screen_width + layer.margin):
+                drawn.append((layer.types[layer.kinds[index]], layer.xs[index] - camera_x, layer.ys[index]))
+        return drawn
+
+    def tree_anchors(self, camera_x, screen_width):
+        """Posisi layar objek yang menjatuhkan daun (untuk LeafEffect): daftar {'x', 'y'}"""
+        anchors = []
+        for layer in self.leaf_layers:
+            for index in layer.window(camera_x - LEAF_MARGIN, camera_x + screen_width + LEAF_MARGIN):
+                if layer.types[layer.kinds[index]] in LEAF_TYPES:
+                    anchors.append((layer.orders[index], layer.xs[index] - camera_x, layer.ys[index]))
+        anchors.sort()  # Urutan pembuatan, sama seperti sebelum ada indeks ini
+        return [{'x': x, 'y': y} for _, x, y in anchors]
@@ -0,0 +1,216 @@
+# File untuk membuat dunia game (world generation)
+# File ini menentukan letak pohon, batu, bunga, dan zombie di sepanjang jalan.
+# Dunia dibuat dari "benih" (seed) yang sama, jadi hasilnya selalu sama,
+# dan hasilnya disimpan (di memori dan di disk) agar tidak perlu dibuat ulang.
+
+import os, json, random, hashlib  # Library untuk file, JSON, angka acak, dan sidik jari
+from constants import BAKE_FOLDER  # Folder cache
+from chasm_map import ChasmMap  # Peta jurang bersama
+
+# Ukuran cadangan objek alam jika gambarnya tidak bisa dimuat (lebar = tinggi)
+DEFAULT_OBJECT_SIZES = {
+    'pohon': 100,
+    'pohon_medium': 80,
+    'tumbuhan': 60,
+    'rumput': 40,
+    'bunga': 30,
+    'batu': 50,
+    'plang': 70,
+}
+
+GROUND_Y = 360        # Bagian bawah objek alam berada di Y=360
+OBJECT_Y_OFFSET = 100 # Offset untuk menurunkan objek lebih jauh
+
+_layout_cache = {}  # Kunci parameter -> hasil yang sudah pernah dibuat
+
+class WorldGenerator:
+    """Kelas WorldGenerator - Pembuat dunia untuk satu susunan jalan dan jurang
+
+    Semua angka acak diambil dari random.Random(seed) milik sendiri,
+    bukan dari random global, jadi bagian game lain tidak ikut terpengaruh.
+    """
+    def __init__(self, road_width, downfall_positions):
+        """Membuat pembuat dunia
+
+        Parameter:
+        - road_width: Lebar satu ubin jalan (pixel)
+        - downfall_positions: Nomor ubin yang berupa jurang
+        """
+        self.road_width = road_width  # Lebar satu ubin jalan
+        self.chasms = ChasmMap(downfall_positions, road_width)  # Peta jurang (cepat dicek)
+
+    def is_safe_position(self, x_position, obj_width=0):
+        """Mengecek apakah posisi X aman (tidak di area jurang)
+
+        Parameter:
+        - x_position: Posisi X yang akan dicek
+        - obj_width: Lebar objek untuk memastikan seluruh objek aman
+
+        Return:
+        - True jika posisi aman (ada tiles jalan)
+        - False jika posisi berbahaya (area jurang)
+        """
+        tile_index_start = int(x_position // self.road_width)
+        tile_index_end = int((x_position + obj_width) // self.road_width)
+
+        # Cek apakah ada tile jurang di area yang akan ditempati objek
+        if self.chasms.has_chasm_tile(tile_index_start, tile_index_end):
+            return False  # Posisi berbahaya (objek akan melewati jurang)
+
+        # Cek tile sebelah kiri dan kanan: jika ada jurang, beri jarak aman yang lebih besar
+        left_is_chasm = self.chasms.is_chasm_tile(tile_index_start - 1)
+        right_is_chasm = self.chasms.is_chasm_tile(tile_index_end + 1)
+        if left_is_chasm or right_is_chasm:
+            # Minimal 20% lebar tile atau 50% lebar objek
+            safety_margin = max(self.road_width * 0.2, obj_width * 0.5)
+            tile_start = tile_index_start * self.road_width
+            tile_end = (tile_index_end + 1) * self.road_width
+            if (left_is_chasm and (x_position - tile_start) < safety_margin) or \
+               (right_is_chasm and (tile_end - (x_position + obj_width)) < safety_margin):
+                return False  # Terlalu dekat dengan jurang
+
+        return True  # Posisi aman (ada tiles jalan)
+
+    def generate_scenery(self, rng, object_sizes, sections=80, section_width=300):
+        """Menempatkan objek alam di setiap bagian jalan (satu kali jalan dari kiri ke kanan)
+
+        Parameter:
+        - rng: random.Random milik pembuat dunia
+        - object_sizes: Ukuran gambar objek alam {'pohon': (lebar, tinggi), ...}
+        - sections: Jumlah bagian lingkungan
+        - section_width: Lebar setiap bagian (pixel)
+
+        Return daftar {'type', 'x', 'y'} untuk setiap objek alam.
+        """
+        positions = []
+
+        def place(obj_type, x_min, x_max, section_x):
+            # Coba maksimal 10 kali untuk posisi aman
+            default_size = DEFAULT_OBJECT_SIZES[obj_type]
+            obj_width, obj_height = object_sizes.get(obj_type, (default_size, default_size))
+            for attempt in range(10):
+                obj_x = section_x + rng.randint(x_min, x_max)
+                if self.is_safe_position(obj_x, obj_width):
+                    positions.append({
+                        'type': obj_type,
+                        'x': obj_x,
+                        'y': GROUND_Y - obj_height + OBJECT_Y_OFFSET  # Bagian bawah objek di Y=360 + offset
+                    })
+                    return
+
+        for section in range(sections):
+            section_x = section * section_width
+            if rng.random() < 0.3:  # 30% kemungkinan ada pohon besar (di belakang jalan)
+                place('pohon', 0, 200, section_x)
+            if rng.random() < 0.5:  # 50% kemungkinan ada pohon medium (di samping jalan)
+                place('pohon_medium', 50, 250, section_x)
+            for _ in range(rng.randint(1, 3)):  # 1-3 tumbuhan datar per bagian
+                place('tumbuhan', 0, 280, section_x)
+            for _ in range(rng.randint(2, 5)):  # 2-5 rumput per bagian
+                place('rumput', 0, 300, section_x)
+            if rng.random() < 0.7:  # 70% kemungkinan ada bunga
+                for _ in range(rng.randint(1, 2)):  # 1-2 bunga per bagian
+                    place('bunga', 20, 280, section_x)
+            if rng.random() < 0.4:  # 40% kemungkinan ada batu
+                place('batu', 0, 300, section_x)
+            if rng.random() < 0.1:  # 10% kemungkinan ada plang
+                place('plang', 50, 250, section_x)
+        return positions
+
+    def generate_zombie_spawns(self, rng, zombie_types, start_x, max_x, zombie_width,
+                               num_zombies, min_distance, max_distance):
+        """Menentukan posisi dan jenis zombie yang aman dari jurang
+
+        Berjalan dari start_x ke kanan: jika aman, pasang zombie lalu lompat
+        sejauh jarak acak; jika tidak aman, geser 50 pixel dan coba lagi.
+        Return daftar (posisi X, jenis zombie).
+        """
+        # Sesuaikan target zombie jika melebihi kapasitas area
+        estimated_max_zombies = int((max_x - start_x) / min_distance)
+        if num_zombies > estimated_max_zombies:
+            print(f"⚠️  Target zombie ({num_zombies}) melebihi kapasitas area ({estimated_max_zombies})")
+            print(f"🔧 Menyesuaikan target zombie menjadi {estimated_max_zombies}")
+            num_zombies = estimated_max_zombies
+
+        positions = []
+        current_x = start_x
+        while current_x < max_x and len(positions) < num_zombies:
+            if self.is_safe_position(current_x, zombie_width):
+                positions.append(current_x)
+                current_x += rng.randint(min_distance, max_distance)  # Jarak acak ke zombie berikutnya
+            else:
+                current_x += 50  # Lompat 50 pixel dan coba lagi
+
+        # Jenis zombie dipilih setelah semua posisi ditentukan
+        return [(x, rng.choice(zombie_types)) for x in positions]
+
+def cached_layout(kind, params, build):
+    """Mengambil hasil yang sudah pernah dibuat, atau membuatnya lalu menyimpannya
+
+    Disimpan di memori dan di disk (BAKE_FOLDER/world), dengan kunci dari
+    semua parameter, jadi parameter berbeda menghasilkan file berbeda.
+    """
+    key = json.dumps([kind, params], sort_keys=True)
+    if key in _layout_cache:
+        return _layout_cache[key]
+
+    path = os.path.join(BAKE_FOLDER, 'world', f"{kind}_{hashlib.sha1(key.encode()).hexdigest()[:16]}.json")
+    layout = None
+    try:
+        with open(path) as file:
+            saved = json.load(file)
+        if saved.get('key') == key:
+            layout = saved['layout']
+    except (OSError, ValueError):
+        pass  # Belum pernah disimpan atau file rusak
+    if layout is None:
+        layout = build()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as file:
+                json.dump({'key': key, 'layout': layout}, file)
+        except OSError:
+            pass  # Tidak bisa menulis cache, tidak apa-apa
+
+    _layout_cache[key] = layout
+    return layout
+
+def scenery_layout(seed, road_width, downfall_positions, object_sizes, sections=80):
+    """Letak semua objek alam untuk satu dunia (hasilnya dipakai bersama, jangan diubah)"""
+    params = {
+        'seed': seed,
+        'road_width': road_width,
+        'downfall_positions': list(downfall_positions),
+        'object_sizes': {name: list(size) for name, size in object_sizes.items()},
+        'sections': sections,
+    }
+
+    def build():
+        generator = WorldGenerator(road_width, downfall_positions)
+        return generator.generate_scenery(random.Random(seed), object_sizes, sections)
+
+    return cached_layout('scenery', params, build)
+
+def zombie_layout(seed, road_width, downfall_positions, zombie_types, start_x, max_x, zombie_width,
+                  num_zombies=70, min_distance=80, max_distance=200):
+    """Posisi dan jenis semua zombie untuk satu dunia: daftar (posisi X, jenis zombie)"""
+    params = {
+        'seed': seed,
+        'road_width': road_width,
+        'downfall_positions': list(downfall_positions),
+        'zombie_types': list(zombie_types),
+        'start_x': start_x,
+        'max_x': max_x,
+        'zombie_width': zombie_width,
+        'num_zombies': num_zombies,
+        'min_distance': min_distance,
+        'max_distance': max_distance,
+    }
+
+    def build():
+        generator = WorldGenerator(road_width, downfall_positions)
+        return generator.generate_zombie_spawns(random.Random(seed), zombie_types, start_x, max_x, zombie_width,
+                                                num_zombies, min_distance, max_distance)
+
+    # JSON menyimpan pasangan sebagai list, ubah kembali menjadi tuple
+    return [tuple(spawn) for spawn in cached_layout('zombies', params, build)]
@@ -1,8 +1,10 @@
 # File untuk karakter zombie (musuh ninja)
 # File ini mengatur bagaimana zombie bergerak, menyerang, dan berinteraksi
 
-import os, re, math, random, pygame  # Library untuk membuat game
-from helper import resize_with_aspect_ratio  # Fungsi untuk mengubah ukuran gambar
+import re, math  # Library untuk teks (nama file) dan perhitungan matematika
+from asset_registry import registry  # Gudang gambar bersama
+import game_clock  # Waktu simulasi (ikut langkah logika game)
+from game_clock import lerp  # Menggambar di antara dua langkah simulasi
 from constants import MAX_WIDTH, MAX_HEIGHT  # Ukuran layar game
 
 class Zombie:
@@ -11,6 +13,14 @@ class Zombie:
     Zombie adalah musuh ninja yang akan berjalan dan menyerang.
     Mereka bisa bergerak, diserang, dan mati.
     """
+    # Daftar semua gerakan zombie (nama gerakan = awal nama file gambar)
+    ACTIONS = [
+        'Attack',    # Gambar saat zombie menyerang
+        'Dead',      # Gambar saat zombie mati
+        'Idle',      # Gambar saat zombie diam
+        'Walk',      # Gambar saat zombie berjalan
+    ]
+
     def __init__(self, sprite_folder, screen, zombie_ground, zombie_speed, init_pos, on_death_callback=None):
         """Membuat zombie baru
 
@@ -23,17 +33,13 @@ class Zombie:
         - on_death_callback: Fungsi yang dipanggil saat zombie mati
         """
         # Kamus untuk menyimpan semua gerakan zombie
-        self.actions = {
-            'Attack': [],    # Gambar saat zombie menyerang
-            'Dead': [],      # Gambar saat zombie mati
-            'Idle': [],      # Gambar saat zombie diam
-            'Walk': [],      # Gambar saat zombie berjalan
-        }
+        self.actions = {action: [] for action in Zombie.ACTIONS}
         self.zombie_speed = zombie_speed  # Seberapa cepat zombie bergerak
         self.screen = screen  # Layar tempat zombie muncul
         self.current_action = 'Walk'  # Gerakan yang sedang dilakukan (mulai dengan Walk)
         self.current_frame = 0  # Frame animasi yang sedang ditampilkan
         self.zombie_ground = zombie_ground  # Tinggi tanah tempat zombie berdiri
+        self.sprite_keys = []  # Kunci gambar yang dipinjam dari gudang bersama
         self.load_sprites(sprite_folder)  # Muat semua gambar zombie
 
         # Posisi zombie di layar (x = kiri-kanan, y = atas-bawah)
@@ -41,6 +47,9 @@ class Zombie:
         self.relative_x = self.init_pos  # Posisi relatif zombie
         self.x = self.init_pos + self.relative_x  # Posisi X zombie di layar
         self.y = self.zombie_ground  # Posisi Y zombie (tinggi tanah)
+        self.prev_x = self.x  # Posisi X di langkah simulasi sebelumnya (untuk menggambar halus)
+        self.rect_cache_key = None  # Gerakan, frame, arah, dan posisi saat kotak tabrakan dihitung
+        self.rect_cache = None  # Kotak tabrakan yang terakhir dihitung
 
         # Arah gerakan zombie
         self.facing_left = True  # Zombie menghadap kiri (True) atau kanan (False)
@@ -49,7 +58,8 @@ class Zombie:
 
         # Pengaturan animasi zombie
         self.frame_update_time = 0.1  # Seberapa cepat animasi berubah (0.1 detik)
-        self.last_frame_update = pygame.time.get_ticks()  # Kapan terakhir animasi berubah
+        self.last_frame_update = game_clock.get_ticks()  # Kapan terakhir animasi berubah
+        self.spawn_order = 0  # Nomor urut saat zombie dibuat (diisi GamePlay.add_zombie)
 
         # Status zombie saat bertarung
         self.is_hit = False  # Apakah zombie sedang terkena serangan
@@ -105,7 +115,8 @@ class Zombie:
         """Mengatur status hidup/mati zombie"""
         self.alive = alive
 
-    def extract_number(self, file_name):
+    @staticmethod
+    def extract_number(file_name):
         """Mengambil nomor urut dari nama file gambar
 
         Contoh: 'Walk (1).png' akan menghasilkan angka 1
@@ -115,37 +126,49 @@ class Zombie:
         return int(match.group(1)) if match else 0  # Return angka atau 0 jika tidak ditemukan
 
     def load_sprites(self, sprite_folder):
-        """Memuat semua gambar zombie dari folder
+        """Meminjam semua gambar zombie dari gudang bersama
 
-        Fungsi ini seperti membuka album foto zombie!
-        Setiap foto akan dikelompokkan berdasarkan gerakan zombie.
+        Fungsi ini seperti meminjam album foto zombie dari perpustakaan!
+        Gambar hanya dimuat sekali untuk semua zombie di folder yang sama.
         """
-        # Baca semua file di folder zombie
-        files = os.listdir(sprite_folder)
-        # Ambil hanya file gambar yang sesuai pola nama
-        filtered_files = [file for file in files if re.search(r'(Idle|Walk|Attack|Dead) \(\d+\)\.png', file)]
-        # Urutkan file berdasarkan nomor
-        sorted_files = sorted(filtered_files, key=self.extract_number)
-
-        # Muat setiap gambar
-        for filename in sorted_files:
-            if filename.endswith('.png'):  # Hanya file PNG
-                path = os.path.join(sprite_folder, filename)  # Buat alamat lengkap file
-                sprite = pygame.image.load(path).convert_alpha()  # Muat gambar
-
-                # Kelompokkan gambar berdasarkan gerakan
-                for action in self.actions:
-                    # Cocokkan nama file dengan nama gerakan
-                    if re.match(rf"^{action}\s\(\d+\)\.png$", filename):
-                        # Gambar zombie mati dibuat lebih besar
-                        if action == 'Dead':
-                            sprite_resized = resize_with_aspect_ratio(sprite, MAX_WIDTH + 20, MAX_HEIGHT + 20)
-                            self.actions[action].append(sprite_resized)
-                        else:
-                            sprite_resized = resize_with_aspect_ratio(sprite, MAX_WIDTH, MAX_HEIGHT)
-                            self.actions[action].append(sprite_resized)
+        for folder, action, max_size, list_files in Zombie.frame_requests(sprite_folder):
+            key, frames = registry.acquire_frames(folder, action, max_size, list_files)
+            self.sprite_keys.append(key)
+            self.actions[action] = frames
+
+    @classmethod
+    def frame_requests(cls, sprite_folder):
+        """Daftar gambar yang dibutuhkan zombie: (folder, gerakan, ukuran, fungsi daftar file)
 
+        Dipakai load_sprites() dan juga layar loading untuk memuat gambar lebih awal.
+        """
+        return [(sprite_folder, action, cls.sprite_max_size(action),
+                 lambda action=action: cls.list_action_files(sprite_folder, action))
+                for action in cls.ACTIONS]
+
+    @classmethod
+    def sprite_max_size(cls, action):
+        """Ukuran maksimal (lebar, tinggi) gambar untuk satu gerakan
 
+        Dipakai juga oleh bake_assets.py agar ukurannya selalu sama.
+        """
+        # Gambar zombie mati dibuat lebih besar
+        if action == 'Dead':
+            return (MAX_WIDTH + 20, MAX_HEIGHT + 20)
+        return (MAX_WIDTH, MAX_HEIGHT)
+
+    @classmethod
+    def list_action_files(cls, sprite_folder, action):
+        """Mencari file gambar untuk satu gerakan, urut berdasarkan nomor"""
+        # Ambil hanya file gambar yang sesuai pola nama gerakan
+        files = [file for file in registry.list_folder(sprite_folder) if re.match(rf"^{action}\s\(\d+\)\.png$", file)]
+        # Urutkan file berdasarkan nomor
+        return sorted(files, key=cls.extract_number)
+
+    def release_sprites(self):
+        """Mengembalikan gambar yang dipinjam ke gudang bersama"""
+        registry.release_all(self.sprite_keys)
+        self.sprite_keys = []
 
     def get_current_sprite(self):
         """Mengambil sprite untuk aksi saat ini."""
@@ -154,16 +177,26 @@ class Zombie:
         if action_to_use in self.actions and self.actions[action_to_use]:
             # Pastikan frame tidak melebihi jumlah sprite yang tersedia
             frame_index = min(self.current_frame, len(self.actions[action_to_use]) - 1)
-            sprite = self.actions[action_to_use][frame_index]
         else:
             # Jika tidak ada sprite, kembalikan sprite default atau kosong
             return None  # Atau Anda bisa mengembalikan sprite default
 
-        if self.facing_left:
-            return pygame.transform.flip(sprite, True, False)
+        # Setiap frame berisi pasangan (kanan, kiri) yang sudah dibalik saat dimuat
+        return self.actions[action_to_use][frame_index][self.facing_left]
 
-        return sprite
+    def get_current_rect(self):
+        """Mengambil kotak tabrakan zombie (gambar di tengah posisi X)
 
+        Kotak disimpan sampai gerakan, frame, arah hadap, atau posisi berubah,
+        jadi semua pengecekan tabrakan dalam satu langkah memakai kotak yang sama.
+        Jangan diubah langsung (pakai inflate/copy).
+        """
+        cache_key = (self.current_action, self.current_frame, self.facing_left, self.x, self.y)
+        if cache_key != self.rect_cache_key:
+            sprite = self.get_current_sprite()
+            self.rect_cache = sprite.get_rect(topleft=(self.x - sprite.get_width() // 2, self.y))
+            self.rect_cache_key = cache_key
+        return self.rect_cache
 
     def set_action(self, action):
         """Set aksi zombie dan reset frame."""
@@ -193,7 +226,7 @@ class Zombie:
             self.y += 10
             self.set_action('Dead')
             self.alive = False
-            self.death_time = pygame.time.get_ticks()
+            self.death_time = game_clock.get_ticks()
 
             # Panggil callback untuk menambah score (hanya sekali)
             if self.on_death_callback and not self.death_callback_called:
@@ -205,15 +238,43 @@ class Zombie:
     def is_ready_to_remove(self):
         """Cek apakah zombie sudah siap untuk dihapus."""
         if self.death_time is not None:
-            current_time = pygame.time.get_ticks()
+            current_time = game_clock.get_ticks()
             if current_time - self.death_time >= self.death_duration:
                 return True
         return False
 
-    def update_frame(self, road_x, ninja_x, zombies, road_x_downfall=None, block_width=None):
-        """Perbarui frame animasi dan posisi zombie."""
+    def catch_up_sleep(self, first_step, last_step):
+        """Kejar langkah first_step sampai last_step - 1 yang dilewati selama tidur
+
+        Zombie yang tidur (lihat zombie_sleep.py) selalu hidup, belum aktif, dan
+        tidak jatuh, jadi di update_frame ia hanya mengganti frame animasi setiap
+        frame_update_time dan berhenti berjalan. Di sini hanya langkah saat
+        animasinya berganti yang dihitung, jadi setelah bangun zombie sama persis
+        seperti jika tidak pernah tidur.
+        """
+        clock = game_clock.simulation_clock
+        step = first_step
+        while True:
+            # Langkah berikutnya saat update_frame akan mengganti frame animasi
+            step = max(step, clock.first_step_after(self.last_frame_update + self.frame_update_time * 1000))
+            if step >= last_step:
+                return
+            frames = self.actions.get(self.current_action)
+            if frames:
+                if self.current_frame < len(frames) - 1:
+                    self.current_frame += 1
+                else:
+                    self.current_frame = 0
+            self.is_chasing = False
+            if self.current_action == 'Walk' and not self.at_edge:
+                self.set_action('Idle')
+            self.last_frame_update = clock.ticks_at(step)
+            step += 1
+
+    def update_frame(self, road_x, ninja_x, zombies, chasms=None):
+        """Perbarui frame animasi dan posisi zombie (chasms: peta jurang, ChasmMap)."""
         # Hapus sparks setelah aksi attack selesai
-        current_time = pygame.time.get_ticks()  # Ambil waktu saat ini
+        current_time = game_clock.get_ticks()  # Ambil waktu saat ini
         if current_time - self.last_frame_update > self.frame_update_time * 1000:
             if self.alive:
                 # Perbarui frame animasi
@@ -277,11 +338,11 @@ class Zombie:
                     if self.relative_x < ninja_x:
                         # Cek apakah posisi berikutnya aman sebelum bergerak ke kanan
                         next_position = self.relative_x + self.zombie_speed
-                        if road_x_downfall and block_width and self.is_position_safe(next_position, road_x_downfall, block_width):
+                        if chasms and chasms.is_position_safe(next_position):
                             self.facing_left = False
                             self.relative_x += self.zombie_speed
                             self.at_edge = False  # Tidak di ujung jurang
-                        elif road_x_downfall and block_width:
+                        elif chasms:
                             # Zombie berada di ujung jurang
                             self.at_edge = True
                             self.facing_left = False  # Tetap menghadap ninja
@@ -293,7 +354,7 @@ class Zombie:
                                 # Jika ninja sudah melewati, baru boleh balik arah
                                 if (self.direction_change_cooldown <= 0 or self.stuck_counter > 60):
                                     opposite_position = self.relative_x - self.zombie_speed
-                                    if self.is_position_safe(opposite_position, road_x_downfall, block_width):
+                                    if chasms.is_position_safe(opposite_position):
                                         self.facing_left = True
                                         self.relative_x -= self.zombie_speed
                                         self.direction_change_cooldown = self.max_direction_change_cooldown
@@ -310,11 +371,11 @@ class Zombie:
                     elif self.relative_x > ninja_x:
                         # Cek apakah posisi berikutnya aman sebelum bergerak ke kiri
                         next_position = self.relative_x - self.zombie_speed
-                        if road_x_downfall and block_width and self.is_position_safe(next_position, road_x_downfall, block_width):
+                        if chasms and chasms.is_position_safe(next_position):
                             self.facing_left = True
                             self.relative_x -= self.zombie_speed
                             self.at_edge = False  # Tidak di ujung jurang
-                        elif road_x_downfall and block_width:
+                        elif chasms:
                             # Zombie berada di ujung jurang
                             self.at_edge = True
                             self.facing_left = True  # Tetap menghadap ninja
@@ -326,7 +387,7 @@ class Zombie:
                                 # Jika ninja sudah melewati, baru boleh balik arah
                                 if (self.direction_change_cooldown <= 0 or self.stuck_counter > 60):
                                     opposite_position = self.relative_x + self.zombie_speed
-                                    if self.is_position_safe(opposite_position, road_x_downfall, block_width):
+                                    if chasms.is_position_safe(opposite_position):
                                         self.facing_left = False
                                         self.relative_x += self.zombie_speed
                                         self.direction_change_cooldown = self.max_direction_change_cooldown
@@ -411,25 +472,27 @@ class Zombie:
         x2, y2 = point2
         return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
 
-    def is_position_safe(self, position, downfall_list, block_width):
-        """Mengecek apakah posisi aman (tidak di jurang)."""
-        for x in downfall_list:
-            if position >= x and position <= x + block_width:
-                return False
-        return True
+    def save_previous_state(self):
+        """Simpan posisi sebelum langkah simulasi berikutnya (untuk interpolasi)"""
+        self.prev_x = self.x
+
+    def draw(self, alpha=1.0):
+        """Gambar sprite zombie pada posisi tertentu.
 
-    def draw(self):
-        """Gambar sprite zombie pada posisi tertentu."""
+        alpha: posisi gambar di antara langkah sebelumnya (0) dan langkah terakhir (1)
+        """
         sprite = self.get_current_sprite()
         if sprite:  # Pastikan sprite tidak None
             #center
-            self.screen.blit(sprite, (self.x - sprite.get_width() // 2, self.y))
+            x = lerp(self.prev_x, self.x, alpha)
+            self.screen.blit(sprite, (x - sprite.get_width() // 2, self.y))
             # self.screen.blit(sprite, (self.x, self.y))
 
     def reset(self):
         """Reset posisi zombie ke posisi awal."""
         self.relative_x = self.init_pos
         self.x = self.init_pos + self.relative_x
+        self.prev_x = self.x
         self.y = self.zombie_ground
         self.is_downfall = False
         self.is_hit = False
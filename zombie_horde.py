@@ -0,0 +1,474 @@
+# File untuk gerombolan zombie dalam jumlah sangat banyak (NumPy)
+# Zombie biasa (zombie.py) adalah satu objek Python per zombie. Untuk ribuan zombie,
+# memperbarui objek satu per satu terlalu lambat. Di sini setiap sifat zombie
+# (posisi, nyawa, gerakan, ...) disimpan dalam satu array NumPy untuk SEMUA zombie
+# (structure of arrays), lalu aturan Zombie.update_frame dijalankan sekaligus
+# untuk seluruh gerombolan. Objek Python (ZombieView) hanya dibuat untuk zombie
+# yang perlu digambar atau diperiksa tabrakannya dengan ninja.
+#
+# Aturannya harus sama dengan zombie.py. Jika aturan di zombie.py diubah,
+# ubah juga di sini.
+
+import numpy  # Library untuk hitungan array
+from asset_registry import registry  # Gudang gambar bersama
+import game_clock  # Waktu simulasi (ikut langkah logika game)
+from game_clock import lerp  # Menggambar di antara dua langkah simulasi
+from zombie import Zombie  # Daftar gerakan dan gambar zombie
+
+# Nomor setiap gerakan (urutan sama dengan Zombie.ACTIONS)
+ATTACK, DEAD, IDLE, WALK = (Zombie.ACTIONS.index(action) for action in ('Attack', 'Dead', 'Idle', 'Walk'))
+
+class ZombieView:
+    """Kelas ZombieView - "Jendela" ke satu zombie di dalam ZombieHorde
+
+    Punya fungsi yang sama dengan Zombie (get_x, damage, draw, ...), jadi
+    kode tabrakan di gameplay.py bisa memakainya seperti zombie biasa.
+    Isinya dibaca dan ditulis langsung ke array gerombolan.
+    Hanya berlaku sampai zombie mati dihapus (remove_dead), jadi jangan disimpan lama.
+    """
+    __slots__ = ('horde', 'index')
+
+    def __init__(self, horde, index):
+        """Membuat jendela ke zombie nomor index"""
+        self.horde = horde  # Gerombolan pemilik zombie ini
+        self.index = index  # Nomor zombie di dalam array
+
+    @property
+    def relative_x(self):
+        return float(self.horde.relative_x[self.index])
+
+    @property
+    def x(self):
+        return float(self.horde.x[self.index])
+
+    @property
+    def y(self):
+        return float(self.horde.y[self.index])
+
+    @property
+    def health(self):
+        return int(self.horde.health[self.index])
+
+    @property
+    def alive(self):
+        return bool(self.horde.alive[self.index])
+
+    @property
+    def is_downfall(self):
+        return bool(self.horde.is_downfall[self.index])
+
+    @property
+    def facing_left(self):
+        return bool(self.horde.facing_left[self.index])
+
+    @property
+    def current_action(self):
+        return Zombie.ACTIONS[self.horde.action[self.index]]
+
+    @property
+    def current_frame(self):
+        return int(self.horde.frame[self.index])
+
+    @property
+    def actions(self):
+        """Semua frame animasi untuk jenis zombie ini: {'Walk': [...], ...}"""
+        return self.horde.type_frames[self.horde.type_id[self.index]]
+
+    def get_relative_x(self):
+        """Mengambil posisi relatif zombie"""
+        return self.relative_x
+
+    def get_x(self):
+        """Mengambil posisi X zombie (kiri-kanan)"""
+        return self.x
+
+    def get_y(self):
+        """Mengambil posisi Y zombie (atas-bawah)"""
+        return self.y
+
+    def get_alive(self):
+        """Cek apakah zombie masih hidup"""
+        return self.alive
+
+    def get_current_sprite(self):
+        """Gambar zombie untuk gerakan dan frame saat ini"""
+        frames = self.actions[self.current_action]
+        if not frames:
+            return None
+        return frames[min(self.current_frame, len(frames) - 1)][self.facing_left]
+
+    def get_current_rect(self):
+        """Kotak tabrakan zombie (sama seperti Zombie.get_current_rect)"""
+        sprite = self.get_current_sprite()
+        return sprite.get_rect(topleft=(self.x - sprite.get_width() // 2, self.y))
+
+    def set_action(self, action):
+        """Set aksi zombie dan reset frame."""
+        self.horde.set_action(self.index, Zombie.ACTIONS.index(action))
+
+    def set_downfall(self):
+        """Membuat zombie jatuh ke jurang"""
+        self.horde.is_downfall[self.index] = True
+
+    def damage(self, damage_type='Normal'):
+        """Metode untuk menandai zombie diserang."""
+        self.horde.damage(self.index, damage_type)
+
+    def draw(self, alpha=1.0):
+        """Gambar zombie (sama seperti Zombie.draw)"""
+        sprite = self.get_current_sprite()
+        if sprite:
+            x = lerp(float(self.horde.prev_x[self.index]), self.x, alpha)
+            self.horde.screen.blit(sprite, (x - sprite.get_width() // 2, self.y))
+
+class ZombieHorde:
+    """Kelas ZombieHorde - Seluruh gerombolan zombie sebagai array NumPy
+
+    Setiap array punya satu isi per zombie, contoh: relative_x[5] adalah
+    posisi zombie nomor 5 dan health[5] adalah nyawanya.
+    """
+    FIELDS = ('type_id', 'init_pos', 'relative_x', 'x', 'prev_x', 'y', 'health', 'action', 'frame',
+              'facing_left', 'alive', 'is_downfall', 'is_activated', 'is_chasing', 'at_edge',
+              'ninja_passed', 'last_frame_update', 'death_time', 'death_callback_called',
+              'direction_change_cooldown', 'stuck_counter', 'last_position', 'last_ninja_x')  # Semua array
+
+    def __init__(self, screen, zombie_ground, zombie_speed, on_death_callback=None):
+        """Membuat gerombolan kosong
+
+        Parameter sama dengan Zombie: layar, tinggi tanah, kecepatan, dan
+        fungsi yang dipanggil setiap kali satu zombie mati.
+        """
+        self.screen = screen
+        self.zombie_ground = zombie_ground
+        self.zombie_speed = zombie_speed
+        self.on_death_callback = on_death_callback
+
+        # Aturan yang sama dengan Zombie
+        self.frame_update_ms = 100  # Animasi berubah setiap 0.1 detik
+        self.death_duration = 5000  # Zombie mati hilang setelah 5 detik
+        self.chase_distance = 300  # Jarak untuk aktivasi awal zombie
+        self.max_direction_change_cooldown = 30  # Waktu tunggu sebelum balik arah
+
+        # Gambar per jenis zombie (folder): dipinjam sekali untuk semua zombie sejenis
+        self.type_folders = []   # Nomor jenis -> folder gambar
+        self.type_frames = []    # Nomor jenis -> {'Walk': [(kanan, kiri), ...], ...}
+        self.sprite_keys = []    # Kunci gambar yang dipinjam dari gudang bersama
+        self.frame_counts = numpy.zeros((0, len(Zombie.ACTIONS)), dtype=numpy.int64)  # [jenis, gerakan] -> jumlah frame
+        self.sprite_sizes = numpy.zeros((0, len(Zombie.ACTIONS), 1, 2), dtype=numpy.int64)  # [jenis, gerakan, frame] -> (lebar, tinggi)
+
+        self.pending = []  # Zombie baru (jenis, posisi) yang belum masuk array
+        self.set_arrays(ZombieHorde.empty_arrays(0))
+
+    @staticmethod
+    def empty_arrays(count):
+        """Array kosong untuk count zombie: {'relative_x': array, ...}"""
+        return {
+            'type_id': numpy.zeros(count, dtype=numpy.int64),     # Nomor jenis (folder gambar)
+            'init_pos': numpy.zeros(count),                       # Posisi awal
+            'relative_x': numpy.zeros(count),                     # Posisi di jalan
+            'x': numpy.zeros(count),                              # Posisi di layar
+            'prev_x': numpy.zeros(count),                         # Posisi layar langkah sebelumnya
+            'y': numpy.zeros(count),                              # Posisi atas-bawah
+            'health': numpy.zeros(count, dtype=numpy.int64),      # Nyawa
+            'action': numpy.zeros(count, dtype=numpy.int64),      # Nomor gerakan (ATTACK, DEAD, IDLE, WALK)
+            'frame': numpy.zeros(count, dtype=numpy.int64),       # Frame animasi
+            'facing_left': numpy.zeros(count, dtype=bool),
+            'alive': numpy.zeros(count, dtype=bool),
+            'is_downfall': numpy.zeros(count, dtype=bool),
+            'is_activated': numpy.zeros(count, dtype=bool),
+            'is_chasing': numpy.zeros(count, dtype=bool),
+            'at_edge': numpy.zeros(count, dtype=bool),
+            'ninja_passed': numpy.zeros(count, dtype=bool),
+            'last_frame_update': numpy.zeros(count, dtype=numpy.int64),
+            'death_time': numpy.full(count, -1, dtype=numpy.int64),  # -1 = belum mati
+            'death_callback_called': numpy.zeros(count, dtype=bool),
+            'direction_change_cooldown': numpy.zeros(count, dtype=numpy.int64),
+            'stuck_counter': numpy.zeros(count, dtype=numpy.int64),
+            'last_position': numpy.zeros(count),
+            'last_ninja_x': numpy.full(count, numpy.nan),         # NaN = belum pernah melihat ninja
+        }
+
+    def set_arrays(self, arrays):
+        """Ganti semua array sekaligus"""
+        for field in ZombieHorde.FIELDS:
+            setattr(self, field, arrays[field])
+
+    def __len__(self):
+        """Jumlah zombie di gerombolan (termasuk yang baru ditambahkan)"""
+        return len(self.relative_x) + len(self.pending)
+
+    def add_type(self, sprite_folder):
+        """Nomor jenis untuk sebuah folder gambar (gambar dipinjam saat pertama kali dipakai)"""
+        if sprite_folder in self.type_folders:
+            return self.type_folders.index(sprite_folder)
+        actions = {}
+        for folder, action, max_size, list_files in Zombie.frame_requests(sprite_folder):
+            key, frames = registry.acquire_frames(folder, action, max_size, list_files)
+            self.sprite_keys.append(key)
+            actions[action] = frames
+        self.type_folders.append(sprite_folder)
+        self.type_frames.append(actions)
+
+        # Tabel jumlah frame dan ukuran gambar, agar bisa dibaca sekaligus oleh NumPy
+        max_frames = max(1, max(len(frames) for type_actions in self.type_frames for frames in type_actions.values()))
+        self.frame_counts = numpy.zeros((len(self.type_frames), len(Zombie.ACTIONS)), dtype=numpy.int64)
+        self.sprite_sizes = numpy.zeros((len(self.type_frames), len(Zombie.ACTIONS), max_frames, 2), dtype=numpy.int64)
+        for type_index, type_actions in enumerate(self.type_frames):
+            for action_index, action in enumerate(Zombie.ACTIONS):
+                frames = type_actions[action]
+                self.frame_counts[type_index, action_index] = len(frames)
+                for frame_index, (sprite, _) in enumerate(frames):
+                    self.sprite_sizes[type_index, action_index, frame_index] = sprite.get_size()
+        return len(self.type_folders) - 1
+
+    def spawn(self, sprite_folder, init_pos):
+        """Tambahkan satu zombie baru (masuk ke array saat flush() atau update berikutnya)"""
+        self.pending.append((self.add_type(sprite_folder), init_pos))
+
+    def flush(self):
+        """Masukkan semua zombie baru ke array sekaligus"""
+        if not self.pending:
+            return
+        types, positions = zip(*self.pending)
+        self.pending = []
+        new = ZombieHorde.empty_arrays(len(positions))
+        new['type_id'][:] = types
+        new['init_pos'][:] = positions
+        new['relative_x'][:] = positions
+        new['x'][:] = new['init_pos'] + new['relative_x']  # Sama seperti Zombie.__init__
+        new['prev_x'][:] = new['x']
+        new['y'][:] = self.zombie_ground
+        new['health'][:] = 100
+        new['action'][:] = WALK
+        new['facing_left'][:] = True
+        new['alive'][:] = True
+        new['last_frame_update'][:] = game_clock.get_ticks()
+        new['last_position'][:] = positions
+        self.set_arrays({field: numpy.concatenate((getattr(self, field), new[field])) for field in ZombieHorde.FIELDS})
+
+    def release(self):
+        """Hapus semua zombie dan kembalikan gambarnya ke gudang"""
+        registry.release_all(self.sprite_keys)
+        self.sprite_keys = []
+        self.pending = []
+        self.set_arrays(ZombieHorde.empty_arrays(0))
+
+    def set_action(self, where, action):
+        """Ganti gerakan (dan mulai dari frame 0) untuk zombie yang dipilih (nomor atau mask)"""
+        self.action[where] = action
+        self.frame[where] = 0
+
+    def set_dead(self, where):
+        """Sama seperti Zombie.set_dead untuk semua zombie yang dipilih (mask atau array nomor)"""
+        if where.dtype == bool:
+            where = numpy.flatnonzero(where)  # Mask -> nomor zombie
+        now = game_clock.get_ticks()
+        living = self.alive[where]
+        dying = where[living]
+        self.y[dying] += 10
+        self.set_action(dying, DEAD)
+        self.alive[dying] = False
+        self.death_time[dying] = now
+        self.y[where[~living]] -= 10
+
+        rewarded = dying[~self.death_callback_called[dying]]
+        self.death_callback_called[rewarded] = True
+        if self.on_death_callback:
+            for _ in range(len(rewarded)):
+                self.on_death_callback()
+
+    def damage(self, index, damage_type='Normal'):
+        """Sama seperti Zombie.damage untuk satu zombie"""
+        self.health[index] -= 5
+        if damage_type in ('Double', 'Kunai'):
+            self.health[index] -= 5
+        if self.health[index] <= 0:
+            self.set_action(index, DEAD)
+            self.set_dead(numpy.array([index]))  # Hanya satu nomor, bukan mask sepanjang gerombolan
+
+    def unsafe_positions(self, positions, chasms):
+        """Mask posisi yang berada di atas jurang (sama seperti ChasmMap.is_position_safe, dibalik)"""
+        if not chasms:
+            return numpy.zeros(len(positions), dtype=bool)
+        starts = numpy.asarray(chasms.starts, dtype=numpy.float64)
+        ends = numpy.asarray(chasms.ends, dtype=numpy.float64)
+        nearest = numpy.searchsorted(starts, positions, side='right') - 1  # Rentang terakhir di kiri posisi
+        found = nearest >= 0
+        return found & (positions <= ends[numpy.maximum(nearest, 0)])
+
+    def update_frame(self, road_x, ninja_x, chasms):
+        """Sama seperti Zombie.update_frame, tapi untuk semua zombie sekaligus
+
+        Setiap langkah di bawah ini adalah satu bagian dari Zombie.update_frame,
+        dengan urutan yang sama. "mask" adalah array True/False yang memilih
+        zombie mana yang terkena aturan itu.
+        """
+        self.flush()
+        now = game_clock.get_ticks()
+        due = now - self.last_frame_update > self.frame_update_ms  # Zombie yang waktunya diperbarui
+        was_alive = self.alive.copy()
+        live = due & was_alive
+
+        # 1. Animasi: maju satu frame, atau kembali ke awal
+        counts = self.frame_counts[self.type_id, self.action]
+        advance = live & (self.frame < counts - 1)
+        self.frame[advance] += 1
+        wrap = live & ~advance
+        self.frame[wrap] = 0
+        self.set_action(wrap & (self.action == ATTACK) & self.at_edge, WALK)  # Selesai menyerang di ujung jurang
+
+        # 2. Aktivasi saat ninja mendekat pertama kali
+        distance_to_ninja = numpy.abs(self.relative_x - ninja_x)
+        newly = live & (distance_to_ninja <= self.chase_distance) & ~self.is_activated
+        self.is_activated |= newly
+        self.is_chasing |= newly
+        self.set_action(newly & (self.action == IDLE), WALK)
+
+        # 3. Zombie aktif terus mengejar, zombie belum aktif diam
+        active = live & self.is_activated
+        self.is_chasing[active] = True
+        self.set_action(active & (self.action == IDLE), WALK)
+        inactive = live & ~self.is_activated
+        self.is_chasing[inactive] = False
+        self.set_action(inactive & (self.action == WALK) & ~self.at_edge, IDLE)
+
+        # 4. Mengejar ninja, berhenti dan menyerang di ujung jurang
+        moving = live & (self.action == WALK) & ~self.is_downfall & self.is_chasing
+        falling = live & self.is_downfall & ((self.action == WALK) | (self.action == IDLE))
+        self.direction_change_cooldown[moving & (self.direction_change_cooldown > 0)] -= 1
+        stuck = moving & (numpy.abs(self.relative_x - self.last_position) < 1)
+        self.stuck_counter[stuck] += 1
+        unstuck = moving & ~stuck
+        self.stuck_counter[unstuck] = 0
+        self.last_position[unstuck] = self.relative_x[unstuck]
+
+        crossed = moving & (((self.last_ninja_x < self.relative_x) & (ninja_x > self.relative_x)) |
+                            ((self.last_ninja_x > self.relative_x) & (ninja_x < self.relative_x)))
+        self.ninja_passed[crossed] = True
+        self.at_edge[crossed] = False
+        self.last_ninja_x[moving] = ninja_x
+
+        go_right = moving & (self.relative_x < ninja_x)
+        go_left = moving & (self.relative_x > ninja_x)
+        for direction, mask in ((1, go_right), (-1, go_left)):
+            step = direction * self.zombie_speed
+            blocked = mask & self.unsafe_positions(self.relative_x + step, chasms)
+            walk = mask & ~blocked
+            self.facing_left[walk] = direction < 0
+            self.relative_x[walk] += step
+            self.at_edge[walk] = False
+
+            # Di ujung jurang: hadap ninja, serang jika ninja belum lewat
+            self.at_edge[blocked] = True
+            self.facing_left[blocked] = direction < 0
+            self.set_action(blocked & ~self.ninja_passed, ATTACK)
+
+            # Ninja sudah lewat: balik arah jika boleh
+            turn = blocked & self.ninja_passed & ((self.direction_change_cooldown <= 0) | (self.stuck_counter > 60))
+            turn_blocked = turn & self.unsafe_positions(self.relative_x - step, chasms)
+            turn_back = turn & ~turn_blocked
+            self.facing_left[turn_back] = direction > 0
+            self.relative_x[turn_back] -= step
+            self.direction_change_cooldown[turn_back] = self.max_direction_change_cooldown
+            self.stuck_counter[turn_back] = 0
+            self.ninja_passed[turn_back] = False
+            self.at_edge[turn_back] = False
+            self.set_action(turn_blocked, IDLE)
+
+        # 5. Jatuh ke jurang
+        self.facing_left[falling & (self.relative_x < ninja_x)] = False
+        self.facing_left[falling & (self.relative_x > ninja_x)] = True
+        in_screen = falling & (self.y < self.screen.get_height())
+        self.y[in_screen] += 3
+        self.set_dead(falling & ~in_screen & (self.action != DEAD))
+
+        self.last_frame_update[live] = now
+
+        # 6. Zombie mati: lanjutkan animasi mati sampai frame terakhir
+        dead = due & ~was_alive
+        self.set_action(dead & (self.action != DEAD), DEAD)
+        dead_counts = self.frame_counts[self.type_id, DEAD]
+        self.frame[dead & (self.action == DEAD) & (self.frame < dead_counts - 1)] += 1
+
+        # Posisi layar zombie berdasarkan jalan
+        self.x = road_x + self.relative_x
+
+    def set_downfall_over(self, chasms):
+        """Zombie di atas jurang mana pun mulai jatuh (seperti downfall_action)"""
+        over = self.unsafe_positions(self.relative_x, chasms) & ~self.is_downfall
+        self.set_action(over, IDLE)
+        self.is_downfall[over] = True
+
+    def current_rects(self):
+        """Kotak tabrakan (kiri, atas, lebar, tinggi) semua zombie, seperti get_current_sprite().get_rect()"""
+        frames = numpy.minimum(self.frame, numpy.maximum(self.frame_counts[self.type_id, self.action] - 1, 0))
+        sizes = self.sprite_sizes[self.type_id, self.action, frames]
+        width, height = sizes[:, 0], sizes[:, 1]
+        left = (self.x - width // 2).astype(numpy.int64)
+        top = self.y.astype(numpy.int64)
+        return left, top, width, height
+
+    def reset_attacking_out_of_range(self, ninja_rect, attack_buffer=20):
+        """Zombie yang menyerang tapi tidak lagi menyentuh ninja kembali berjalan"""
+        attacking = (self.action == ATTACK) & self.alive
+        if not attacking.any():
+            return
+        left, top, width, height = self.current_rects()
+        half = attack_buffer // 2  # Rect.inflate: membesar ke semua arah
+        touching = ((left - half < ninja_rect.right) & (left - half + width + attack_buffer > ninja_rect.left) &
+                    (top - half < ninja_rect.bottom) & (top - half + height + attack_buffer > ninja_rect.top))
+        self.set_action(attacking & ~touching, WALK)
+
+    def remove_dead(self):
+        """Hapus zombie yang sudah mati lebih dari death_duration (seperti remove_dead_zombies)"""
+        now = game_clock.get_ticks()
+        keep = self.alive | (self.death_time < 0) | (now - self.death_time < self.death_duration)
+        if keep.all():
+            return
+        self.set_arrays({field: getattr(self, field)[keep] for field in ZombieHorde.FIELDS})
+
+    def in_range(self, left, right):
+        """ZombieView untuk semua zombie dengan left <= relative_x <= right"""
+        indices = numpy.flatnonzero((self.relative_x >= left) & (self.relative_x <= right))
+        return [ZombieView(self, int(index)) for index in indices]
+
+    def draw_range(self, left, right, alpha=1.0):
+        """Gambar semua zombie dengan left <= relative_x <= right (sama seperti ZombieView.draw)
+
+        Posisi dihitung sekaligus dengan array, lalu semua gambar ditempel
+        dengan satu panggilan screen.blits, bukan satu ZombieView per zombie.
+        """
+        indices = numpy.flatnonzero((self.relative_x >= left) & (self.relative_x <= right))
+        if not len(indices):
+            return
+        previous = self.prev_x[indices]
+        xs = (previous + (self.x[indices] - previous) * alpha).tolist()  # Sama seperti lerp
+        sprites = []
+        for x, y, type_id, action, frame, facing_left in zip(
+                xs, self.y[indices].tolist(), self.type_id[indices].tolist(), self.action[indices].tolist(),
+                self.frame[indices].tolist(), self.facing_left[indices].tolist()):
+            frames = self.type_frames[type_id][Zombie.ACTIONS[action]]
+            if frames:
+                sprite = frames[min(frame, len(frames) - 1)][facing_left]
+                sprites.append((sprite, (x - sprite.get_width() // 2, y)))
+        self.screen.blits(sprites, doreturn=False)
+
+    def nearest(self, x, y):
+        """ZombieView zombie terdekat dari titik layar (x, y), atau None jika kosong"""
+        if not len(self.x):
+            return None
+        distance = (self.x - x) ** 2 + (self.y - y) ** 2  # Kuadrat jarak, tidak perlu sqrt
+        return ZombieView(self, int(numpy.argmin(distance)))
+
+    def alive_count(self):
+        """Jumlah zombie yang masih hidup"""
+        return int(numpy.count_nonzero(self.alive)) + len(self.pending)
+
+    def save_previous_state(self):
+        """Simpan posisi semua zombie sebelum langkah simulasi (untuk interpolasi)"""
+        self.prev_x = self.x.copy()
+
+    def state_bytes(self):
+        """Isi array yang menentukan keadaan gerombolan (untuk sidik jari replay)"""
+        return b''.join(getattr(self, field).tobytes() for field in
+                        ('relative_x', 'y', 'health', 'action', 'frame', 'alive', 'is_downfall'))
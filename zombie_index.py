@@ -0,0 +1,64 @@
+# File untuk indeks zombie di sepanjang jalan (spatial index 1 dimensi)
+# Jalan game hanya punya satu arah (kiri-kanan), jadi zombie cukup diurutkan
+# berdasarkan posisinya (relative_x). Dengan daftar yang urut, pertanyaan seperti
+# "zombie mana saja di antara X=500 dan X=900?" atau "zombie mana yang paling
+# dekat?" bisa dijawab dengan pencarian biner (bisect), tanpa memeriksa semua zombie.
+
+import bisect  # Library untuk mencari di daftar yang sudah urut
+
+class ZombieIndex:
+    """Kelas ZombieIndex - Daftar zombie yang selalu urut dari kiri ke kanan
+
+    Seperti buku telepon yang urut abjad: untuk mencari nama "Budi" kita
+    langsung membuka bagian B, tidak membaca dari halaman pertama.
+    Semua posisi di sini adalah relative_x (posisi zombie di jalan).
+    """
+    def __init__(self):
+        """Membuat indeks kosong"""
+        self.zombies = []    # Zombie, urut berdasarkan relative_x
+        self.positions = []  # relative_x setiap zombie (urutannya sama dengan zombies)
+
+    def rebuild(self, zombies):
+        """Urutkan daftar zombie (di tempat) lalu catat posisinya
+
+        Dipanggil setelah zombie bergerak. Zombie hanya bergeser beberapa pixel
+        per langkah, jadi daftarnya hampir urut dan sort() Python (Timsort)
+        hanya perlu sedikit pekerjaan untuk membetulkannya.
+        """
+        zombies.sort(key=lambda zombie: zombie.relative_x)
+        self.zombies = zombies
+        self.positions = [zombie.relative_x for zombie in zombies]
+
+    def in_range(self, left, right):
+        """Semua zombie dengan left <= relative_x <= right (urut dari kiri ke kanan)"""
+        start = bisect.bisect_left(self.positions, left)
+        end = bisect.bisect_right(self.positions, right)
+        return self.zombies[start:end]
+
+    def nearest(self, x, y):
+        """Nomor (index) zombie yang paling dekat dengan titik (x, y), atau -1 jika kosong
+
+        Mulai dari posisi x di daftar, lalu melebar ke kiri dan ke kanan.
+        Berhenti saat jarak kiri-kanan saja sudah lebih jauh dari zombie
+        terdekat yang sudah ditemukan (zombie berikutnya pasti lebih jauh).
+        Jarak dibandingkan dalam bentuk kuadrat, jadi tidak perlu akar (sqrt).
+        """
+        best_index = -1
+        best_distance = float('inf')  # Jarak terdekat (kuadrat)
+        right = bisect.bisect_left(self.positions, x)
+        left = right - 1
+        while left >= 0 or right < len(self.positions):
+            # Pilih sisi yang posisinya lebih dekat dengan x
+            if right >= len(self.positions) or (left >= 0 and x - self.positions[left] <= self.positions[right] - x):
+                index, left = left, left - 1
+            else:
+                index, right = right, right + 1
+            dx = self.positions[index] - x
+            if dx * dx > best_distance:
+                break  # Semua zombie yang tersisa lebih jauh lagi
+            dy = self.zombies[index].y - y
+            distance = dx * dx + dy * dy
+            if distance < best_distance or (distance == best_distance and index < best_index):
+                best_distance = distance
+                best_index = index
+        return best_index
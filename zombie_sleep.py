@@ -0,0 +1,78 @@
+# File untuk menidurkan zombie yang jauh dari layar (level of detail simulasi)
+# Zombie yang belum pernah aktif dan berada jauh di luar layar tidak perlu
+# diperbarui setiap langkah: ia hanya diam di tempat. Zombie seperti ini
+# "ditidurkan" dan disimpan urut berdasarkan posisinya, lalu dibangunkan
+# saat jendela di sekitar kamera (layar + margin) sampai ke tempatnya.
+
+import bisect  # Library untuk mencari di daftar yang sudah urut
+
+class SleepingZombies:
+    """Kelas SleepingZombies - Tempat tidur zombie yang jauh dari layar
+
+    Zombie disimpan urut berdasarkan relative_x (posisi di jalan), jadi
+    mencari zombie yang harus bangun cukup dengan pencarian biner (bisect),
+    tanpa memeriksa zombie satu per satu. Zombie yang tidur tidak memakan
+    waktu sama sekali setiap langkah.
+    """
+    def __init__(self, margin):
+        """Membuat tempat tidur kosong
+
+        margin: Jarak (pixel) di kiri dan kanan layar tempat zombie tetap bangun.
+        Harus lebih besar dari chase_distance zombie, agar zombie sudah bangun
+        sebelum ninja cukup dekat untuk mengaktifkannya.
+        """
+        self.margin = margin  # Lebar tambahan jendela di kiri dan kanan layar
+        self.positions = []   # relative_x setiap zombie yang tidur (urut dari kecil ke besar)
+        self.zombies = []     # Zombie yang tidur (urutannya sama dengan positions)
+        self.since = []       # Langkah simulasi saat setiap zombie mulai tidur (atau terakhir dikejar)
+
+    def __len__(self):
+        """Jumlah zombie yang sedang tidur"""
+        return len(self.zombies)
+
+    def can_sleep(self, zombie, left, right):
+        """Apakah zombie boleh tidur? (hidup, belum pernah aktif, tidak jatuh, dan di luar jendela)
+
+        Zombie yang sudah aktif terus mengejar ninja, jadi tidak pernah ditidurkan.
+        """
+        return (zombie.alive and not zombie.is_activated and not zombie.is_downfall and
+                not left - self.margin <= zombie.relative_x <= right + self.margin)
+
+    def park(self, zombie, step):
+        """Tidurkan satu zombie mulai langkah simulasi step (disisipkan agar tetap urut)"""
+        index = bisect.bisect_right(self.positions, zombie.relative_x)
+        self.positions.insert(index, zombie.relative_x)
+        self.zombies.insert(index, zombie)
+        self.since.insert(index, step)
+
+    def wake(self, left, right, step):
+        """Bangunkan semua zombie di dalam jendela [left - margin, right + margin]
+
+        left dan right adalah tepi kamera di jalan, step adalah langkah simulasi
+        sekarang. Animasi yang terlewat selama tidur dikejar dulu, jadi zombie
+        bangun seperti tidak pernah tidur. Return daftar zombie yang bangun,
+        urut menurut spawn_order.
+        """
+        start = bisect.bisect_left(self.positions, left - self.margin)
+        end = bisect.bisect_right(self.positions, right + self.margin)
+        woken = self.zombies[start:end]
+        for zombie, since in zip(woken, self.since[start:end]):
+            zombie.catch_up_sleep(since, step)
+        del self.positions[start:end]
+        del self.zombies[start:end]
+        del self.since[start:end]
+        return sorted(woken, key=lambda zombie: zombie.spawn_order)
+
+    def catch_up(self, step):
+        """Kejar animasi semua zombie yang tidur sampai langkah step (misalnya untuk state_hash)"""
+        for zombie, since in zip(self.zombies, self.since):
+            zombie.catch_up_sleep(since, step)
+        self.since = [step] * len(self.zombies)
+
+    def clear(self):
+        """Bangunkan semua zombie sekaligus (misalnya saat reset). Return daftar zombie tersebut."""
+        zombies = self.zombies
+        self.positions = []
+        self.zombies = []
+        self.since = []
+        return zombies